@@ -0,0 +1,73 @@
+"""Standings: bxh_doibong table maintained incrementally from match results
+
+Revision ID: 5b7e2f1c9a10
+Revises: aaa7cdd7f87a
+Create Date: 2026-01-05
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e2f1c9a10'
+down_revision = 'aaa7cdd7f87a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("bxh_doibong"):
+        # Same layout as BXH_DoiBong in database/init_db.sql + form/timestamp columns
+        op.create_table(
+            "bxh_doibong",
+            sa.Column("muagiai", sa.String(length=50), nullable=False),
+            sa.Column("maclb", sa.String(length=50), nullable=False),
+            sa.Column("sotran", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thang", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("hoa", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thua", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("banthang", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("banthua", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("diem", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thuhang", sa.Integer(), nullable=True),
+            sa.Column("phongdo", sa.String(length=5), nullable=True),
+            sa.Column("capnhatluc", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+            sa.PrimaryKeyConstraint("muagiai", "maclb", name="pk_bxh_doibong"),
+
+            sa.ForeignKeyConstraint(
+                ["muagiai"],
+                ["muagiai.muagiai"],
+                name="fk_bxh_doibong_muagiai",
+                ondelete="CASCADE",
+            ),
+            sa.ForeignKeyConstraint(
+                ["maclb", "muagiai"],
+                ["caulacbo.maclb", "caulacbo.muagiai"],
+                name="fk_bxh_doibong_club",
+                ondelete="CASCADE",
+            ),
+        )
+    else:
+        # Table created by database/init_db.sql: only add the new columns
+        columns = {c["name"] for c in inspector.get_columns("bxh_doibong")}
+        if "phongdo" not in columns:
+            op.add_column("bxh_doibong", sa.Column("phongdo", sa.String(length=5), nullable=True))
+        if "capnhatluc" not in columns:
+            op.add_column(
+                "bxh_doibong",
+                sa.Column("capnhatluc", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            )
+
+    # Rows are rebuilt lazily by crud.compute_standings() (or app/rebuild_standings.py)
+    op.execute("DELETE FROM bxh_doibong")
+
+
+def downgrade() -> None:
+    # Keep the table itself: it is part of database/init_db.sql
+    op.drop_column("bxh_doibong", "capnhatluc")
+    op.drop_column("bxh_doibong", "phongdo")
@@ -0,0 +1,121 @@
+"""Player stats: thongkecauthu per (season, player), maintained from match events
+
+Revision ID: 7c41d0e8b2f3
+Revises: 5b7e2f1c9a10
+Create Date: 2026-01-08
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c41d0e8b2f3'
+down_revision = '5b7e2f1c9a10'
+branch_labels = None
+depends_on = None
+
+# Player stats triggers of database/init_db.sql
+TRIGGERS = {
+    "sukientrandau": ("thkc_t_su_kien_ins", "thkc_t_su_kien_upd", "thkc_t_su_kien_del"),
+    "doihinhxuatphat": ("thkc_t_doi_hinh_ins", "thkc_t_doi_hinh_upd", "thkc_t_doi_hinh_del"),
+}
+FUNCTIONS = (
+    "trg_su_kien_recompute()",
+    "trg_doi_hinh_recompute()",
+    "recompute_all_players()",
+    "recompute_thongkecauthu(text)",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("thongkecauthu"):
+        op.create_table(
+            "thongkecauthu",
+            sa.Column("muagiai", sa.String(length=50), nullable=False),
+            sa.Column("macauthu", sa.String(length=50), nullable=False),
+            sa.Column("maclb", sa.String(length=50), nullable=True),
+            sa.Column("sotrandachoi", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("banthang", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("kientao", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thevang", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thevangthu2", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("thedo", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("capnhatluc", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+
+            sa.PrimaryKeyConstraint("muagiai", "macauthu", name="pk_thongkecauthu"),
+
+            sa.ForeignKeyConstraint(
+                ["muagiai"],
+                ["muagiai.muagiai"],
+                name="fk_thongkecauthu_muagiai",
+                ondelete="CASCADE",
+            ),
+            sa.ForeignKeyConstraint(
+                ["macauthu"],
+                ["cauthu.macauthu"],
+                name="fk_thongkecauthu_cauthu",
+                ondelete="CASCADE",
+            ),
+        )
+    else:
+        # Table created by database/init_db.sql: one row per player (no season).
+        # Its triggers recompute rows keyed on macauthu alone, which the new
+        # key rejects; crud maintains the table from now on -> drop them.
+        for table, triggers in TRIGGERS.items():
+            for trigger in triggers:
+                op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+        for function in FUNCTIONS:
+            op.execute(f"DROP FUNCTION IF EXISTS {function}")
+
+        # Rows are derived data -> clear them, add season/club columns, re-key.
+        op.execute("DELETE FROM thongkecauthu")
+
+        columns = {c["name"] for c in inspector.get_columns("thongkecauthu")}
+        if "muagiai" not in columns:
+            op.add_column("thongkecauthu", sa.Column("muagiai", sa.String(length=50), nullable=False))
+            op.create_foreign_key(
+                "fk_thongkecauthu_muagiai",
+                "thongkecauthu",
+                "muagiai",
+                ["muagiai"],
+                ["muagiai"],
+                ondelete="CASCADE",
+            )
+        if "maclb" not in columns:
+            op.add_column("thongkecauthu", sa.Column("maclb", sa.String(length=50), nullable=True))
+        if "capnhatluc" not in columns:
+            op.add_column(
+                "thongkecauthu",
+                sa.Column("capnhatluc", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            )
+        for name in ("sotrandachoi", "banthang", "kientao", "thevang", "thevangthu2", "thedo"):
+            op.alter_column("thongkecauthu", name, nullable=False, server_default="0")
+
+        pk = inspector.get_pk_constraint("thongkecauthu")
+        if pk.get("name"):
+            op.drop_constraint(pk["name"], "thongkecauthu", type_="primary")
+        op.create_primary_key("pk_thongkecauthu", "thongkecauthu", ["muagiai", "macauthu"])
+
+    op.create_index(
+        "ix_thongkecauthu_muagiai_banthang", "thongkecauthu", ["muagiai", "banthang"]
+    )
+    op.create_index(
+        "ix_thongkecauthu_muagiai_kientao", "thongkecauthu", ["muagiai", "kientao"]
+    )
+
+
+def downgrade() -> None:
+    # Keep the table itself: it is part of database/init_db.sql. Its
+    # triggers are not recreated (re-run that section of init_db.sql).
+    op.drop_index("ix_thongkecauthu_muagiai_kientao", table_name="thongkecauthu")
+    op.drop_index("ix_thongkecauthu_muagiai_banthang", table_name="thongkecauthu")
+    op.execute("DELETE FROM thongkecauthu")
+    op.drop_constraint("pk_thongkecauthu", "thongkecauthu", type_="primary")
+    op.drop_column("thongkecauthu", "capnhatluc")
+    op.drop_column("thongkecauthu", "maclb")
+    op.drop_column("thongkecauthu", "muagiai")
+    op.create_primary_key("thongkecauthu_pkey", "thongkecauthu", ["macauthu"])
@@ -0,0 +1,32 @@
+"""Player stats: MVP award counter in thongkecauthu
+
+Revision ID: a3d9e6f41c27
+Revises: 7c41d0e8b2f3
+Create Date: 2026-01-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d9e6f41c27'
+down_revision = '7c41d0e8b2f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "thongkecauthu",
+        sa.Column("mvp", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_thongkecauthu_muagiai_mvp", "thongkecauthu", ["muagiai", "mvp"])
+
+    # Existing rows have no MVP counts: rebuilt by crud on first read
+    op.execute("DELETE FROM thongkecauthu")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_thongkecauthu_muagiai_mvp", table_name="thongkecauthu")
+    op.drop_column("thongkecauthu", "mvp")
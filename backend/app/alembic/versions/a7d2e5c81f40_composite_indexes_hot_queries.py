@@ -0,0 +1,63 @@
+"""Composite and covering indexes for the hot query shapes
+
+Revision ID: a7d2e5c81f40
+Revises: f3a8c1d9b6e2
+Create Date: 2026-02-09
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d2e5c81f40'
+down_revision = 'f3a8c1d9b6e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-season club lists: the PK (maclb, muagiai) cannot serve muagiai = ?
+    op.create_index("ix_caulacbo_muagiai_maclb", "caulacbo", ["muagiai", "maclb"])
+
+    # Squad reads (maclb, muagiai): rebuilt as a covering index (index-only scans).
+    # (maclb, muagiai, soaothidau) is served by uq_chitietdoibong_maclb_muagiai_soaothidau.
+    op.drop_index("ix_chitietdoibong_maclb_muagiai", table_name="chitietdoibong")
+    op.create_index(
+        "ix_chitietdoibong_maclb_muagiai",
+        "chitietdoibong",
+        ["maclb", "muagiai"],
+        postgresql_include=["macauthu", "soaothidau"],
+    )
+    # Player -> club for a season: the PK (macauthu, maclb, muagiai) skips muagiai
+    op.create_index(
+        "ix_chitietdoibong_muagiai_macauthu",
+        "chitietdoibong",
+        ["muagiai", "macauthu"],
+        postgresql_include=["maclb", "soaothidau"],
+    )
+
+    # Season listings by kickoff, in keyset order (thoigianthidau, matran)
+    op.create_index(
+        "ix_lichthidau_muagiai_thoigianthidau",
+        "lichthidau",
+        ["muagiai", "thoigianthidau", "matran"],
+    )
+
+    # Events of a match by type
+    op.create_index(
+        "ix_sukientrandau_matran_loaisukien",
+        "sukientrandau",
+        ["matran", "loaisukien"],
+        postgresql_include=["macauthu", "maclb"],
+    )
+
+    # doihinhxuatphat by matran: served by its PK (matran, macauthu)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sukientrandau_matran_loaisukien", table_name="sukientrandau")
+    op.drop_index("ix_lichthidau_muagiai_thoigianthidau", table_name="lichthidau")
+    op.drop_index("ix_chitietdoibong_muagiai_macauthu", table_name="chitietdoibong")
+    op.drop_index("ix_chitietdoibong_maclb_muagiai", table_name="chitietdoibong")
+    op.create_index("ix_chitietdoibong_maclb_muagiai", "chitietdoibong", ["maclb", "muagiai"])
+    op.drop_index("ix_caulacbo_muagiai_maclb", table_name="caulacbo")
@@ -0,0 +1,32 @@
+"""Seasons: thongkecauthuluc marks thongkecauthu as built
+
+Revision ID: b8c4f2e9d371
+Revises: a7d2e5c81f40
+Create Date: 2026-02-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8c4f2e9d371'
+down_revision = 'a7d2e5c81f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("muagiai", sa.Column("thongkecauthuluc", sa.DateTime(), nullable=True))
+
+    # Seasons already built keep their rows; the rest are built on first read
+    op.execute(
+        """
+        UPDATE muagiai SET thongkecauthuluc = now()
+        WHERE EXISTS (SELECT 1 FROM thongkecauthu t WHERE t.muagiai = muagiai.muagiai)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("muagiai", "thongkecauthuluc")
@@ -0,0 +1,52 @@
+"""Matches: integer goal columns banthangnha/banthangkhach backfilled from tiso
+
+Revision ID: c8f2a7d35e91
+Revises: a3d9e6f41c27
+Create Date: 2026-01-12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8f2a7d35e91'
+down_revision = 'a3d9e6f41c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("lichthidau", sa.Column("banthangnha", sa.Integer(), nullable=True))
+    op.add_column("lichthidau", sa.Column("banthangkhach", sa.Integer(), nullable=True))
+
+    # Backfill from valid "H-A" scores and normalize those tiso values to "H-A".
+    # Unparseable legacy scores keep NULL goals (they never counted in standings).
+    op.execute(
+        r"""
+        UPDATE lichthidau
+        SET banthangnha = split_part(tiso, '-', 1)::int,
+            banthangkhach = split_part(tiso, '-', 2)::int
+        WHERE tiso ~ '^\s*[0-9]{1,9}\s*-\s*[0-9]{1,9}\s*$'
+        """
+    )
+    op.execute(
+        """
+        UPDATE lichthidau
+        SET tiso = banthangnha || '-' || banthangkhach
+        WHERE banthangnha IS NOT NULL
+        """
+    )
+
+    op.create_check_constraint(
+        "ck_lichthidau_banthang",
+        "lichthidau",
+        "(banthangnha IS NULL) = (banthangkhach IS NULL)"
+        " AND (banthangnha IS NULL OR (banthangnha >= 0 AND banthangkhach >= 0))",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_lichthidau_banthang", "lichthidau", type_="check")
+    op.drop_column("lichthidau", "banthangkhach")
+    op.drop_column("lichthidau", "banthangnha")
@@ -0,0 +1,29 @@
+"""Seasons: phienbandulieu/capnhatdulieu data version for response caching
+
+Revision ID: e4b19c7a2d58
+Revises: c8f2a7d35e91
+Create Date: 2026-01-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b19c7a2d58'
+down_revision = 'c8f2a7d35e91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "muagiai",
+        sa.Column("phienbandulieu", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("muagiai", sa.Column("capnhatdulieu", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("muagiai", "capnhatdulieu")
+    op.drop_column("muagiai", "phienbandulieu")
@@ -0,0 +1,40 @@
+"""Players: accent-insensitive trigram index on the name for search
+
+Revision ID: f3a8c1d9b6e2
+Revises: e4b19c7a2d58
+Create Date: 2026-02-02
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8c1d9b6e2'
+down_revision = 'e4b19c7a2d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE (it looks the dictionary up through
+    # search_path), so it cannot be indexed: pin the dictionary in an
+    # IMMUTABLE wrapper. crud._player_name_key queries lower(f_unaccent(...)).
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_cauthu_tencauthu_trgm ON cauthu "
+        "USING gin (lower(f_unaccent(tencauthu)) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    # The extensions are left installed (other objects may depend on them)
+    op.execute("DROP INDEX IF EXISTS ix_cauthu_tencauthu_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
 import jwt
@@ -7,10 +7,12 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core import security
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import async_engine, engine
+from app.core.principal import Principal, principal_cache
 from app.models import TokenPayload, TaiKhoan
 from app import crud
 
@@ -26,7 +28,15 @@ def get_db() -> Generator[Session, None, None]:
         yield session
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    # expire_on_commit=False: objects stay readable after a lazy rebuild's
+    # commit (an expired attribute would need sync I/O to reload)
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 SessionDep = Annotated[Session, Depends(get_db)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 TokenDep = Annotated[HTTPAuthorizationCredentials, Depends(http_bearer)]
 
 
@@ -34,9 +44,12 @@ TokenDep = Annotated[HTTPAuthorizationCredentials, Depends(http_bearer)]
 # V-LEAGUE AUTHENTICATION DEPENDENCIES
 # =============================================
 
-def get_current_user_vleague(session: SessionDep, credentials: TokenDep) -> TaiKhoan:
+def get_current_principal(session: SessionDep, credentials: TokenDep) -> Principal:
     """
-    Get current authenticated V-League user from JWT token
+    Resolve the JWT subject to a Principal (id, active flag, role).
+    
+    PERF: Served from the principal cache; a miss loads the account row and
+    its group name (only the row when the token carries a current role claim).
     """
     token = credentials.credentials  # Extract token from credentials
     
@@ -58,12 +71,35 @@ def get_current_user_vleague(session: SessionDep, credentials: TokenDep) -> TaiK
             detail="Could not validate credentials"
         )
     
-    user = session.get(TaiKhoan, int(token_data.sub))
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    if not user.isactive:
+    principal = principal_cache.get(token_data.sub)
+    if principal is None:
+        user = session.get(TaiKhoan, int(token_data.sub))
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        # The role claim is only trusted while the account is still in the
+        # group it was issued for
+        if token_data.role is not None and token_data.manhom == user.manhom:
+            role = token_data.role
+        else:
+            role = crud.get_user_role(session=session, user=user)
+        principal = Principal.from_user(user, role)
+        principal_cache.set(token_data.sub, principal)
+    
+    if not principal.isactive:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return user
+    return principal
+
+
+CurrentPrincipal = Annotated[Principal, Depends(get_current_principal)]
+
+
+def get_current_user_vleague(principal: CurrentPrincipal) -> TaiKhoan:
+    """
+    Get current authenticated V-League user from JWT token
+    
+    Detached snapshot built from the cached principal (see Principal.to_user).
+    """
+    return principal.to_user()
 
 
 CurrentUserVLeague = Annotated[TaiKhoan, Depends(get_current_user_vleague)]
@@ -74,9 +110,8 @@ def require_role(*allowed_roles: str):
     Dependency factory to check user role
     Usage: Depends(require_role("BTC", "QuanLyDoi"))
     """
-    def role_checker(session: SessionDep, current_user: CurrentUserVLeague) -> TaiKhoan:
-        user_role = crud.get_user_role(session=session, user=current_user)
-        if user_role not in allowed_roles:
+    def role_checker(principal: CurrentPrincipal, current_user: CurrentUserVLeague) -> TaiKhoan:
+        if principal.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required role: {', '.join(allowed_roles)}"
@@ -86,11 +121,10 @@ def require_role(*allowed_roles: str):
 
 # Compatibility dependency for routes expecting superuser access
 def get_current_active_superuser(
-    session: SessionDep,
+    principal: CurrentPrincipal,
     current_user: CurrentUserVLeague,
 ) -> TaiKhoan:
-    role = crud.get_user_role(session=session, user=current_user)
-    if role != "BTC":
+    if principal.role != "BTC":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The user doesn't have enough privileges",
@@ -14,6 +14,8 @@ from app.api.routes import (
     schedule,
     standings,
     stats,
+    monitoring,
+    live,
 )
 from app.core.config import settings
 
@@ -37,3 +39,9 @@ api_router.include_router(schedule.router, prefix="/schedule", tags=["schedule"]
 # Standings & Statistics routes
 api_router.include_router(standings.router, prefix="/standings", tags=["standings"])
 api_router.include_router(stats.router, prefix="/stats", tags=["statistics"])
+
+# Live push (WebSocket / SSE)
+api_router.include_router(live.router, prefix="/live", tags=["live"])
+
+# Monitoring
+api_router.include_router(monitoring.router, prefix="/monitoring", tags=["monitoring"])
@@ -5,10 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
 from app import crud
-from app.api.deps import SessionDep, get_current_user_vleague
+from app.api.deps import AsyncSessionDep, get_current_user_vleague
 from app.core import security
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.hashing import HashingOverloadedError, password_hasher
 from app.models import LoginResponse, Message, TaiKhoanPublic, TaiKhoan
 
 router = APIRouter(tags=["auth"])
@@ -27,8 +27,16 @@ class SignUpRequest(BaseModel):
     hoten: str | None = None
     email: str | None = None
 
+def _hashing_overloaded(e: HashingOverloadedError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/login", response_model=LoginResponse)
-def login(session: SessionDep, credentials: LoginRequest) -> LoginResponse:
+async def login(session: AsyncSessionDep, credentials: LoginRequest) -> LoginResponse:
     """
     Login with username and password (V-League)
     
@@ -37,12 +45,19 @@ def login(session: SessionDep, credentials: LoginRequest) -> LoginResponse:
     - **password**: Password (plaintext, will be verified)
     
     Returns JWT access token with role and expiration time.
+    
+    Password verification runs in the hashing process pool (503 with
+    `Retry-After` when its queue is full); hashes made with an outdated
+    bcrypt cost are replaced on successful login.
     """
-    user = crud.authenticate(
-        session=session, 
-        username=credentials.username, 
-        password=credentials.password
-    )
+    try:
+        user = await crud.authenticate_async(
+            session=session,
+            username=credentials.username,
+            password=credentials.password
+        )
+    except HashingOverloadedError as e:
+        raise _hashing_overloaded(e)
     
     if not user:
         raise HTTPException(
@@ -57,13 +72,14 @@ def login(session: SessionDep, credentials: LoginRequest) -> LoginResponse:
         )
     
     # Get user role
-    role = crud.get_user_role(session=session, user=user)
+    role = await crud.get_user_role_async(session=session, user=user)
     
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
         subject=str(user.mataikhoan),
-        expires_delta=access_token_expires
+        expires_delta=access_token_expires,
+        claims={"role": role, "manhom": user.manhom} if settings.JWT_ROLE_CLAIM else None
     )
 
     return LoginResponse(
@@ -74,26 +90,32 @@ def login(session: SessionDep, credentials: LoginRequest) -> LoginResponse:
     )
 
 @router.post("/signup", response_model=TaiKhoanPublic)
-def signup(session: SessionDep, body: SignUpRequest) -> TaiKhoanPublic:
+async def signup(session: AsyncSessionDep, body: SignUpRequest) -> TaiKhoanPublic:
     """
     Create a new V-League account
+    
+    The password is hashed in the hashing process pool (503 when it is full).
     """
-    existing = crud.get_user_by_username(session=session, username=body.username)
+    existing = await crud.get_user_by_username_async(session=session, username=body.username)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists",
         )
+    try:
+        matkhau = await password_hasher.hash_async(body.password)
+    except HashingOverloadedError as e:
+        raise _hashing_overloaded(e)
     user = TaiKhoan(
         tendangnhap=body.username,
-        matkhau=get_password_hash(body.password),
+        matkhau=matkhau,
         hoten=body.hoten,
         email=body.email,
         isactive=True,
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
     return TaiKhoanPublic(
         mataikhoan=user.mataikhoan,
         tendangnhap=user.tendangnhap,
@@ -1,8 +1,9 @@
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 
 from app import crud
 from app.api.deps import SessionDep, require_role, CurrentUserVLeague
+from app.core.pagination import check_mode, decode_cursor, set_next_cursor
 from app.models import CauLacBoPublic, CauLacBoCreate, CauLacBoUpdate, Message
 
 router = APIRouter()
@@ -79,17 +80,26 @@ def get_my_club(
 @router.get("/", response_model=list[CauLacBoPublic])
 def get_clubs(
     session: SessionDep,
+    response: Response,
     muagiai: Optional[str] = Query(None, description="Filter by season, e.g., '2024-2025'"),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page")
 ) -> list[CauLacBoPublic]:
     """
     Get all clubs, optionally filtered by season
     
     **Query Parameters:**
     - muagiai: Optional filter by season ID
+    - cursor: Keyset pagination (ordered by maclb, muagiai); a full page returns
+      the next cursor in the `X-Next-Cursor` header. Not combinable with `skip`.
     """
-    clubs = crud.get_clubs(session=session, muagiai=muagiai, skip=skip, limit=limit)
+    check_mode(skip=skip, cursor=cursor)
+    clubs = crud.get_clubs(
+        session=session, muagiai=muagiai, skip=skip, limit=limit,
+        after=decode_cursor(cursor, (str, str)) if cursor is not None else None
+    )
+    set_next_cursor(response, clubs, limit=limit, key=lambda c: (c.maclb, c.muagiai))
     return clubs
 
 
@@ -0,0 +1,110 @@
+import json
+
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+from app.core.live import live_hub, match_channel, season_channel
+
+router = APIRouter()
+
+PING = json.dumps({"type": "ping"})
+
+# Close code for "match/season not found" (4000-4999 are application codes)
+WS_NOT_FOUND = 4404
+
+
+def _match_exists(matran: str) -> bool:
+    # Short-lived session: never hold a DB connection for a connection's lifetime
+    with Session(engine) as session:
+        return crud.get_match_by_id(session=session, matran=matran) is not None
+
+
+def _season_exists(muagiai: str) -> bool:
+    with Session(engine) as session:
+        return crud.get_season_by_id(session=session, id=muagiai) is not None
+
+
+async def _serve_websocket(websocket: WebSocket, channel: str) -> None:
+    await websocket.accept()
+    subscription = live_hub.subscribe(channel)
+    try:
+        while True:
+            payload = await subscription.get(timeout=settings.LIVE_HEARTBEAT_SECONDS)
+            await websocket.send_text(PING if payload is None else payload)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_hub.unsubscribe(subscription)
+
+
+def _sse_response(request: Request, channel: str) -> StreamingResponse:
+    async def stream():
+        subscription = live_hub.subscribe(channel)
+        try:
+            yield f"retry: {settings.LIVE_HEARTBEAT_SECONDS * 1000}\n\n"
+            while not await request.is_disconnected():
+                payload = await subscription.get(timeout=settings.LIVE_HEARTBEAT_SECONDS)
+                yield ": ping\n\n" if payload is None else f"data: {payload}\n\n"
+        finally:
+            live_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/matches/{matran}/ws")
+async def match_websocket(websocket: WebSocket, matran: str) -> None:
+    """
+    Live deltas of one match over WebSocket.
+    
+    Public - no authentication required.
+    
+    Messages (JSON text frames):
+    - `{"type": "event_created" | "event_updated" | "event_deleted" |
+      "lineup_added" | "lineup_updated" | "lineup_removed" | "match_updated",
+      "matran", "muagiai", "data", "ts"}`
+    - `{"type": "ping"}` heartbeat
+    - `{"type": "resync"}` client fell behind: refetch `GET /matches/{matran}`
+    """
+    if not await run_in_threadpool(_match_exists, matran):
+        await websocket.close(code=WS_NOT_FOUND)
+        return
+    await _serve_websocket(websocket, match_channel(matran))
+
+
+@router.websocket("/seasons/{muagiai}/ws")
+async def season_websocket(websocket: WebSocket, muagiai: str) -> None:
+    """Live deltas of every match in a season over WebSocket (same messages)"""
+    if not await run_in_threadpool(_season_exists, muagiai):
+        await websocket.close(code=WS_NOT_FOUND)
+        return
+    await _serve_websocket(websocket, season_channel(muagiai))
+
+
+@router.get("/matches/{matran}/sse")
+async def match_events_stream(request: Request, matran: str) -> StreamingResponse:
+    """
+    Live deltas of one match as Server-Sent Events (`text/event-stream`).
+    
+    Public - no authentication required. Same JSON messages as the WebSocket,
+    one per `data:` line; heartbeats are SSE comments.
+    """
+    if not await run_in_threadpool(_match_exists, matran):
+        raise HTTPException(status_code=404, detail="Match not found")
+    return _sse_response(request, match_channel(matran))
+
+
+@router.get("/seasons/{muagiai}/sse")
+async def season_events_stream(request: Request, muagiai: str) -> StreamingResponse:
+    """Live deltas of every match in a season as Server-Sent Events"""
+    if not await run_in_threadpool(_season_exists, muagiai):
+        raise HTTPException(status_code=404, detail=f"Season {muagiai} not found")
+    return _sse_response(request, season_channel(muagiai))
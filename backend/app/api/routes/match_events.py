@@ -1,14 +1,17 @@
 from typing import Any, Annotated
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 
-from app.api.deps import CurrentUserVLeague, SessionDep, require_role, TaiKhoan
+from app.api.deps import AsyncSessionDep, CurrentUserVLeague, SessionDep, require_role, TaiKhoan
 from app import crud
+from app.core.cache import season_json_response_async
 from app.models import (
     SuKienTranDau,
     SuKienTranDauCreate,
     SuKienTranDauPublic,
     SuKienTranDauUpdate,
+    MatchEventBulkRequest,
+    MatchEventBulkResult,
     Message,
 )
 
@@ -16,8 +19,9 @@ router = APIRouter()
 
 
 @router.get("/{matran}/events", response_model=list[SuKienTranDauPublic])
-def read_match_events(
-    session: SessionDep,
+async def read_match_events(
+    session: AsyncSessionDep,
+    request: Request,
     current_user: CurrentUserVLeague,
     matran: str,
     loaisukien: str | None = None,
@@ -26,19 +30,28 @@ def read_match_events(
     Get events for match, ordered by time.
     
     - **loaisukien**: Optional filter by event type (BanThang, TheVang, TheDo, ThayNguoi)
+    
+    Cached per season data version; `If-None-Match` with the current ETag → 304.
     """
     # Verify match exists
-    match = crud.get_match_by_id(session=session, matran=matran)
-    if not match:
+    marker = await crud.get_match_data_marker_async(session=session, matran=matran)
+    if marker is None:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    events = crud.get_match_events(
-        session=session,
+    return await season_json_response_async(
+        request,
+        "match_events",
+        muagiai=marker.muagiai,
+        marker=marker,
+        model=list[SuKienTranDauPublic],
+        compute=lambda: crud.get_match_events_async(
+            session=session,
+            matran=matran,
+            loaisukien=loaisukien
+        ),
         matran=matran,
-        loaisukien=loaisukien
+        loaisukien=loaisukien,
     )
-    
-    return events
 
 
 @router.post("/{matran}/events", response_model=SuKienTranDauPublic, status_code=201)
@@ -75,6 +88,37 @@ def create_match_event(
     return event
 
 
+@router.post("/{matran}/events/bulk", response_model=MatchEventBulkResult)
+def create_match_events_bulk(
+    *,
+    session: SessionDep,
+    matran: str,
+    body: MatchEventBulkRequest,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+) -> Any:
+    """
+    Ingest up to 1000 events for a match in one request (live feed backlog).
+    
+    **Requires BTC role.**
+    
+    Each event is validated with the same rules as `POST /{matran}/events`.
+    Returns one result per event, in request order:
+    - `created`: inserted
+    - `duplicate`: `masukien` already stored (resending a backlog is safe)
+    - `invalid`: rejected, `detail` has the validation message
+    - `skipped`: valid but not inserted because `atomic` is true and another
+      event is invalid
+    
+    All inserts are committed together, with one standings/stats update.
+    """
+    try:
+        return crud.create_match_events_bulk(
+            session=session, matran=matran, events_in=body.events, atomic=body.atomic
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.patch("/{matran}/events/{masukien}", response_model=SuKienTranDauPublic)
 def update_match_event(
     *,
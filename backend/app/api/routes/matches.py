@@ -1,11 +1,14 @@
-from typing import Any, Annotated
+import json
+from typing import Any, Annotated, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
 from sqlmodel import func
 
-from app.api.deps import CurrentUserVLeague, SessionDep, require_role, TaiKhoan
+from app.api.deps import AsyncSessionDep, CurrentUserVLeague, SessionDep, require_role, TaiKhoan
 from app import crud
+from app.core.cache import season_json_response_async
+from app.core.pagination import check_mode, decode_cursor, set_next_cursor
 from app.models import (
     LichThiDau,
     LichThiDauCreate,
@@ -19,10 +22,13 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[LichThiDauPublic])
-def read_matches(
-    session: SessionDep,
+async def read_matches(
+    session: AsyncSessionDep,
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
     muagiai: str | None = None,
     vong: int | None = None,
     maclb: str | None = None,
@@ -37,33 +43,85 @@ def read_matches(
     - **maclb**: Filter by club (home OR away)
     - **tungay**: Filter by date from (inclusive)
     - **denngay**: Filter by date to (inclusive)
+    - **cursor**: Keyset pagination; a full page returns the next cursor in
+      the `X-Next-Cursor` header (ordered by thoigianthidau, matran).
+      `skip` (offset mode) still works but cannot be combined with `cursor`.
+    
+    With `muagiai`: cached per season data version, with `ETag` /
+    `Last-Modified` / `Cache-Control`; `If-None-Match` with the current ETag → 304.
     """
-    matches = crud.get_matches(
-        session=session,
+    check_mode(skip=skip, cursor=cursor)
+    after = decode_cursor(cursor, (datetime, str)) if cursor is not None else None
+    
+    def cursor_key(match: dict[str, Any]) -> tuple:
+        return match["thoigianthidau"], match["matran"]
+    
+    async def compute() -> list[dict[str, Any]]:
+        return await crud.get_matches_async(
+            session=session,
+            muagiai=muagiai,
+            vong=vong,
+            maclb=maclb,
+            tungay=tungay,
+            denngay=denngay,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
+    
+    if not muagiai:
+        matches = await compute()
+        set_next_cursor(response, matches, limit=limit, key=cursor_key)
+        return matches
+    
+    cached = await season_json_response_async(
+        request,
+        "matches",
         muagiai=muagiai,
+        marker=await crud.get_season_data_marker_async(session=session, muagiai=muagiai),
+        model=list[LichThiDauPublic],
+        compute=compute,
+        public=True,
         vong=vong,
         maclb=maclb,
         tungay=tungay,
         denngay=denngay,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
-    
-    return matches
+    if cached.status_code == 200:
+        # Cached body: the last row's sort keys are read back from the JSON
+        set_next_cursor(cached, json.loads(cached.body), limit=limit, key=cursor_key)
+    return cached
 
 
 @router.get("/{matran}", response_model=LichThiDauDetail)
-def read_match(
-    session: SessionDep,
+async def read_match(
+    session: AsyncSessionDep,
+    request: Request,
     matran: str,
 ) -> Any:
     """
     Get match details with lineup, events, and referees.
+    
+    Cached per season data version, with `ETag` / `Last-Modified` /
+    `Cache-Control`; `If-None-Match` with the current ETag → 304.
     """
-    match_detail = crud.get_match_detail(session=session, matran=matran)
-    if not match_detail:
+    marker = await crud.get_match_data_marker_async(session=session, matran=matran)
+    if marker is None:
         raise HTTPException(status_code=404, detail="Match not found")
-    return match_detail
+    
+    return await season_json_response_async(
+        request,
+        "match_detail",
+        muagiai=marker.muagiai,
+        marker=marker,
+        model=LichThiDauDetail,
+        compute=lambda: crud.get_match_detail_async(session=session, matran=matran),
+        public=True,
+        matran=matran,
+    )
 
 
 @router.post("/", response_model=LichThiDauPublic, status_code=201)
@@ -85,6 +143,7 @@ def create_match(
     - Stadium exists in season (if provided)
     - Match time within season dates
     - Round number > 0
+    - Score (`tiso` or `banthangnha`/`banthangkhach`) valid and consistent
     """
     try:
         match = crud.create_match(session=session, match_in=match_in)
@@ -112,7 +171,8 @@ def update_match(
     
     **Common use cases:**
     - Update match time: `{"thoigianthidau": "2024-03-15T19:00:00"}`
-    - Update final score: `{"tiso": "2-1"}`
+    - Update final score: `{"tiso": "2-1"}` or `{"banthangnha": 2, "banthangkhach": 1}`
+      (the other representation is derived; if both are given they must match)
     - Update stadium: `{"masanvandong": "SVD_02"}`
     - Update attendance: `{"sokhangia": 15000}`
     """
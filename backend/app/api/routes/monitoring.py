@@ -0,0 +1,107 @@
+from typing import Any, Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_role, TaiKhoan
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.db import async_engine, engine
+from app.core.hashing import password_hasher
+from app.core.live import live_hub
+from app.core.pool import async_pool_stats, pool_stats, sync_pool_stats
+from app.core.principal import principal_cache
+
+router = APIRouter()
+
+
+@router.get("/cache")
+def get_cache_stats(
+    *,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+) -> Any:
+    """
+    Response cache hit/miss counters (standings, stats, schedule).
+    
+    **Requires BTC role.**
+    
+    Counters are per API worker process; `entries` is only reported for the
+    in-process LRU backend.
+    
+    **Response:**
+    - `backend`: Cache backend in use
+    - `hits` / `misses`: Totals since process start
+    - `namespaces`: Per-endpoint `hits`, `misses` and `hit_ratio`
+    - `principals`: Authenticated-principal cache (`hits`, `misses`, `entries`)
+    """
+    return {**response_cache.stats(), "principals": principal_cache.stats()}
+
+
+@router.get("/live")
+def get_live_stats(
+    *,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+) -> Any:
+    """
+    Live push hub counters (per API worker process).
+    
+    **Requires BTC role.**
+    
+    **Response:**
+    - `broker`: "memory" or "redis"
+    - `channels` / `subscribers`: Currently connected WebSocket/SSE clients
+    - `published`: Messages serialized (once per write, whatever the audience)
+    - `delivered`: Messages queued to subscribers
+    """
+    return live_hub.stats()
+
+
+@router.get("/db")
+def get_db_pool_stats(
+    *,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+) -> Any:
+    """
+    Connection pool metrics for the sync and async engines (per API worker).
+    
+    **Requires BTC role.**
+    
+    **Response (per engine):**
+    - `in_use` / `idle` / `overflow` / `size`: Current pool occupancy
+    - `checkouts`: Connections handed out since process start
+    - `wait_seconds_total` / `_avg` / `_max`: Time spent waiting for a free
+      connection (grows when the pool is too small for the load)
+    - `timeouts`: Checkouts that gave up after `DB_POOL_TIMEOUT`
+    """
+    return {
+        "sync": pool_stats(engine, sync_pool_stats),
+        "async": pool_stats(async_engine, async_pool_stats),
+        "settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+        },
+    }
+
+
+@router.get("/hashing")
+def get_hashing_stats(
+    *,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+) -> Any:
+    """
+    Password hashing pool counters (per API worker process).
+    
+    **Requires BTC role.**
+    
+    **Response:**
+    - `workers` / `rounds`: Pool size and bcrypt cost
+    - `pending`: Jobs queued or running now (queue depth); `pending_max`: peak
+    - `max_pending`: Limit beyond which logins/signups get 503
+    - `completed` / `rejected`: Totals since process start
+    - `rehashed`: Logins that upgraded a hash made with another cost
+    - `avg_seconds`: Mean time from submit to result (queue wait + bcrypt)
+    """
+    return password_hasher.stats()
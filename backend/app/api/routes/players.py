@@ -1,8 +1,9 @@
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 
 from app import crud
 from app.api.deps import SessionDep, require_role, CurrentUserVLeague
+from app.core.pagination import check_mode, decode_cursor, set_next_cursor
 from app.models import CauThuPublic, CauThuCreate, CauThuUpdate, Message, TaiKhoan
 
 router = APIRouter()
@@ -82,12 +83,14 @@ def _check_player_in_user_roster(session, current_user: TaiKhoan, player_id: str
 @router.get("/", response_model=list[CauThuPublic])
 def get_players(
     session: SessionDep,
+    response: Response,
     current_user: CurrentUserVLeague,  # Auth required
     keyword: Optional[str] = Query(None, description="Search by player name"),
     quoctich: Optional[str] = Query(None, description="Filter by nationality (e.g., 'VN')"),
     vitrithidau: Optional[str] = Query(None, description="Filter by position (GK, DF, MF, FW)"),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page")
 ) -> list[CauThuPublic]:
     """
     Get all players with optional filters
@@ -98,18 +101,41 @@ def get_players(
     - keyword: Search in player name (case-insensitive)
     - quoctich: Filter by nationality
     - vitrithidau: Filter by position (GK, DF, MF, FW)
+    - cursor: Keyset pagination (ordered by macauthu); a full page returns
+      the next cursor in the `X-Next-Cursor` header. Not combinable with `skip`.
     """
+    check_mode(skip=skip, cursor=cursor)
     players = crud.get_players(
         session=session,
         keyword=keyword,
         quoctich=quoctich,
         vitrithidau=vitrithidau,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after=decode_cursor(cursor, (str,)) if cursor is not None else None
     )
+    set_next_cursor(response, players, limit=limit, key=lambda p: (p.macauthu,))
     return players
 
 
+@router.get("/search", response_model=list[CauThuPublic])
+def search_players(
+    session: SessionDep,
+    current_user: CurrentUserVLeague,  # Auth required
+    q: str = Query(..., min_length=1, max_length=100, description="Name or name prefix"),
+    limit: int = Query(default=20, ge=1, le=50)
+) -> list[CauThuPublic]:
+    """
+    Player picker autocomplete: ranked, accent-insensitive name search
+
+    **Authentication required** - Any authenticated user can search players
+
+    "quyet" matches "Nguyễn Văn Quyết"; names starting with the term come
+    first, then names with a word starting with it, then other matches.
+    """
+    return crud.search_players(session=session, q=q, limit=limit)
+
+
 @router.get("/{player_id}", response_model=CauThuPublic)
 def get_player(
     session: SessionDep,
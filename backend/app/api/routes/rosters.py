@@ -1,15 +1,19 @@
-from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-import uuid
-from datetime import datetime
+from typing import Annotated, Any, Optional
+from fastapi import APIRouter, Depends, Form, HTTPException, status, Query, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+import csv
+import io
 
 from app import crud
-from app.api.deps import SessionDep, require_role, CurrentUserVLeague
+from app.api.deps import AsyncSessionDep, SessionDep, require_role, CurrentUserVLeague
+from app.core.cache import season_json_response_async
 from app.models import (
     ChiTietDoiBongPublic, ChiTietDoiBongCreate, ChiTietDoiBongUpdate,
     RosterPlayerDetail, RosterValidationResult, Message, TaiKhoan,
-    RegisterPlayerRequest, RegisterPlayerResponse, CauThuCreate
+    RegisterPlayerRequest, RegisterPlayerResponse, CauThuCreate,
+    RosterImportRequest, RosterImportResult, RosterImportRow,
 )
+from app.utils import generate_player_id
 
 router = APIRouter()
 
@@ -210,9 +214,7 @@ def register_player(
         )
     
     # Generate unique player ID
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    short_uuid = str(uuid.uuid4())[:8].upper()
-    macauthu = f"CT{timestamp}{short_uuid}"
+    macauthu = generate_player_id()
     
     try:
         # Create player
@@ -267,6 +269,131 @@ def register_player(
         )
 
 
+# =============================================
+# BULK SQUAD IMPORT
+# =============================================
+
+SQUAD_CSV_COLUMNS = (
+    "macauthu", "tencauthu", "ngaysinh", "quoctich", "vitrithidau",
+    "chieucao", "cannang", "soaothidau",
+)
+
+
+def _parse_squad_csv(content: str) -> list[RosterImportRow]:
+    """
+    Parse a squad CSV (header row with SQUAD_CSV_COLUMNS, any order/subset).
+    
+    Raises HTTPException 400 naming the line of the first malformed row.
+    """
+    reader = csv.DictReader(io.StringIO(content))
+    unknown = set(reader.fieldnames or ()) - set(SQUAD_CSV_COLUMNS)
+    if not reader.fieldnames or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Squad CSV header must use columns: {', '.join(SQUAD_CSV_COLUMNS)}"
+        )
+    rows = []
+    for record in reader:
+        if None in record:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Line {reader.line_num}: more cells than header columns"
+            )
+        try:
+            rows.append(RosterImportRow.model_validate(
+                {key: value.strip() for key, value in record.items() if value and value.strip()}
+            ))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Line {reader.line_num}: {e}"
+            )
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Squad CSV has no rows")
+    return rows
+
+
+def _import_squad(
+    session: SessionDep,
+    current_user: TaiKhoan,
+    *,
+    maclb: str,
+    muagiai: str,
+    rows: list[RosterImportRow],
+    atomic: bool
+) -> RosterImportResult:
+    _check_club_ownership(session, current_user, maclb, muagiai)
+    try:
+        return crud.import_roster(
+            session=session, maclb=maclb, muagiai=muagiai, rows=rows, atomic=atomic
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/import", response_model=RosterImportResult)
+def import_squad(
+    session: SessionDep,
+    request: RosterImportRequest,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC", "QuanLyDoi", "CLB"))]
+) -> RosterImportResult:
+    """
+    Register a whole squad (JSON) in one transaction.
+    
+    **Requires BTC, QuanLyDoi, or CLB role** (QuanLyDoi/CLB: own club only)
+    
+    Each row either names an existing player (`macauthu`) or describes a new
+    one (`tencauthu`, `ngaysinh`, `quoctich`, ...); `soaothidau` is required.
+    Rows are checked in file order against the registration rules (age,
+    shirt number, foreign quota, roster size) and reported one by one:
+    `created`, `invalid` (with the reason) or `skipped`.
+    
+    With `atomic` (default) nothing is registered unless every row is valid:
+    fix the reported rows and resend the whole file.
+    
+    **Error Responses:**
+    - 403: QuanLyDoi/CLB importing into another club
+    - 404: Club/Season not found
+    """
+    return _import_squad(
+        session, current_user,
+        maclb=request.maclb, muagiai=request.muagiai, rows=request.rows, atomic=request.atomic
+    )
+
+
+@router.post("/import/csv", response_model=RosterImportResult)
+async def import_squad_csv(
+    session: SessionDep,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC", "QuanLyDoi", "CLB"))],
+    file: UploadFile,
+    maclb: str = Form(...),
+    muagiai: str = Form(...),
+    atomic: bool = Form(True),
+) -> RosterImportResult:
+    """
+    Same as `POST /rosters/import`, from a CSV upload (multipart `file`).
+    
+    Header row: `macauthu,tencauthu,ngaysinh,quoctich,vitrithidau,chieucao,cannang,soaothidau`
+    (any order, unused columns may be left out). Dates as `YYYY-MM-DD`.
+    
+    **Error Responses:**
+    - 400: Malformed CSV (the line is named)
+    - 403: QuanLyDoi/CLB importing into another club
+    - 404: Club/Season not found
+    """
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Squad CSV must be UTF-8"
+        )
+    rows = _parse_squad_csv(content)
+    return await run_in_threadpool(
+        _import_squad, session, current_user,
+        maclb=maclb, muagiai=muagiai, rows=rows, atomic=atomic
+    )
+
+
 # =============================================
 # EXISTING ROSTER ENDPOINTS
 # =============================================
@@ -395,6 +522,7 @@ def update_roster_player(
         for key, value in update_data.items():
             setattr(roster_entry, key, value)
         session.add(roster_entry)
+        crud.bump_season_data_version(session=session, muagiai=muagiai)
         session.commit()
         session.refresh(roster_entry)
     
@@ -402,12 +530,13 @@ def update_roster_player(
 
 
 @router.get("/", response_model=list[RosterPlayerDetail])
-def get_roster(
-    session: SessionDep,
+async def get_roster(
+    session: AsyncSessionDep,
+    request: Request,
     current_user: CurrentUserVLeague,  # Auth required
     maclb: str = Query(..., description="Club ID (required)"),
     muagiai: str = Query(..., description="Season ID (required)"),
-) -> list[RosterPlayerDetail]:
+) -> Any:
     """
     Get club roster for a season with player details
     
@@ -419,46 +548,30 @@ def get_roster(
     
     Returns list of players registered to the club for that season,
     including player details (name, nationality, position, shirt number)
+    
+    Cached per season data version; `If-None-Match` with the current ETag → 304.
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
+    
     # Validate club exists
-    club = crud.get_club_by_id(session=session, maclb=maclb, muagiai=muagiai)
+    club = await crud.get_club_by_id_async(session=session, maclb=maclb, muagiai=muagiai)
     if not club:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Club {maclb} not found for season {muagiai}"
         )
     
-    # PERF: Avoid N+1 - JOIN ChiTietDoiBong with CauThu in single query
-    from sqlmodel import select
-    from app.models import ChiTietDoiBong, CauThu
-    
-    roster_stmt = (
-        select(ChiTietDoiBong, CauThu)
-        .join(CauThu, ChiTietDoiBong.macauthu == CauThu.macauthu)
-        .where(
-            ChiTietDoiBong.maclb == maclb,
-            ChiTietDoiBong.muagiai == muagiai
-        )
+    return await season_json_response_async(
+        request,
+        "roster",
+        muagiai=muagiai,
+        marker=marker,
+        model=list[RosterPlayerDetail],
+        compute=lambda: crud.get_roster_detailed_async(
+            session=session, maclb=maclb, muagiai=muagiai
+        ),
+        maclb=maclb,
     )
-    
-    results = session.exec(roster_stmt).all()
-    
-    # Build detailed roster from JOIN results (including chieucao/cannang)
-    roster_details = [
-        RosterPlayerDetail(
-            macauthu=roster.macauthu,
-            tencauthu=player.tencauthu,
-            quoctich=player.quoctich,
-            vitrithidau=player.vitrithidau,
-            soaothidau=roster.soaothidau,
-            ngaysinh=player.ngaysinh,
-            chieucao=player.chieucao,
-            cannang=player.cannang
-        )
-        for roster, player in results
-    ]
-    
-    return roster_details
 
 
 @router.delete("/{player_id}", response_model=Message)
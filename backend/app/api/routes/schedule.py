@@ -1,9 +1,11 @@
+from datetime import datetime
 from typing import Any, Annotated
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 
-from app.api.deps import CurrentUserVLeague, SessionDep, require_role, TaiKhoan
+from app.api.deps import AsyncSessionDep, CurrentUserVLeague, SessionDep, require_role, TaiKhoan
 from app import crud
+from app.core.cache import season_json_response_async
 from app.models import (
     ScheduleGenerateRequest,
     ScheduleGenerationResult,
@@ -16,9 +18,10 @@ router = APIRouter()
 
 
 @router.get("/{muagiai}", response_model=list[LichThiDauPublic])
-def get_schedule(
+async def get_schedule(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     muagiai: str,
     current_user: CurrentUserVLeague,
 ) -> Any:
@@ -31,26 +34,38 @@ def get_schedule(
     1. Round (vong) ascending
     2. Match time (thoigianthidau) ascending
     3. Match ID (matran) ascending
+    
+    Response cached per season data version (any write to the season invalidates it).
+    `ETag` / `Last-Modified` are set; `If-None-Match` with the current ETag → 304.
     """
-    # Verify season exists
-    season = crud.get_season_by_id(session=session, id=muagiai)
-    if not season:
+    # Verify season exists (and read its data version before computing)
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
+    if marker is None:
         raise HTTPException(status_code=404, detail=f"Mùa giải {muagiai} không tồn tại")
     
-    # Get all matches for this season
-    matches = crud.get_matches(session=session, muagiai=muagiai, limit=2000)
-    
-    # Sort by vong, thoigianthidau, matran
-    matches_sorted = sorted(
-        matches,
-        key=lambda m: (
-            m.vong if m.vong is not None else 999,
-            m.thoigianthidau if m.thoigianthidau is not None else "",
-            m.matran
+    async def compute() -> list[dict[str, Any]]:
+        # Get all matches for this season
+        matches = await crud.get_matches_async(session=session, muagiai=muagiai, limit=2000)
+        
+        # Sort by vong, thoigianthidau (unscheduled last), matran
+        return sorted(
+            matches,
+            key=lambda m: (
+                m["vong"] if m["vong"] is not None else 999,
+                m["thoigianthidau"] is None,
+                m["thoigianthidau"] or datetime.min,
+                m["matran"]
+            )
         )
-    )
     
-    return matches_sorted
+    return await season_json_response_async(
+        request,
+        "schedule",
+        muagiai=muagiai,
+        marker=marker,
+        model=list[LichThiDauPublic],
+        compute=compute
+    )
 
 
 @router.post("/generate", response_model=ScheduleGenerationResult)
@@ -77,7 +92,16 @@ def generate_schedule(
     - **ngaybatdau_lutdi**: Start date for first leg
     - **ngaybatdau_lutve**: Start date for return leg
     - **interval_days**: Days between rounds (default 7)
+    - **dry_run**: Validate and return the fixtures (`fixtures`) without writing
+    - **optimize**: Optimizer mode (simulated annealing within `time_budget_ms`):
+      round order, home/away and kickoff `slots` (TV slots) are searched to
+      minimize home/away breaks while avoiding shared-stadium clashes,
+      `stadium_unavailable` dates and fewer than `min_rest_days` between matches.
+      `optimization` reports the objective of the plain layout (`baseline`)
+      and of the result (`best`); pass `seed` + `max_iterations` for
+      reproducible runs. 400 if there are fewer slots than matches per round.
     
+    All fixtures are validated in memory and inserted in one transaction.
     Returns 200 OK even if generation fails (check success field and errors array).
     """
     try:
@@ -1,8 +1,9 @@
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 
 from app import crud
 from app.api.deps import SessionDep, CurrentUserVLeague, require_role
+from app.core.pagination import check_mode, decode_cursor, set_next_cursor
 from app.models import (
     MuaGiaiPublic, MuaGiaiCreate, MuaGiaiUpdate,
     LoaiCauThuPublic, LoaiCauThuCreate, LoaiCauThuUpdate,
@@ -19,15 +20,25 @@ router = APIRouter()
 @router.get("/seasons", response_model=list[MuaGiaiPublic])
 def get_seasons(
     session: SessionDep,
+    response: Response,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page")
 ) -> list[MuaGiaiPublic]:
     """
     Get all seasons with integrated regulations
     
     Public access - any authenticated user can view seasons and their regulations.
+    
+    `cursor`: keyset pagination (ordered by muagiai); a full page returns the
+    next cursor in the `X-Next-Cursor` header. Not combinable with `skip`.
     """
-    seasons = crud.get_seasons(session=session, skip=skip, limit=limit)
+    check_mode(skip=skip, cursor=cursor)
+    seasons = crud.get_seasons(
+        session=session, skip=skip, limit=limit,
+        after=decode_cursor(cursor, (str,)) if cursor is not None else None
+    )
+    set_next_cursor(response, seasons, limit=limit, key=lambda s: (s.muagiai,))
     return seasons
 
 
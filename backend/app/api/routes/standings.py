@@ -1,18 +1,20 @@
-from typing import Any
+from typing import Any, Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
 
-from app.api.deps import SessionDep
+from app.api.deps import AsyncSessionDep, SessionDep, require_role, TaiKhoan
 from app import crud
+from app.core.cache import season_json_response_async
 from app.models import StandingsResponse
 
 router = APIRouter()
 
 
 @router.get("", response_model=StandingsResponse)
-def get_standings(
+async def get_standings(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')")
 ) -> Any:
     """
@@ -21,12 +23,16 @@ def get_standings(
     Public endpoint - no authentication required.
     
     **Algorithm:**
-    - Computes from match results (`lichthidau.tiso`)
+    - Reads the `bxh_doibong` table, updated incrementally whenever a match
+      result (`lichthidau.banthangnha`/`banthangkhach`) is created, changed or deleted
+    - Built from match results on first request for a season
     - Win = 3 points, Draw = 1 point, Loss = 0 points
     - Sorted by: Points DESC → Goal Difference DESC → Goals For DESC
+    - Response cached per season data version (any write to the season invalidates it)
+    - `ETag` / `Last-Modified` / `Cache-Control: public`; `If-None-Match` → 304
     
     **Handles:**
-    - Null/invalid `tiso` gracefully (skips match)
+    - Matches without a result (NULL goals) are skipped
     - Returns empty standings if season not found
     
     **Query Parameters:**
@@ -34,7 +40,7 @@ def get_standings(
     
     **Response:**
     - `muagiai`: Season ID
-    - `last_updated`: Timestamp of computation
+    - `last_updated`: Timestamp of last standings update
     - `standings`: Array of team standings (sorted by position)
     
     **Example:**
@@ -42,12 +48,41 @@ def get_standings(
     GET /api/standings?muagiai=2024-2025
     ```
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
     try:
-        standings = crud.compute_standings(session=session, muagiai=muagiai)
+        return await season_json_response_async(
+            request,
+            "standings",
+            muagiai=muagiai,
+            marker=marker,
+            model=StandingsResponse,
+            compute=lambda: crud.compute_standings_async(session=session, muagiai=muagiai),
+            public=True
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute standings: {str(e)}"
         )
+
+
+@router.post("/rebuild", response_model=StandingsResponse)
+def rebuild_standings(
+    *,
+    session: SessionDep,
+    current_user: Annotated[TaiKhoan, Depends(require_role("BTC"))],
+    muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')")
+) -> Any:
+    """
+    Rebuild standings table for a season from match results.
+    
+    **Requires BTC role.**
+    
+    Use after importing or editing match results directly in the database.
+    Same as running `python app/rebuild_standings.py <muagiai>`.
+    """
+    season = crud.get_season_by_id(session=session, id=muagiai)
+    if not season:
+        raise HTTPException(status_code=404, detail=f"Season {muagiai} not found")
     
-    return standings
+    return crud.rebuild_standings(session=session, muagiai=muagiai)
@@ -1,18 +1,20 @@
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
-from app.api.deps import CurrentUserVLeague, SessionDep
+from app.api.deps import AsyncSessionDep, CurrentUserVLeague
 from app import crud
+from app.core.cache import season_json_response_async
 from app.models import PlayerStatsResponse, MatchStatsResponse, AwardsResponse, DisciplineResponse, MVPResponse
 
 router = APIRouter()
 
 
 @router.get("/players", response_model=PlayerStatsResponse)
-def get_player_stats(
+async def get_player_stats(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     current_user: CurrentUserVLeague,
     muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')")
 ) -> Any:
@@ -22,12 +24,15 @@ def get_player_stats(
     **Authentication required** - Any authenticated user can view stats.
     
     **Algorithm:**
-    - Computes from match events (`sukientrandau`)
+    - Reads `thongkecauthu`, updated whenever match events or lineups change
+      (built from match events (`sukientrandau`) on first request for a season)
     - Goals: `loaisukien = "BanThang"`
     - Assists: Count as `cauthulienquan` in goal events
     - Yellow cards: `loaisukien = "TheVang"`
     - Red cards: `loaisukien = "TheDo"`
     - Matches played: Distinct `matran` from `doihinhxuatphat`
+    - Response cached per season data version (any write to the season invalidates it)
+    - `ETag` / `Last-Modified` / `Cache-Control`; `If-None-Match` → 304
     
     **Handles:**
     - Returns empty list if season not found
@@ -46,21 +51,28 @@ def get_player_stats(
     GET /api/stats/players?muagiai=2024-2025
     ```
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
     try:
-        stats = crud.compute_player_stats(session=session, muagiai=muagiai)
+        return await season_json_response_async(
+            request,
+            "player_stats",
+            muagiai=muagiai,
+            marker=marker,
+            model=PlayerStatsResponse,
+            compute=lambda: crud.compute_player_stats_async(session=session, muagiai=muagiai)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute player statistics: {str(e)}"
         )
-    
-    return stats
 
 
 @router.get("/matches/{matran}", response_model=MatchStatsResponse)
-def get_match_stats(
+async def get_match_stats(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     current_user: CurrentUserVLeague,
     matran: str
 ) -> Any:
@@ -85,13 +97,26 @@ def get_match_stats(
     - `available`: True if stats available (partial or full)
     - `message`: Info message about data availability
     
+    Cached per season data version; `ETag` / `If-None-Match` → 304.
+    
     **Example:**
     ```
     GET /api/stats/matches/MT_V1_01
     ```
     """
+    marker = await crud.get_match_data_marker_async(session=session, matran=matran)
+    if marker is None:
+        raise HTTPException(status_code=404, detail=f"Match {matran} not found")
     try:
-        stats = crud.get_match_stats(session=session, matran=matran)
+        return await season_json_response_async(
+            request,
+            "match_stats",
+            muagiai=marker.muagiai,
+            marker=marker,
+            model=MatchStatsResponse,
+            compute=lambda: crud.get_match_stats_async(session=session, matran=matran),
+            matran=matran
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -99,14 +124,13 @@ def get_match_stats(
             status_code=500,
             detail=f"Failed to get match statistics: {str(e)}"
         )
-    
-    return stats
 
 
 @router.get("/awards", response_model=AwardsResponse)
-def get_awards(
+async def get_awards(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')"),
     limit: int = Query(10, ge=1, le=200, description="Max number to return (ties may exceed limit)")
 ) -> Any:
@@ -120,6 +144,8 @@ def get_awards(
     - Top assists: Count `cauthulienquan` in goal events
     - Returns top N with ties handled (if position N has ties, all tied players included)
     - Sorted by value DESC, player name ASC
+    - Response cached per season data version (any write to the season invalidates it)
+    - `ETag` / `Last-Modified` / `Cache-Control`; `If-None-Match` → 304
     
     **Event types:**
     - Uses canonical event type "BanThang" (no space)
@@ -142,21 +168,30 @@ def get_awards(
     GET /api/stats/awards?muagiai=2024-2025&limit=10
     ```
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
     try:
-        awards = crud.compute_awards(session=session, muagiai=muagiai, limit=limit)
+        return await season_json_response_async(
+            request,
+            "awards",
+            muagiai=muagiai,
+            marker=marker,
+            model=AwardsResponse,
+            compute=lambda: crud.compute_awards_async(session=session, muagiai=muagiai, limit=limit),
+            limit=limit,
+            public=True
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute awards: {str(e)}"
         )
-    
-    return awards
 
 
 @router.get("/discipline", response_model=DisciplineResponse)
-def get_discipline(
+async def get_discipline(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     current_user: CurrentUserVLeague,
     muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')"),
     limit: int = Query(50, ge=1, le=200, description="Max number to return (ties may exceed limit)")
@@ -173,6 +208,8 @@ def get_discipline(
     - Discipline points: yellow=1, second_yellow=2, red=3
     - Sorted by: discipline_points DESC, red_cards DESC, yellow_cards DESC, name ASC
     - Returns top N with ties (if position N has ties, all tied players included)
+    - Response cached per season data version (any write to the season invalidates it)
+    - `ETag` / `Last-Modified` / `Cache-Control`; `If-None-Match` → 304
     
     **Event types:**
     - Uses canonical event types "TheVang", "TheDo" (no space)
@@ -200,21 +237,29 @@ def get_discipline(
     GET /api/stats/discipline?muagiai=2024-2025&limit=50
     ```
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
     try:
-        discipline = crud.compute_discipline(session=session, muagiai=muagiai, limit=limit)
+        return await season_json_response_async(
+            request,
+            "discipline",
+            muagiai=muagiai,
+            marker=marker,
+            model=DisciplineResponse,
+            compute=lambda: crud.compute_discipline_async(session=session, muagiai=muagiai, limit=limit),
+            limit=limit
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute discipline statistics: {str(e)}"
         )
-    
-    return discipline
 
 
 @router.get("/mvp", response_model=MVPResponse)
-def get_mvp(
+async def get_mvp(
     *,
-    session: SessionDep,
+    session: AsyncSessionDep,
+    request: Request,
     muagiai: str = Query(..., description="Season ID (e.g., '2024-2025')"),
     limit: int = Query(10, ge=1, le=50, description="Max number of candidates to return")
 ) -> Any:
@@ -224,12 +269,12 @@ def get_mvp(
     **Public endpoint** - No authentication required.
     
     **Algorithm:**
-    - Calculates player rating based on:
-      - Goals: +3 points each
-      - Assists: +2 points each
-      - Matches played: +0.1 per match
-    - Rating normalized by matches played
-    - Sorted by rating DESC, goals DESC, assists DESC
+    - Counts Man of the Match awards (`loaisukien = "MVP"`) per player
+    - Reads `thongkecauthu` (same table as the other stats endpoints)
+    - Sorted by MVP awards DESC, player name ASC
+    - Goals, assists and matches played included for each candidate
+    - Response cached per season data version (any write to the season invalidates it)
+    - `ETag` / `Last-Modified` / `Cache-Control`; `If-None-Match` → 304
     
     **Query Parameters:**
     - `muagiai`: Season ID (required)
@@ -245,12 +290,20 @@ def get_mvp(
     GET /api/stats/mvp?muagiai=2024-2025&limit=10
     ```
     """
+    marker = await crud.get_season_data_marker_async(session=session, muagiai=muagiai)
     try:
-        mvp_data = crud.compute_mvp(session=session, muagiai=muagiai, limit=limit)
+        return await season_json_response_async(
+            request,
+            "mvp",
+            muagiai=muagiai,
+            marker=marker,
+            model=MVPResponse,
+            compute=lambda: crud.compute_mvp_async(session=session, muagiai=muagiai, limit=limit),
+            limit=limit,
+            public=True
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute MVP statistics: {str(e)}"
         )
-    
-    return mvp_data
@@ -0,0 +1,417 @@
+"""
+Response cache for public, read-mostly endpoints (standings, stats, schedule).
+
+Entries are keyed by the season data version (`muagiai.phienbandulieu`),
+which every CRUD mutator bumps in the same transaction as its write
+(see `crud.bump_season_data_version`). A write therefore makes all cached
+responses of that season unreachable at once - no TTL guesswork, and it works
+across API workers because the version lives in the database.
+
+Backends:
+- "memory": in-process LRU (default)
+- "redis":  any Redis-compatible server (`REDIS_URL`, needs the `redis` package)
+- "none":   caching disabled (counters still report misses)
+
+The same version also drives HTTP conditional requests: season_json_response()
+sets a weak ETag / Last-Modified / Cache-Control and answers If-None-Match
+with 304 before any aggregation runs.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Optional, Protocol
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "vleague"
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class NullCacheBackend:
+    """Stores nothing (CACHE_BACKEND=none)"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class LRUCacheBackend:
+    """
+    In-process LRU of serialized responses.
+
+    Outdated versions are never read again and age out of the LRU naturally.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis-compatible backend shared by all API workers.
+
+    Backend errors are logged and treated as misses: the cache must never
+    take a read endpoint down.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int) -> None:
+        import redis  # optional `redis` extra, only needed for CACHE_BACKEND=redis
+
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        try:
+            self._client.set(key, value, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    def clear(self) -> None:
+        try:
+            for key in self._client.scan_iter(match=f"{KEY_PREFIX}:*"):
+                self._client.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache clear failed: {e}")
+
+
+def make_backend() -> CacheBackend:
+    """Build the backend selected by settings.CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            raise ValueError("CACHE_BACKEND=redis requires REDIS_URL")
+        return RedisCacheBackend(settings.REDIS_URL, settings.CACHE_TTL_SECONDS)
+    if settings.CACHE_BACKEND == "none":
+        return NullCacheBackend()
+    return LRUCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+
+class ResponseCache:
+    """
+    Versioned cache of JSON response bodies with per-namespace hit/miss counters.
+
+    Usage in a route:
+        version = crud.get_season_data_version(session=session, muagiai=muagiai)
+        return response_cache.json_response(
+            "standings", muagiai=muagiai, version=version,
+            model=StandingsResponse,
+            compute=lambda: crud.compute_standings(session=session, muagiai=muagiai),
+        )
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._adapters: dict[Any, TypeAdapter] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(namespace: str, *, muagiai: str, version: int, **params: Any) -> str:
+        """vleague:{namespace}:{muagiai}:v{version}[:k=v...] (params sorted)"""
+        parts = [KEY_PREFIX, namespace, muagiai, f"v{version}"]
+        parts.extend(f"{k}={params[k]}" for k in sorted(params))
+        return ":".join(parts)
+
+    def count(self, namespace: str, outcome: str) -> None:
+        """Increment a counter ("hits", "misses" or "not_modified")"""
+        with self._lock:
+            counters = self._counters.setdefault(
+                namespace, {"hits": 0, "misses": 0, "not_modified": 0}
+            )
+            counters[outcome] += 1
+
+    def _adapter(self, model: Any) -> TypeAdapter:
+        adapter = self._adapters.get(model)
+        if adapter is None:
+            adapter = self._adapters[model] = TypeAdapter(model)
+        return adapter
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        *,
+        muagiai: str,
+        version: Optional[int],
+        model: Any,
+        compute: Callable[[], Any],
+        **params: Any,
+    ) -> bytes:
+        """
+        Serialized JSON body for (namespace, season, version, params).
+
+        `version` must be read BEFORE calling (see crud.get_season_data_version).
+        None (unknown season) bypasses the cache. Whatever `compute` returns
+        is cached until the next write to the season, so it must raise on
+        failure rather than return a fallback (nothing is stored then).
+        """
+        key, body = self._lookup(namespace, muagiai=muagiai, version=version, **params)
+        if body is None:
+            body = self._store(key, model, compute())
+        return body
+
+    async def get_or_compute_async(
+        self,
+        namespace: str,
+        *,
+        muagiai: str,
+        version: Optional[int],
+        model: Any,
+        compute: Callable[[], Awaitable[Any]],
+        **params: Any,
+    ) -> bytes:
+        """get_or_compute() for async routes (`compute` is awaited)"""
+        key, body = self._lookup(namespace, muagiai=muagiai, version=version, **params)
+        if body is None:
+            body = self._store(key, model, await compute())
+        return body
+
+    def _lookup(
+        self, namespace: str, *, muagiai: str, version: Optional[int], **params: Any
+    ) -> tuple[Optional[str], Optional[bytes]]:
+        """(key, cached body) - key None when uncacheable, body None on miss"""
+        key = None
+        if version is not None:
+            key = self.make_key(namespace, muagiai=muagiai, version=version, **params)
+            body = self.backend.get(key)
+            if body is not None:
+                self.count(namespace, "hits")
+                return key, body
+        self.count(namespace, "misses")
+        return key, None
+
+    def _store(self, key: Optional[str], model: Any, value: Any) -> bytes:
+        adapter = self._adapter(model)
+        with span("serialize", model=getattr(model, "__name__", str(model))):
+            body = adapter.dump_json(adapter.validate_python(value), by_alias=True)
+        if key is not None:
+            self.backend.set(key, body)
+        return body
+
+    def json_response(self, namespace: str, **kwargs: Any) -> Response:
+        """get_or_compute() wrapped in a JSON Response (skips re-serialization)"""
+        body = self.get_or_compute(namespace, **kwargs)
+        return Response(content=body, media_type="application/json")
+
+    async def json_response_async(self, namespace: str, **kwargs: Any) -> Response:
+        """get_or_compute_async() wrapped in a JSON Response"""
+        body = await self.get_or_compute_async(namespace, **kwargs)
+        return Response(content=body, media_type="application/json")
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss/304 counters per namespace (for monitoring)"""
+        with self._lock:
+            namespaces = {
+                namespace: {
+                    **counters,
+                    "hit_ratio": (
+                        counters["hits"] / (counters["hits"] + counters["misses"])
+                        if counters["hits"] + counters["misses"] else 0.0
+                    ),
+                }
+                for namespace, counters in self._counters.items()
+            }
+        result: dict[str, Any] = {
+            "backend": type(self.backend).__name__,
+            "hits": sum(c["hits"] for c in namespaces.values()),
+            "misses": sum(c["misses"] for c in namespaces.values()),
+            "not_modified": sum(c["not_modified"] for c in namespaces.values()),
+            "namespaces": namespaces,
+        }
+        if isinstance(self.backend, LRUCacheBackend):
+            result["entries"] = len(self.backend)
+            result["max_entries"] = self.backend.max_entries
+        return result
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.reset_stats()
+
+
+response_cache = ResponseCache(make_backend())
+
+
+# =============================================
+# HTTP CONDITIONAL REQUESTS (ETag / Last-Modified)
+# =============================================
+
+def make_etag(key: str) -> str:
+    """
+    Weak ETag for a cache key.
+    
+    Weak because bodies of the same version may differ byte-wise
+    (e.g. `generated_at`), but are semantically equivalent.
+    """
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def validator_headers(
+    *, etag: str, last_modified: Optional[datetime], public: bool
+) -> dict[str, str]:
+    """ETag, Last-Modified (naive datetimes are UTC) and Cache-Control headers"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}" if public
+            else "private, no-cache"
+        ),
+    }
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+
+def season_json_response(
+    request: Request,
+    namespace: str,
+    *,
+    muagiai: str,
+    marker: Optional[Any],
+    model: Any,
+    compute: Callable[[], Any],
+    public: bool = False,
+    **params: Any,
+) -> Response:
+    """
+    Cached JSON response for season-scoped GET routes, with conditional GET.
+    
+    `marker` is the row from crud.get_season_data_marker() (or
+    get_match_data_marker()), read BEFORE computing. If the client's
+    If-None-Match matches, 304 is returned without calling `compute`.
+    `public` routes get a shared Cache-Control (CDN-cacheable); routes
+    requiring authentication get `private, no-cache`.
+    Unknown season (marker None): no validators, nothing cached.
+    """
+    headers, not_modified = _check_conditional(request, namespace, marker, public, params)
+    if not_modified is not None:
+        return not_modified
+    
+    response = response_cache.json_response(
+        namespace,
+        muagiai=marker.muagiai if marker is not None else muagiai,
+        version=marker.phienbandulieu if marker is not None else None,
+        model=model,
+        compute=compute,
+        **params,
+    )
+    response.headers.update(headers)
+    return response
+
+
+async def season_json_response_async(
+    request: Request,
+    namespace: str,
+    *,
+    muagiai: str,
+    marker: Optional[Any],
+    model: Any,
+    compute: Callable[[], Awaitable[Any]],
+    public: bool = False,
+    **params: Any,
+) -> Response:
+    """season_json_response() for async routes (`compute` is awaited)"""
+    headers, not_modified = _check_conditional(request, namespace, marker, public, params)
+    if not_modified is not None:
+        return not_modified
+    
+    response = await response_cache.json_response_async(
+        namespace,
+        muagiai=marker.muagiai if marker is not None else muagiai,
+        version=marker.phienbandulieu if marker is not None else None,
+        model=model,
+        compute=compute,
+        **params,
+    )
+    response.headers.update(headers)
+    return response
+
+
+def _check_conditional(
+    request: Request,
+    namespace: str,
+    marker: Optional[Any],
+    public: bool,
+    params: dict[str, Any],
+) -> tuple[dict[str, str], Optional[Response]]:
+    """(validator headers, 304 response if If-None-Match matches)"""
+    if marker is None:
+        return {}, None
+    
+    key = ResponseCache.make_key(
+        namespace, muagiai=marker.muagiai, version=marker.phienbandulieu, **params
+    )
+    headers = validator_headers(
+        etag=make_etag(key), last_modified=marker.capnhatdulieu, public=public
+    )
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        response_cache.count(namespace, "not_modified")
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
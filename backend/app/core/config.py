@@ -60,8 +60,86 @@ class Settings(BaseSettings):
     POSTGRESQL_DB: str
     POSTGRESQL_SSLMODE: str = "disable"  # For Azure: "require" or "enable"
     
+    # Connection pool (per engine: the sync and async engines each get one)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; drops connections idle across failovers
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 = server default
+    # Transaction pooling (pgbouncer / Azure built-in pgbouncer): disables
+    # server-side prepared statements
+    DB_PGBOUNCER_MODE: bool = False
+
     # JWT Settings
     ALGORITHM: str = "HS256"
+    # Embed the role (tennhom + manhom) in access tokens: a principal cache
+    # miss then loads only the account row, not the group
+    JWT_ROLE_CLAIM: bool = False
+
+    # Password hashing (bcrypt). Changing BCRYPT_ROUNDS rehashes each
+    # account on its next successful login.
+    BCRYPT_ROUNDS: int = 12
+    # Login/signup hashing runs in a process pool so bursts don't starve the
+    # API threadpool; 0 workers hashes inline (scripts, tests).
+    PASSWORD_HASH_WORKERS: int = 2
+    # Hash jobs queued or running beyond this are rejected (HTTP 503)
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Authenticated-principal cache (user id, active flag, role per token
+    # subject, per API worker). TTL bounds how long another worker may keep
+    # serving a changed account/role; 0 disables the cache.
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Standings (re)build: "sql" aggregates in PostgreSQL (GROUP BY over
+    # home/away UNION ALL), "python" parses matches in the API process.
+    # Non-PostgreSQL databases always use "python".
+    STANDINGS_COMPUTE_MODE: Literal["sql", "python"] = "sql"
+
+    # Response cache for public read endpoints (standings, stats, schedule).
+    # Entries are keyed by the season data version, so TTL is only a memory
+    # bound for Redis, not an invalidation mechanism.
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    REDIS_URL: str | None = None
+    # Cache-Control max-age for public season-scoped GETs (lets a CDN absorb
+    # polling); clients revalidate with If-None-Match after that.
+    HTTP_CACHE_MAX_AGE: int = 5
+
+    # Live push (WebSocket/SSE) of match deltas. "redis" relays through
+    # REDIS_URL pub/sub so every API worker reaches its own subscribers.
+    LIVE_BROKER: Literal["memory", "redis"] = "memory"
+    LIVE_QUEUE_SIZE: int = 100
+    LIVE_HEARTBEAT_SECONDS: int = 15
+
+    # Request query profiler (app.core.profiler), opt-in: per-request query
+    # count, DB time and repeated statement shapes (N+1), reported as a
+    # Server-Timing header and one log line per request.
+    QUERY_PROFILER_ENABLED: bool = False
+    # A statement shape run this many times in one request is logged as repeated
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = 5
+    # Max statements per route, e.g. {"GET /api/clubs/": 1}; exceeding it logs
+    # a warning, or fails the request in strict mode (tests/CI)
+    QUERY_BUDGETS: dict[str, int] = {}
+    QUERY_PROFILER_STRICT: bool = False
+
+    # Prometheus metrics at GET /metrics (app.core.metrics): request latency
+    # by route, in-flight requests, computation timings, pool/cache counters
+    METRICS_ENABLED: bool = True
+
+    # OpenTelemetry tracing (app.core.tracing), opt-in; needs opentelemetry-sdk
+    # (and opentelemetry-exporter-otlp for "otlp"). Spans per request, crud
+    # call and SQL statement.
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: Literal["otlp", "console", "file"] = "otlp"
+    # OTLP/HTTP traces endpoint, e.g. http://collector:4318/v1/traces
+    # (None: OTEL_EXPORTER_OTLP_* environment variables / localhost)
+    TRACING_OTLP_ENDPOINT: str | None = None
+    TRACING_FILE: str = "traces.jsonl"
+    # Fraction of new traces recorded; keep it low in production (e.g. 0.05)
+    TRACING_SAMPLE_RATIO: float = 1.0
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -1,13 +1,21 @@
 from pathlib import Path
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine, text
 import logging
 
 from app.core.config import settings
+from app.core.pool import engine_options
 
 logger = logging.getLogger(__name__)
 
-# Create database engine
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+# Create database engine (pool sizing / pgbouncer mode: see app.core.pool)
+engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI), **engine_options())
+
+# Async engine for async read routes (same URL: psycopg 3 selects its
+# asyncio driver automatically under create_async_engine)
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI), **engine_options(is_async=True)
+)
 
 
 # Note: Tables should be created with Alembic migrations
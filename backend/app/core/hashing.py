@@ -0,0 +1,175 @@
+"""
+Password hashing service: bcrypt off the API threadpool.
+
+bcrypt is deliberately slow (~0.25 s of CPU at cost 12). Run inline in a
+sync route, a burst of logins (match kickoff, new-season signups) occupies
+every threadpool thread and unrelated requests queue behind it. Here hashing
+and verification run in a dedicated process pool:
+
+- `PASSWORD_HASH_WORKERS` processes bound the CPU spent on hashing
+- `PASSWORD_HASH_MAX_PENDING` bounds the queue: beyond it, jobs are rejected
+  with HashingOverloadedError (routes answer 503 + Retry-After) instead of
+  letting login latency grow without limit
+- async routes await the pool, so a waiting login holds no thread at all
+
+verify_and_update() also returns a replacement hash when the stored one was
+made with another cost than `BCRYPT_ROUNDS` (rehash-on-login).
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+
+class HashingOverloadedError(Exception):
+    """Too many hash jobs pending (see PASSWORD_HASH_MAX_PENDING)"""
+
+
+# ---------------------------------------------
+# Worker functions (run in the pool processes)
+# ---------------------------------------------
+
+@lru_cache
+def _context(rounds: int) -> CryptContext:
+    # Imported here so worker processes apply the bcrypt compatibility
+    # patches from app.core.security before hashing
+    from app.core.security import make_crypt_context
+
+    return make_crypt_context(rounds)
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> tuple[bool, Optional[str]]:
+    try:
+        return _context(rounds).verify_and_update(password, hashed)
+    except ValueError:
+        # Not a recognized hash (e.g. legacy plaintext row): never matches
+        return False, None
+
+
+# ---------------------------------------------
+# Service
+# ---------------------------------------------
+
+class PasswordHasher:
+    """Process-pool bcrypt with a bounded queue (thread- and asyncio-safe)"""
+
+    def __init__(self, *, workers: int, max_pending: int, rounds: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.pending_max = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.seconds_total = 0.0
+
+    # Lifecycle
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: workers must not inherit the API's threads and sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # Submission
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingOverloadedError(
+                    f"{self.pending} password hash jobs pending (limit {self.max_pending})"
+                )
+            self.pending += 1
+            self.pending_max = max(self.pending_max, self.pending)
+            started = time.perf_counter()
+
+        def done(_: Future) -> None:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+                self.seconds_total += time.perf_counter() - started
+
+        if self.workers <= 0:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        else:
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except BaseException:
+                with self._lock:
+                    self.pending -= 1
+                raise
+        future.add_done_callback(done)
+        return future
+
+    def hash(self, password: str) -> str:
+        return self._submit(_hash, password, self.rounds).result()
+
+    def verify_and_update(self, password: str, hashed: str) -> tuple[bool, Optional[str]]:
+        """(matches, new hash if the stored one must be replaced)"""
+        return self._count_rehash(
+            self._submit(_verify_and_update, password, hashed, self.rounds).result()
+        )
+
+    async def hash_async(self, password: str) -> str:
+        return await asyncio.wrap_future(self._submit(_hash, password, self.rounds))
+
+    async def verify_and_update_async(
+        self, password: str, hashed: str
+    ) -> tuple[bool, Optional[str]]:
+        future = self._submit(_verify_and_update, password, hashed, self.rounds)
+        return self._count_rehash(await asyncio.wrap_future(future))
+
+    def _count_rehash(self, result: tuple[bool, Optional[str]]) -> tuple[bool, Optional[str]]:
+        if result[1] is not None:
+            with self._lock:
+                self.rehashed += 1
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "pending_max": self.pending_max,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_seconds": self.seconds_total / self.completed if self.completed else 0.0,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    rounds=settings.BCRYPT_ROUNDS,
+)
@@ -0,0 +1,278 @@
+"""
+Live push hub: match/season deltas to WebSocket and SSE subscribers.
+
+CRUD mutators publish compact deltas after commit (see crud._publish_live).
+Each message is serialized ONCE and the same string is queued for every
+subscriber of the channel, so N viewers cost one fan-out instead of N polls.
+
+Channels:
+- "match:{matran}"   deltas of one match
+- "season:{muagiai}" deltas of every match in the season
+
+Brokers:
+- "memory": in-process only (single API worker)
+- "redis":  messages go through Redis pub/sub so every worker fans out to
+            its own subscribers (`REDIS_URL`, needs the `redis` package)
+
+Publishing never blocks the caller (a CRUD write): with Redis, messages go
+through a bounded outbox drained by one task on the event loop, with short
+socket timeouts, so a stalled broker delays or drops live deltas but never
+match writes.
+
+Slow subscribers never block publishers: when a subscriber's queue is full
+its backlog is replaced by a single {"type": "resync"} message, and the
+client refetches (cheap with ETag / If-None-Match). Subscribers also get a
+resync when the Redis listener reconnects (messages published while it was
+down are lost).
+"""
+import asyncio
+import contextlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BROKER_PREFIX = "vleague:live:"
+RESYNC = json.dumps({"type": "resync"})
+# Backoff of the Redis listener's reconnects (doubles up to the max)
+BROKER_RETRY_MIN_SECONDS = 0.5
+BROKER_RETRY_MAX_SECONDS = 30.0
+# Redis socket timeouts (connect; publish commands)
+BROKER_TIMEOUT_SECONDS = 2.0
+# Messages waiting for the broker; more are dropped while Redis is stalled
+BROKER_OUTBOX_SIZE = 1000
+
+
+def match_channel(matran: str) -> str:
+    return f"match:{matran}"
+
+
+def season_channel(muagiai: str) -> str:
+    return f"season:{muagiai}"
+
+
+class Subscription:
+    """Bounded queue of serialized messages for one connected client"""
+
+    def __init__(self, channel: str, maxsize: int) -> None:
+        self.channel = channel
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+
+    def push(self, payload: str) -> None:
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Client is lagging: drop its backlog, ask it to refetch
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Next message, or None after `timeout` seconds (heartbeat)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LiveHub:
+    """
+    In-process pub/sub with an optional broker.
+
+    publish() may be called from any thread (sync routes run CRUD in the
+    threadpool); fan-out always runs on the event loop thread.
+    """
+
+    def __init__(self, broker: str = "memory", queue_size: int = 100) -> None:
+        self.broker = broker
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis: Any = None
+        self._outbox: Optional[asyncio.Queue[tuple[list[str], str]]] = None
+        self._sender: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._broker_up = False
+        self.published = 0
+        self.delivered = 0
+        self.broker_connections = 0
+        self.broker_dropped = 0
+
+    # ---------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if self.broker == "redis":
+            if not settings.REDIS_URL:
+                raise ValueError("LIVE_BROKER=redis requires REDIS_URL")
+            # optional `redis` extra, only needed for LIVE_BROKER=redis
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=BROKER_TIMEOUT_SECONDS,
+                socket_connect_timeout=BROKER_TIMEOUT_SECONDS,
+            )
+            self._outbox = asyncio.Queue(maxsize=BROKER_OUTBOX_SIZE)
+            self._sender = asyncio.create_task(self._send())
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        for task in (self._sender, self._listener):
+            if task:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._sender = self._listener = None
+        self._outbox = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        self._loop = None
+
+    async def _send(self) -> None:
+        """Publish outbox messages to Redis, in order, until cancelled"""
+        assert self._outbox is not None
+        while True:
+            channels, payload = await self._outbox.get()
+            try:
+                for channel in channels:
+                    await self._redis.publish(f"{BROKER_PREFIX}{channel}", payload)
+            except Exception as e:
+                logger.warning(f"Live publish failed for {channels}: {e!r}")
+
+    async def _listen(self) -> None:
+        """
+        Relay broker messages until cancelled, reconnecting with
+        exponential backoff when Redis fails (restart, network blip).
+        """
+        delay = BROKER_RETRY_MIN_SECONDS
+        while True:
+            try:
+                await self._relay()
+                logger.warning("Live broker connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Live broker listener failed ({e!r}), reconnecting in {delay:.1f}s")
+            if self._broker_up:
+                # Was connected: the first retry is immediate-ish again
+                delay = BROKER_RETRY_MIN_SECONDS
+                self._broker_up = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BROKER_RETRY_MAX_SECONDS)
+
+    async def _relay(self) -> None:
+        """One broker connection: relay its messages to this worker's subscribers"""
+        import redis.asyncio as aioredis
+
+        # No socket_timeout: the subscription is idle between messages
+        client = aioredis.from_url(
+            settings.REDIS_URL, socket_connect_timeout=BROKER_TIMEOUT_SECONDS
+        )
+        pubsub = client.pubsub()
+        try:
+            await pubsub.psubscribe(f"{BROKER_PREFIX}*")
+            self._connected()
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                channel = message["channel"].decode().removeprefix(BROKER_PREFIX)
+                self._fan_out(channel, message["data"].decode())
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+    def _connected(self) -> None:
+        self._broker_up = True
+        self.broker_connections += 1
+        if self.broker_connections > 1:
+            logger.info("Live broker reconnected")
+            # Deltas published while disconnected are lost: clients refetch
+            for channel in list(self._subscribers):
+                self._fan_out(channel, RESYNC)
+
+    # ---------------------------------------------
+    # Subscribe / publish
+    # ---------------------------------------------
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Register a subscriber (call from the event loop)"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        subscription = Subscription(channel, self.queue_size)
+        self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.channel)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.channel]
+
+    def subscriber_count(self, channel: Optional[str] = None) -> int:
+        if channel is not None:
+            return len(self._subscribers.get(channel, ()))
+        return sum(len(s) for s in self._subscribers.values())
+
+    def publish(self, channels: list[str], message: dict[str, Any]) -> None:
+        """
+        Publish one message to several channels (thread-safe, never raises
+        or blocks: the Redis round trip happens later, on the event loop).
+
+        PERF: Returns before serializing when nobody in this worker listens
+        (memory broker), so writes pay nothing without live viewers.
+        """
+        if self.broker != "redis" and not any(c in self._subscribers for c in channels):
+            return
+        try:
+            payload = json.dumps(message, default=_json_default, separators=(",", ":"))
+            self.published += 1
+            if self._outbox is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(self._enqueue, channels, payload)
+            elif self._loop is not None:
+                for channel in channels:
+                    self._loop.call_soon_threadsafe(self._fan_out, channel, payload)
+        except Exception as e:
+            logger.warning(f"Live publish failed for {channels}: {e}")
+
+    def _enqueue(self, channels: list[str], payload: str) -> None:
+        if self._outbox is None:
+            return
+        try:
+            self._outbox.put_nowait((channels, payload))
+        except asyncio.QueueFull:
+            self.broker_dropped += 1
+            logger.warning(f"Live broker outbox full, dropped a message for {channels}")
+
+    def _fan_out(self, channel: str, payload: str) -> None:
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.push(payload)
+            self.delivered += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "broker": self.broker,
+            "channels": len(self._subscribers),
+            "subscribers": self.subscriber_count(),
+            "published": self.published,
+            "delivered": self.delivered,
+            "broker_connections": self.broker_connections,
+            "broker_dropped": self.broker_dropped,
+        }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+live_hub = LiveHub(broker=settings.LIVE_BROKER, queue_size=settings.LIVE_QUEUE_SIZE)
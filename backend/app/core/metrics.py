@@ -0,0 +1,292 @@
+"""
+Prometheus metrics: text exposition at `GET /metrics`, no client library
+or collector needed (scrape it, or read it with curl).
+
+Recorded in process:
+- vleague_http_request_duration_seconds{method, route, status}: latency
+  histogram per route template ("/api/matches/{matran}", not the raw path;
+  unmatched paths are "unmatched"), recorded by MetricsMiddleware
+- vleague_http_requests_in_flight{method}: requests being served now
+- vleague_operation_duration_seconds{operation}: expensive computations
+  (standings, player stats, awards, discipline, schedule generation),
+  timed by the `timed()` decorator on the CRUD functions (sync and async)
+
+Collected at scrape time from the existing counters (same numbers as
+`/api/monitoring/*`):
+- DB pools (app.core.pool): size, in use, idle, overflow, checkouts,
+  timeouts, checkout wait
+- response cache (app.core.cache) per namespace and the principal cache
+  (app.core.principal): hits, misses, hit ratio
+- password hashing pool (app.core.hashing): pending, completed, rejected
+
+Metrics are per API worker process, like the other monitoring counters.
+"""
+import functools
+import inspect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, TypeVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.core.db import async_engine, engine
+from app.core.hashing import password_hasher
+from app.core.pool import async_pool_stats, pool_stats, sync_pool_stats
+from app.core.principal import principal_cache
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram per label set (thread-safe)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * len(self.buckets) + [0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+                    break
+            series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0
+            # series: one count per bucket, then the sum
+            for bound, count in zip(self.buckets, series[:-1], strict=True):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Gauge:
+    """Up/down value per label set (thread-safe)"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            snapshot = dict(self._values)
+        for labels, value in sorted(snapshot.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+def _family(
+    name: str, kind: str, documentation: str, samples: Iterable[tuple[dict[str, str], float]]
+) -> list[str]:
+    """Render a metric family from (labels, value) samples read at scrape time"""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(list(labels), list(labels.values()))} {_number(value)}")
+    return lines
+
+
+request_duration = Histogram(
+    "vleague_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+requests_in_flight = Gauge(
+    "vleague_http_requests_in_flight",
+    "HTTP requests being served",
+    ("method",),
+)
+operation_duration = Histogram(
+    "vleague_operation_duration_seconds",
+    "Duration of expensive computations (standings, stats, schedule generation)",
+    ("operation",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+def timed(operation: str) -> Callable[[F], F]:
+    """Record each call of the decorated (sync or async) function in operation_duration"""
+
+    def decorate(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    operation_duration.observe(time.perf_counter() - started, operation)
+
+            return timed_async  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def timed_sync(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                operation_duration.observe(time.perf_counter() - started, operation)
+
+        return timed_sync  # type: ignore[return-value]
+
+    return decorate
+
+
+def _pool_families() -> list[str]:
+    pools = {
+        "sync": pool_stats(engine, sync_pool_stats),
+        "async": pool_stats(async_engine, async_pool_stats),
+    }
+    lines: list[str] = []
+    for key, name, kind, documentation in [
+        ("size", "vleague_db_pool_size", "gauge", "Configured pool size"),
+        ("in_use", "vleague_db_pool_in_use", "gauge", "Connections checked out"),
+        ("idle", "vleague_db_pool_idle", "gauge", "Connections idle in the pool"),
+        ("overflow", "vleague_db_pool_overflow", "gauge", "Connections open beyond the pool size"),
+        ("checkouts", "vleague_db_pool_checkouts_total", "counter", "Connections handed out"),
+        ("timeouts", "vleague_db_pool_timeouts_total", "counter", "Checkouts that timed out"),
+        (
+            "wait_seconds_total", "vleague_db_pool_wait_seconds_total", "counter",
+            "Time spent waiting for a free connection",
+        ),
+    ]:
+        lines += _family(
+            name, kind, documentation,
+            [({"engine": engine_name}, stats[key]) for engine_name, stats in pools.items()],
+        )
+    return lines
+
+
+def _cache_families() -> list[str]:
+    caches = {
+        f"response:{namespace}": counters
+        for namespace, counters in response_cache.stats()["namespaces"].items()
+    }
+    caches["principal"] = principal_cache.stats()
+    lines: list[str] = []
+    for key, kind, documentation in [
+        ("hits", "counter", "Cache hits"),
+        ("misses", "counter", "Cache misses"),
+        ("hit_ratio", "gauge", "Cache hits / (hits + misses)"),
+    ]:
+        name = f"vleague_cache_{key}" + ("_total" if kind == "counter" else "")
+        lines += _family(
+            name, kind, documentation,
+            [({"cache": cache}, counters[key]) for cache, counters in sorted(caches.items())],
+        )
+    return lines
+
+
+def _hashing_families() -> list[str]:
+    stats = password_hasher.stats()
+    lines: list[str] = []
+    for key, name, kind, documentation in [
+        ("pending", "vleague_password_hash_pending", "gauge", "Hash jobs queued or running"),
+        ("completed", "vleague_password_hash_completed_total", "counter", "Hash jobs completed"),
+        ("rejected", "vleague_password_hash_rejected_total", "counter", "Hash jobs rejected (queue full)"),
+    ]:
+        lines += _family(name, kind, documentation, [({}, stats[key])])
+    return lines
+
+
+def render() -> str:
+    """All metrics in the Prometheus text format"""
+    lines = request_duration.render() + requests_in_flight.render() + operation_duration.render()
+    for collect in (_pool_families, _cache_families, _hashing_families):
+        lines += collect()
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware: request latency by route template and in-flight requests"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        requests_in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight.dec(method)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            request_duration.observe(time.perf_counter() - started, method, route, str(status))
@@ -0,0 +1,68 @@
+"""
+Keyset (cursor) pagination helpers.
+
+`offset(skip)` makes the database read and discard every skipped row, so
+deep pages get slower, and rows inserted mid-scroll shift the pages. Listing
+endpoints instead accept an opaque `cursor`: the sort-key values of the
+last row already seen. The next page is `WHERE (sort keys) > cursor ORDER BY
+sort keys LIMIT n` - an index range scan whatever the depth.
+
+- every listing has a total order ending in its primary key (see crud)
+- a full page sets the `X-Next-Cursor` response header (in offset mode too,
+  so a client can switch after the first page); no header = last page
+- cursors are URL-safe base64 JSON: opaque to clients, not a security
+  boundary (a forged cursor only moves the page start)
+"""
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> tuple:
+    """
+    Sort-key values from a cursor, converted to `types` (str, int or datetime).
+
+    Raises HTTPException 400 if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("wrong arity")
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload, strict=True)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def check_mode(*, skip: int, cursor: Optional[str]) -> None:
+    """Offset and cursor pagination are exclusive (400 if both are used)"""
+    if cursor is not None and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+
+
+def set_next_cursor(
+    response: Response,
+    rows: Sequence[Any],
+    *,
+    limit: int,
+    key: Callable[[Any], Sequence[Any]],
+) -> None:
+    """Set X-Next-Cursor from the last row when the page is full"""
+    if limit and len(rows) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(key(rows[-1]))
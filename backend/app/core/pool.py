@@ -0,0 +1,134 @@
+"""
+Database connection pool: engine options from settings and pool metrics.
+
+Options (see Settings.DB_*):
+- pool size / max overflow / checkout timeout / recycle / pre-ping
+- statement timeout, sent as a startup option (`-c statement_timeout=...`)
+- pgbouncer (transaction pooling) mode: psycopg server-side prepared
+  statements are disabled (`prepare_threshold=None`), since a prepared
+  statement lives on one server connection and the next transaction may run
+  on another
+
+Metrics: each engine gets a timed subclass of its queue pool that measures
+how long checkouts wait for a free connection (and counts timeouts), next to
+the pool's own in-use / idle / overflow counts. Exposed by
+`GET /monitoring/db`.
+"""
+import logging
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Checkout wait counters for one engine's pool (thread-safe)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": (
+                round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0
+            ),
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                in_use=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return stats
+
+
+class _TimedPoolMixin:
+    """Times Pool._do_get(): the wait for a free (or new) connection"""
+
+    stats: PoolStats
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return connection
+
+
+def timed_pool_class(base: type[QueuePool], stats: PoolStats) -> type[QueuePool]:
+    """
+    `base` subclass reporting to `stats`.
+
+    The stats live on the class (not the instance) so they survive
+    Pool.recreate() after a disconnect/invalidate.
+    """
+    return type(f"Timed{base.__name__}", (_TimedPoolMixin, base), {"stats": stats})
+
+
+sync_pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+
+def engine_options(*, is_async: bool = False) -> dict[str, Any]:
+    """create_engine()/create_async_engine() keyword arguments from settings"""
+    connect_args: dict[str, Any] = {}
+    if settings.DB_PGBOUNCER_MODE:
+        connect_args["prepare_threshold"] = None
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            # pgbouncer rejects the `options` startup parameter
+            logger.warning(
+                "DB_STATEMENT_TIMEOUT_MS is ignored in pgbouncer mode; "
+                "set statement_timeout on the database role instead"
+            )
+    elif settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    if is_async:
+        poolclass = timed_pool_class(AsyncAdaptedQueuePool, async_pool_stats)
+    else:
+        poolclass = timed_pool_class(QueuePool, sync_pool_stats)
+
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def pool_stats(engine: Any, stats: PoolStats) -> dict[str, Any]:
+    """Snapshot of `engine`'s pool (sync Engine or AsyncEngine)"""
+    return stats.snapshot(engine.pool)
@@ -0,0 +1,183 @@
+"""
+Authenticated-principal cache: token subject -> user id, active flag, role.
+
+Without it every authenticated request loads `taikhoan` (deps) and then
+`nhomnguoidung` (require_role / get_user_role). With it, authorization on
+the hot path costs no query: the principal is resolved once per TTL window
+per API worker.
+
+Invalidation:
+- Any ORM update/delete of a TaiKhoan drops that user's entry; any change
+  to a NhomNguoiDung clears the cache (mapper events below, so every writer
+  is covered, not just the auth routes). Changes are collected at flush and
+  applied after commit: a request between flush and commit would otherwise
+  re-cache the old row for a whole TTL. Rolled-back changes drop nothing.
+- Entries expire after AUTH_PRINCIPAL_CACHE_TTL_SECONDS, which bounds
+  staleness in the other API workers (the cache is per process).
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.models import NhomNguoiDung, TaiKhoan
+
+
+@dataclass(frozen=True)
+class Principal:
+    """What authorization needs about a user (no password hash)"""
+
+    mataikhoan: int
+    tendangnhap: str
+    hoten: Optional[str]
+    email: Optional[str]
+    manhom: Optional[int]
+    isactive: bool
+    role: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: TaiKhoan, role: Optional[str]) -> "Principal":
+        return cls(
+            mataikhoan=user.mataikhoan,
+            tendangnhap=user.tendangnhap,
+            hoten=user.hoten,
+            email=user.email,
+            manhom=user.manhom,
+            isactive=user.isactive,
+            role=role,
+        )
+
+    def to_user(self) -> TaiKhoan:
+        """
+        Detached TaiKhoan snapshot for routes typed on `TaiKhoan`.
+
+        `nhom.tennhom` is the cached role. Attributes that are not cached
+        (matkhau, createdat, updatedat) are left unloaded: they load from the
+        database if the object is attached to a session, and raise otherwise.
+        """
+        user = TaiKhoan(
+            mataikhoan=self.mataikhoan,
+            tendangnhap=self.tendangnhap,
+            hoten=self.hoten,
+            email=self.email,
+            manhom=self.manhom,
+            isactive=self.isactive,
+        )
+        for attr in ("matkhau", "createdat", "updatedat"):
+            user.__dict__.pop(attr, None)
+        nhom = None
+        if self.manhom is not None and self.role is not None:
+            nhom = NhomNguoiDung(manhom=self.manhom, tennhom=self.role)
+            make_transient_to_detached(nhom)
+        set_committed_value(user, "nhom", nhom)
+        make_transient_to_detached(user)
+        return user
+
+
+class PrincipalCache:
+    """Bounded LRU of principals with a per-entry TTL (thread-safe)"""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, subject: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, subject: str, principal: Principal) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, subject: Any) -> None:
+        with self._lock:
+            self._entries.pop(str(subject), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+# session.info key: subjects to drop after commit (ALL_PRINCIPALS clears)
+_PENDING = "principal_cache_invalidations"
+ALL_PRINCIPALS = "*"
+
+
+def _invalidate_after_commit(target: Any, subject: str) -> None:
+    session = object_session(target)
+    if session is None:
+        principal_cache.invalidate(subject)
+        return
+    session.info.setdefault(_PENDING, set()).add(subject)
+
+
+@event.listens_for(TaiKhoan, "after_update")
+@event.listens_for(TaiKhoan, "after_delete")
+def _invalidate_user(mapper: Any, connection: Any, target: TaiKhoan) -> None:  # noqa: ARG001
+    _invalidate_after_commit(target, str(target.mataikhoan))
+
+
+@event.listens_for(NhomNguoiDung, "after_update")
+@event.listens_for(NhomNguoiDung, "after_delete")
+def _invalidate_group(mapper: Any, connection: Any, target: NhomNguoiDung) -> None:  # noqa: ARG001
+    _invalidate_after_commit(target, ALL_PRINCIPALS)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session: Session) -> None:
+    subjects = session.info.pop(_PENDING, None)
+    if not subjects:
+        return
+    if ALL_PRINCIPALS in subjects:
+        principal_cache.clear()
+        return
+    for subject in subjects:
+        principal_cache.invalidate(subject)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING, None)
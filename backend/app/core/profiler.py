@@ -0,0 +1,204 @@
+"""
+Request-scoped query profiler and N+1 detector (opt-in: QUERY_PROFILER_ENABLED).
+
+Per HTTP request it records, from SQLAlchemy's cursor events on every
+engine (sync, async, test engines):
+
+- the number of statements and the total time spent in them
+- statement shapes (SQL with bind values and IN lists collapsed): a shape
+  run QUERY_PROFILER_REPEAT_THRESHOLD times or more in one request is
+  reported as repeated, the usual sign of a per-row lookup (N+1)
+
+and reports them as a `Server-Timing` response header
+(`db;dur=12.4;desc="7 queries", app;dur=20.1`) and one JSON log line
+(WARNING when a shape repeats or the route's query budget is exceeded).
+
+Budgets: QUERY_BUDGETS maps "METHOD /route/template" to a maximum number of
+statements. With QUERY_PROFILER_STRICT (tests/CI) a request over budget
+raises QueryBudgetExceeded instead of only logging it.
+
+Outside requests (scripts, tests), `profiling()` profiles a block:
+
+    with profiling() as profile:
+        crud.compute_standings(session=session, muagiai=muagiai)
+    profile.queries, profile.repeated()
+
+Disabled, the middleware passes requests straight through and no engine
+listener is installed.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+_STARTED = "_query_profiler_started"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements than its route's budget (strict mode)"""
+
+
+def statement_shape(statement: str) -> str:
+    """SQL with bind parameters replaced by ? and IN lists collapsed to ?..."""
+    shape = _BIND_PARAMETER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAMETER_LIST.sub("?...", shape)
+
+
+@dataclass
+class QueryProfile:
+    method: str = ""
+    path: str = ""
+    route: Optional[str] = None
+    queries: int = 0
+    db_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def key(self) -> str:
+        """Budget key: "METHOD /route/template" (the raw path if unrouted)"""
+        return f"{self.method} {self.route or self.path}"
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: Optional[int] = None) -> list[tuple[str, int]]:
+        """Shapes run at least `threshold` times, most frequent first"""
+        threshold = threshold or settings.QUERY_PROFILER_REPEAT_THRESHOLD
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def budget(self) -> Optional[int]:
+        return settings.QUERY_BUDGETS.get(self.key)
+
+    def over_budget(self) -> bool:
+        budget = self.budget()
+        return budget is not None and self.queries > budget
+
+    def server_timing(self) -> str:
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        return (
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries", '
+            f"app;dur={elapsed_ms:.1f}"
+        )
+
+
+_current: ContextVar[Optional[QueryProfile]] = ContextVar("query_profile", default=None)
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:  # type: ignore[no-untyped-def]
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED, time.perf_counter())
+
+
+def _after_cursor_execute(_conn, _cursor, statement, _parameters, context, _executemany) -> None:  # type: ignore[no-untyped-def]
+    profile = _current.get()
+    started = getattr(context, _STARTED, None)
+    if profile is not None and started is not None:
+        profile.record(statement, time.perf_counter() - started)
+
+
+def install() -> None:
+    """Register the cursor listeners on all engines (idempotent)"""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        _installed = True
+
+
+@contextmanager
+def profiling(profile: Optional[QueryProfile] = None) -> Iterator[QueryProfile]:
+    """Profile the statements run in this context (and threads it starts with it)"""
+    install()
+    profile = profile or QueryProfile()
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+def _route_template(scope: Scope) -> Optional[str]:
+    route = scope.get("route")
+    return getattr(route, "path", None)
+
+
+def _log(profile: QueryProfile, status: int) -> None:
+    repeated = profile.repeated()
+    over_budget = profile.over_budget()
+    line = {
+        "event": "db_profile",
+        "method": profile.method,
+        "route": profile.route or profile.path,
+        "status": status,
+        "queries": profile.queries,
+        "db_ms": round(profile.db_seconds * 1000, 2),
+        "total_ms": round((time.perf_counter() - profile.started) * 1000, 2),
+    }
+    if profile.budget() is not None:
+        line["budget"] = profile.budget()
+    if repeated:
+        line["repeated"] = [{"shape": shape, "count": count} for shape, count in repeated]
+    level = logging.WARNING if repeated or over_budget else logging.INFO
+    logger.log(level, json.dumps(line))
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware: one QueryProfile per HTTP request (see module docstring)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.QUERY_PROFILER_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        profile = QueryProfile(method=scope["method"], path=scope["path"])
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                # Routing has run by now: the router stored the matched route in scope
+                profile.route = _route_template(scope)
+                if settings.QUERY_PROFILER_STRICT and profile.over_budget():
+                    raise QueryBudgetExceeded(
+                        f"{profile.key}: {profile.queries} queries, budget {profile.budget()}"
+                        f" - shapes: {profile.shapes.most_common(5)}"
+                    )
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+            await send(message)
+
+        with profiling(profile):
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _log(profile, status)
@@ -0,0 +1,255 @@
+"""
+OpenTelemetry tracing, opt-in (TRACING_ENABLED).
+
+Needs the `tracing` extra (`opentelemetry-sdk`, plus
+`opentelemetry-exporter-otlp` for TRACING_EXPORTER=otlp); nothing is
+imported while tracing is disabled.
+
+Spans:
+- one SERVER span per HTTP request, "GET /api/standings/{muagiai}" (the
+  route template), continuing the caller's trace from `traceparent`
+- one span per `app.crud` call ("crud.compute_standings"), nested when
+  CRUD functions call each other
+- one CLIENT span per SQL statement ("SELECT lichthidau"), with the
+  statement text in `db.statement`
+- "serialize" around the Pydantic dump of cached responses (app.core.cache)
+
+so a slow standings request shows whether the time goes into the
+`lichthidau` fetch, the aggregation in Python or the serialization.
+
+Exporters (TRACING_EXPORTER):
+- "otlp":    OTLP/HTTP to TRACING_OTLP_ENDPOINT (or the OTEL_EXPORTER_OTLP_*
+             environment variables, default http://localhost:4318)
+- "console": JSON spans on stdout
+- "file":    JSON spans appended to TRACING_FILE
+
+Sampling: TRACING_SAMPLE_RATIO of new traces, parent-based (a request
+carrying a sampled `traceparent` is always traced). SQL spans are only
+created under a sampled span, so unsampled requests cost one context
+lookup per statement.
+"""
+import functools
+import inspect
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+_SPAN = "_tracing_span"
+_STATEMENT_MAX_LENGTH = 2000
+
+_lock = threading.Lock()
+_tracer: Any = None
+_provider: Any = None
+_trace: Any = None  # the opentelemetry.trace module, once configured
+# crud function name -> undecorated function, restored by shutdown()
+_instrumented: dict[str, Callable[..., Any]] = {}
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Any]:
+    """A child span of the current one; a no-op context while tracing is off"""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _make_exporter() -> Any:
+    if settings.TRACING_EXPORTER == "otlp":
+        # optional dependency, only needed for TRACING_EXPORTER=otlp
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        if settings.TRACING_OTLP_ENDPOINT:
+            return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+        return OTLPSpanExporter()
+
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if settings.TRACING_EXPORTER == "file":
+        out = open(settings.TRACING_FILE, "a", encoding="utf-8")  # noqa: SIM115 - process lifetime
+        return ConsoleSpanExporter(out=out, formatter=lambda s: s.to_json(indent=None) + "\n")
+    return ConsoleSpanExporter()
+
+
+def configure(span_processor: Any = None) -> None:
+    """
+    Install the tracer provider, the SQL listeners and the CRUD spans
+    (idempotent). `span_processor` overrides the exporter from settings
+    (tests pass a SimpleSpanProcessor around an in-memory exporter).
+    """
+    global _tracer, _provider, _trace
+    with _lock:
+        if _tracer is not None:
+            return
+        # optional dependency, only needed for TRACING_ENABLED
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        _provider = TracerProvider(
+            resource=Resource.create({"service.name": settings.PROJECT_NAME}),
+            sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+        )
+        _provider.add_span_processor(span_processor or BatchSpanProcessor(_make_exporter()))
+        trace.set_tracer_provider(_provider)
+        _tracer = _provider.get_tracer(__name__)
+        _trace = trace
+
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _instrument_crud()
+
+
+def shutdown() -> None:
+    """Flush pending spans and remove the instrumentation"""
+    global _tracer, _provider, _trace
+    with _lock:
+        if _tracer is None:
+            return
+        from app import crud
+
+        for name, fn in _instrumented.items():
+            setattr(crud, name, fn)
+        _instrumented.clear()
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.remove(Engine, "handle_error", _handle_error)
+        _provider.shutdown()
+        _tracer = _provider = _trace = None
+
+
+# ==================== SQL STATEMENTS ====================
+
+def _statement_name(statement: str) -> str:
+    """"SELECT lichthidau": the verb and the first table named after FROM/INTO/UPDATE"""
+    words = statement.split(None, 60)
+    verb = words[0].upper() if words else "SQL"
+    for keyword, table in zip(words, words[1:], strict=False):
+        if keyword.upper() in ("FROM", "INTO", "UPDATE") and not table.startswith("("):
+            return f"{verb} {table.strip(chr(34))}"
+    return verb
+
+
+def _before_cursor_execute(conn, _cursor, statement, _parameters, context, _executemany) -> None:  # type: ignore[no-untyped-def]
+    if context is None or _trace is None or not _trace.get_current_span().is_recording():
+        return
+    setattr(context, _SPAN, _tracer.start_span(
+        _statement_name(statement),
+        kind=_trace.SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:_STATEMENT_MAX_LENGTH],
+        },
+    ))
+
+
+def _after_cursor_execute(_conn, cursor, _statement, _parameters, context, _executemany) -> None:  # type: ignore[no-untyped-def]
+    sql_span = getattr(context, _SPAN, None)
+    if sql_span is not None:
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            sql_span.set_attribute("db.rowcount", cursor.rowcount)
+        sql_span.end()
+        setattr(context, _SPAN, None)
+
+
+def _handle_error(exception_context) -> None:  # type: ignore[no-untyped-def]
+    context = exception_context.execution_context
+    sql_span = getattr(context, _SPAN, None)
+    if sql_span is not None:
+        sql_span.record_exception(exception_context.original_exception)
+        sql_span.set_status(_trace.Status(_trace.StatusCode.ERROR))
+        sql_span.end()
+        setattr(context, _SPAN, None)
+
+
+# ==================== CRUD CALLS ====================
+
+def _traced(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    span_name = f"crud.{name}"
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def traced_async(*args: Any, **kwargs: Any) -> Any:
+            with _tracer.start_as_current_span(span_name):
+                return await fn(*args, **kwargs)
+
+        return traced_async
+
+    @functools.wraps(fn)
+    def traced_sync(*args: Any, **kwargs: Any) -> Any:
+        with _tracer.start_as_current_span(span_name):
+            return fn(*args, **kwargs)
+
+    return traced_sync
+
+
+def _instrument_crud() -> None:
+    """
+    Wrap every public function defined in app.crud. Routes call them as
+    `crud.name(...)` and crud calls its own functions through the module
+    globals, so replacing the module attributes covers both.
+    """
+    from app import crud
+
+    for name, fn in list(vars(crud).items()):
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(fn)
+            and fn.__module__ == crud.__name__
+        ):
+            _instrumented[name] = fn
+            setattr(crud, name, _traced(name, fn))
+
+
+# ==================== HTTP REQUESTS ====================
+
+class TracingMiddleware:
+    """ASGI middleware: one SERVER span per HTTP request (see module docstring)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or _tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        from opentelemetry import propagate
+
+        method = scope["method"]
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]
+        }
+        with _tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=_trace.SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as request_span:
+
+            async def send_with_span(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    route: Optional[str] = getattr(scope.get("route"), "path", None)
+                    if route:
+                        request_span.update_name(f"{method} {route}")
+                        request_span.set_attribute("http.route", route)
+                    status = message["status"]
+                    request_span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        request_span.set_status(_trace.Status(_trace.StatusCode.ERROR))
+                await send(message)
+
+            await self.app(scope, receive, send_with_span)
@@ -1,10 +1,17 @@
+from contextlib import asynccontextmanager
+
 # import sentry_sdk  # Temporarily disabled - install sentry-sdk if needed
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core import tracing
 from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.live import live_hub
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, render as render_metrics
+from app.core.profiler import QueryProfilerMiddleware
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -15,10 +22,21 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 # if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
 #     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Live push hub: bind the event loop, start the broker listener (if any)
+    await live_hub.start()
+    yield
+    await live_hub.stop()
+    password_hasher.shutdown()
+    tracing.shutdown()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins
@@ -37,6 +55,24 @@ async def db_session_middleware(request: Request, call_next):
     response.headers["Access-Control-Allow-Credentials"] = "true"
     response.headers["Access-Control-Allow-Methods"] = "*"
     response.headers["Access-Control-Allow-Headers"] = "*"
+    response.headers["Access-Control-Expose-Headers"] = "ETag, Last-Modified, X-Next-Cursor"
     return response
 
+# Query profiler (Server-Timing, N+1 log); passes through unless QUERY_PROFILER_ENABLED
+app.add_middleware(QueryProfilerMiddleware)
+# Prometheus metrics: latency by route template, in-flight requests
+app.add_middleware(MetricsMiddleware)
+# OpenTelemetry spans per request / crud call / SQL statement (TRACING_ENABLED)
+if settings.TRACING_ENABLED:
+    tracing.configure()
+app.add_middleware(tracing.TracingMiddleware)
+
+
+@app.get("/metrics", tags=["monitoring"], include_in_schema=False)
+def metrics() -> Response:
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -1,8 +1,9 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Optional
 
 from pydantic import EmailStr, ConfigDict
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -77,6 +78,14 @@ class MuaGiai(SQLModel, table=True):
     
     # Status
     trangthai: Optional[str] = Field(default="Active", max_length=50)
+    
+    # Data version: bumped by every write to season data (matches, events,
+    # lineups, rosters, ...). Keys the response cache (app/core/cache.py).
+    phienbandulieu: int = Field(default=0)
+    capnhatdulieu: Optional[datetime] = None
+    # When thongkecauthu was built for the season (None: never built yet,
+    # app.crud builds it on first read)
+    thongkecauthuluc: Optional[datetime] = None
 
 
 # Loại cầu thủ - Player type regulations per season
@@ -107,6 +116,10 @@ class SanVanDong(SQLModel, table=True):
 # Câu lạc bộ - Composite PK (maclb, muagiai)
 class CauLacBo(SQLModel, table=True):
     __tablename__ = "caulacbo"
+    __table_args__ = (
+        # Per-season club lists (standings, schedule); the PK leads with maclb
+        Index("ix_caulacbo_muagiai_maclb", "muagiai", "maclb"),
+    )
     
     # Composite primary key
     maclb: str = Field(primary_key=True, max_length=50)
@@ -316,6 +329,9 @@ class Token(SQLModel):
 # Contents of JWT token
 class TokenPayload(SQLModel):
     sub: str | None = None
+    # Optional role claim (settings.JWT_ROLE_CLAIM)
+    role: str | None = None
+    manhom: int | None = None
 
 
 # =============================================
@@ -353,6 +369,23 @@ class CauThu(SQLModel, table=True):
 # Player registration to club (ChiTietDoiBong) - Composite PK
 class ChiTietDoiBong(SQLModel, table=True):
     __tablename__ = "chitietdoibong"
+    __table_args__ = (
+        # Shirt number lookups and uniqueness (maclb, muagiai, soaothidau)
+        UniqueConstraint(
+            "maclb", "muagiai", "soaothidau",
+            name="uq_chitietdoibong_maclb_muagiai_soaothidau",
+        ),
+        # Club squad reads: index-only on PostgreSQL
+        Index(
+            "ix_chitietdoibong_maclb_muagiai", "maclb", "muagiai",
+            postgresql_include=["macauthu", "soaothidau"],
+        ),
+        # Player -> club for a season (events, lineups, stats); the PK leads with macauthu
+        Index(
+            "ix_chitietdoibong_muagiai_macauthu", "muagiai", "macauthu",
+            postgresql_include=["maclb", "soaothidau"],
+        ),
+    )
     
     # Composite primary key
     macauthu: str = Field(primary_key=True, foreign_key="cauthu.macauthu", max_length=50)
@@ -363,7 +396,6 @@ class ChiTietDoiBong(SQLModel, table=True):
     soaothidau: int = Field(ge=1, le=99)
     
     # ⚠️ COMPOSITE FK: (maclb, muagiai) → CauLacBo(maclb, muagiai)
-    # ⚠️ UNIQUE CONSTRAINT: (maclb, muagiai, soaothidau)
     # Database constraint exists but SQLModel doesn't support composite FK declaration
     # Validation must be done manually in CRUD layer
 
@@ -501,12 +533,61 @@ class RegisterPlayerResponse(SQLModel):
     soaothidau: int
 
 
+class RosterImportRow(SQLModel):
+    """
+    One line of a squad file.
+
+    `macauthu` of an existing player registers that player; otherwise a new
+    player is created from the player fields (`tencauthu` required) and
+    `macauthu` is generated when omitted.
+    """
+    macauthu: Optional[str] = Field(default=None, max_length=50)
+    tencauthu: Optional[str] = Field(default=None, max_length=100)
+    ngaysinh: Optional[datetime] = None
+    quoctich: Optional[str] = "Vietnam"
+    vitrithidau: Optional[str] = None
+    chieucao: Optional[float] = None
+    cannang: Optional[float] = None
+    soaothidau: Optional[int] = None
+
+
+class RosterImportRequest(SQLModel):
+    """Squad file for one club and season"""
+    maclb: str
+    muagiai: str
+    rows: list[RosterImportRow] = Field(min_length=1, max_length=200)
+    # True: register nothing if any row is invalid
+    atomic: bool = True
+
+
+class RosterImportItem(SQLModel):
+    """Outcome of one squad file row (same order as the file)"""
+    row: int
+    macauthu: Optional[str] = None
+    status: str  # "created", "invalid" or "skipped" (atomic)
+    detail: Optional[str] = None
+
+
+class RosterImportResult(SQLModel):
+    """Result of a squad import"""
+    maclb: str
+    muagiai: str
+    created: int
+    new_players: int
+    invalid: int
+    results: list[RosterImportItem] = Field(default_factory=list)
+
+
 # =============================================
 # MATCHES (LichThiDau) - Database Table
 # =============================================
 
 class LichThiDau(SQLModel, table=True):
     __tablename__ = "lichthidau"
+    __table_args__ = (
+        # Season listings ordered by kickoff; matran makes it the keyset order
+        Index("ix_lichthidau_muagiai_thoigianthidau", "muagiai", "thoigianthidau", "matran"),
+    )
     
     # Primary Key
     matran: str = Field(primary_key=True, max_length=50)
@@ -531,6 +612,9 @@ class LichThiDau(SQLModel, table=True):
     bugiohiep1: Optional[int] = None  # First half added time (minutes)
     bugiohiep2: Optional[int] = None  # Second half added time (minutes)
     tiso: Optional[str] = Field(default=None, max_length=20)  # Final score "2-1"
+    # Final score as integers (kept consistent with tiso by CRUD; NULL = no result)
+    banthangnha: Optional[int] = None  # Home goals
+    banthangkhach: Optional[int] = None  # Away goals
 
 
 # =============================================
@@ -556,6 +640,13 @@ class DoiHinhXuatPhat(SQLModel, table=True):
 
 class SuKienTranDau(SQLModel, table=True):
     __tablename__ = "sukientrandau"
+    __table_args__ = (
+        # Events of a match by type (goals, cards) and per-player counts
+        Index(
+            "ix_sukientrandau_matran_loaisukien", "matran", "loaisukien",
+            postgresql_include=["macauthu", "maclb"],
+        ),
+    )
     
     # Primary Key
     masukien: str = Field(primary_key=True, max_length=50)
@@ -592,6 +683,67 @@ class ChiTietTrongTai(SQLModel, table=True):
     vitri: str = Field(max_length=50)  # "Trong Tai Chinh", "Trong Tai Phu", "Trong Tai Thu Tu"
 
 
+# =============================================
+# STANDINGS (BXH_DoiBong) - Database Table
+# =============================================
+# Maintained incrementally by CRUD when match results change.
+# Can be rebuilt from lichthidau with crud.rebuild_standings().
+
+class BXHDoiBong(SQLModel, table=True):
+    __tablename__ = "bxh_doibong"
+
+    # Composite Primary Key
+    muagiai: str = Field(primary_key=True, foreign_key="muagiai.muagiai", max_length=50)
+    maclb: str = Field(primary_key=True, max_length=50)  # Composite FK to CauLacBo(maclb, muagiai)
+
+    # Aggregated results
+    sotran: int = Field(default=0)  # Matches played
+    thang: int = Field(default=0)  # Won
+    hoa: int = Field(default=0)  # Drawn
+    thua: int = Field(default=0)  # Lost
+    banthang: int = Field(default=0)  # Goals for
+    banthua: int = Field(default=0)  # Goals against
+    diem: int = Field(default=0)  # Points
+
+    # Ranking & form
+    thuhang: Optional[int] = None  # Position in table
+    phongdo: Optional[str] = Field(default=None, max_length=5)  # Last 5 results: "WWDLW"
+    capnhatluc: datetime = Field(default_factory=datetime.utcnow)  # Last time row changed
+
+
+# =============================================
+# PLAYER SEASON STATS (ThongKeCauThu) - Database Table
+# =============================================
+# Maintained incrementally by CRUD when match events / lineups change.
+# Can be rebuilt from sukientrandau + doihinhxuatphat with crud.rebuild_player_stats().
+
+class ThongKeCauThu(SQLModel, table=True):
+    __tablename__ = "thongkecauthu"
+    __table_args__ = (
+        # Top-N reads for /stats/awards and /stats/mvp
+        Index("ix_thongkecauthu_muagiai_banthang", "muagiai", "banthang"),
+        Index("ix_thongkecauthu_muagiai_kientao", "muagiai", "kientao"),
+        Index("ix_thongkecauthu_muagiai_mvp", "muagiai", "mvp"),
+    )
+    
+    # Composite primary key (season first: all reads are per season)
+    muagiai: str = Field(primary_key=True, foreign_key="muagiai.muagiai", max_length=50)
+    macauthu: str = Field(primary_key=True, foreign_key="cauthu.macauthu", max_length=50)
+    
+    # Club from match events (fallback when player has no roster entry)
+    maclb: Optional[str] = Field(default=None, max_length=50)
+    
+    # Counters
+    sotrandachoi: int = Field(default=0)  # Matches played (lineup entries)
+    banthang: int = Field(default=0)  # Goals
+    kientao: int = Field(default=0)  # Assists (cauthulienquan of goal events)
+    thevang: int = Field(default=0)  # Yellow cards
+    thevangthu2: int = Field(default=0)  # Second yellows (2+ yellows in same match)
+    thedo: int = Field(default=0)  # Red cards
+    mvp: int = Field(default=0)  # Man of the match awards (loaisukien = "MVP")
+    capnhatluc: datetime = Field(default_factory=datetime.utcnow)  # Last time row changed
+
+
 # =============================================
 # MATCHES SCHEMAS (API Request/Response)
 # =============================================
@@ -610,6 +762,8 @@ class LichThiDauPublic(SQLModel):
     bugiohiep1: Optional[int] = None
     bugiohiep2: Optional[int] = None
     tiso: Optional[str] = None
+    banthangnha: Optional[int] = None
+    banthangkhach: Optional[int] = None
     ten_clb_nha: Optional[str] = None
     ten_clb_khach: Optional[str] = None
     ten_san: Optional[str] = None
@@ -629,6 +783,8 @@ class LichThiDauCreate(SQLModel):
     bugiohiep1: Optional[int] = None
     bugiohiep2: Optional[int] = None
     tiso: Optional[str] = None
+    banthangnha: Optional[int] = None
+    banthangkhach: Optional[int] = None
 
 
 class LichThiDauUpdate(SQLModel):
@@ -645,6 +801,8 @@ class LichThiDauUpdate(SQLModel):
     bugiohiep1: Optional[int] = None
     bugiohiep2: Optional[int] = None
     tiso: Optional[str] = None
+    banthangnha: Optional[int] = None
+    banthangkhach: Optional[int] = None
 
 
 class LichThiDauDetail(SQLModel):
@@ -661,6 +819,8 @@ class LichThiDauDetail(SQLModel):
     bugiohiep1: Optional[int] = None
     bugiohiep2: Optional[int] = None
     tiso: Optional[str] = None
+    banthangnha: Optional[int] = None
+    banthangkhach: Optional[int] = None
     # Embedded details (populated by CRUD)
     events: list["SuKienTranDauPublic"] = Field(default_factory=list)
     lineup_home: list["DoiHinhXuatPhatPublic"] = Field(default_factory=list)
@@ -747,6 +907,30 @@ class SuKienTranDauCreate(SQLModel):
     macauthu: str
 
 
+class MatchEventBulkRequest(SQLModel):
+    """Batch of events for one match (live feed backlog)"""
+    events: list[SuKienTranDauCreate] = Field(min_length=1, max_length=1000)
+    # True: insert nothing if any event is invalid
+    atomic: bool = False
+
+
+class MatchEventBulkItem(SQLModel):
+    """Outcome of one event in a batch (same order as the request)"""
+    index: int
+    masukien: str
+    status: str  # "created", "duplicate" (already ingested), "invalid" or "skipped" (atomic)
+    detail: Optional[str] = None
+
+
+class MatchEventBulkResult(SQLModel):
+    """Result of batch event ingestion"""
+    matran: str
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[MatchEventBulkItem] = Field(default_factory=list)
+
+
 class SuKienTranDauUpdate(SQLModel):
     """Update match event - only allows updating specific fields"""
     model_config = ConfigDict(extra="forbid")  # Reject extra fields with 422
@@ -780,12 +964,52 @@ class ChiTietTrongTaiCreate(SQLModel):
 # SCHEDULE GENERATION SCHEMAS
 # =============================================
 
+class ScheduleSlot(SQLModel):
+    """Kickoff (TV) slot of a round: `day_offset` days after the round date"""
+    day_offset: int = Field(default=0, ge=0, le=6)
+    kickoff: time
+
+
+class ScheduleOptimizeOptions(SQLModel):
+    """Optimizer settings for schedule generation (see app/scheduling.py)"""
+    # Kickoff slots, one match per slot and round (default: 17:00 + 2h steps)
+    slots: list[ScheduleSlot] = Field(default_factory=list)
+    min_rest_days: int = Field(default=2, ge=0, le=14)
+    # Blocked dates per stadium (masanvandong)
+    stadium_unavailable: dict[str, list[date]] = Field(default_factory=dict)
+    time_budget_ms: int = Field(default=2000, ge=0, le=30000)
+    max_iterations: Optional[int] = Field(default=None, ge=0)
+    seed: Optional[int] = None
+
+
 class ScheduleGenerateRequest(SQLModel):
     """Request to generate schedule"""
     muagiai: str
     ngaybatdau_lutdi: datetime
     ngaybatdau_lutve: datetime
     interval_days: int = 7  # Weekly matches by default
+    # True: validate and return the fixtures without writing them
+    dry_run: bool = False
+    # Set: optimize round order, home/away and kickoff slots (else plain circle method)
+    optimize: Optional[ScheduleOptimizeOptions] = None
+
+
+class ScheduleObjective(SQLModel):
+    """Schedule quality (lower is better; score weights the hard constraints)"""
+    score: int
+    breaks: int
+    stadium_clashes: int
+    stadium_unavailable: int
+    rest_violations: int
+
+
+class ScheduleOptimizationReport(SQLModel):
+    """Objective of the plain circle-method layout vs the optimized one"""
+    baseline: ScheduleObjective
+    best: ScheduleObjective
+    iterations: int
+    elapsed_ms: float
+    seed: Optional[int] = None
 
 
 class ScheduleGenerationResult(SQLModel):
@@ -795,6 +1019,8 @@ class ScheduleGenerationResult(SQLModel):
     rounds_generated: int
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
+    fixtures: list[LichThiDauCreate] = Field(default_factory=list)  # dry_run only
+    optimization: Optional[ScheduleOptimizationReport] = None
 
 
 class ScheduleValidateRequest(SQLModel):
@@ -982,7 +1208,8 @@ __all__ = [
     "ScheduleGenerateRequest", "ScheduleGenerationResult",
     "ScheduleValidateRequest", "ScheduleValidationResult",
     # Standings & Stats
-    "StandingsRow", "StandingsResponse",
+    "BXHDoiBong", "StandingsRow", "StandingsResponse",
+    "ThongKeCauThu",
     "PlayerStatsRow", "PlayerStatsResponse",
     "MatchStatsRow", "MatchStatsResponse",
     # Awards & Discipline
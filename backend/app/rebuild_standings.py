@@ -0,0 +1,47 @@
+import argparse
+import logging
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.core.db import engine
+from app.models import MuaGiai
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(season_ids: list[str] | None = None) -> None:
+    with Session(engine) as session:
+        if not season_ids:
+            season_ids = list(session.exec(select(MuaGiai.muagiai)).all())
+        for muagiai in season_ids:
+            standings = crud.rebuild_standings(session=session, muagiai=muagiai)
+            logger.info(
+                f"Rebuilt standings for {muagiai}: {len(standings.standings)} clubs"
+            )
+            players = crud.rebuild_player_stats(session=session, muagiai=muagiai)
+            logger.info(f"Rebuilt player stats for {muagiai}: {players} players")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Rebuild bxh_doibong (standings) and thongkecauthu (player stats) "
+            "from matches, events and lineups"
+        )
+    )
+    parser.add_argument(
+        "muagiai",
+        nargs="*",
+        help="Season IDs to rebuild (default: all seasons)",
+    )
+    args = parser.parse_args()
+
+    logger.info("Rebuilding standings")
+    rebuild(args.muagiai)
+    logger.info("Standings rebuilt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Double round-robin schedule optimizer (simulated annealing).
+
+The circle method (crud.generate_round_pairings) fixes WHO plays whom in
+each round. This module searches, within a time budget, for the layout of
+that template that best fits the league's constraints:
+
+- the order of the rounds (the return leg mirrors the first leg's order)
+- home/away of each pairing (the mirrored return match swaps it back, so
+  every pair still meets once at each ground)
+- the kickoff slot (TV slot) of each match within its round
+
+Objective (lower is better), see Objective:
+- breaks:              two consecutive home (or away) matches for a club
+- stadium_clashes:     extra matches at the same stadium on the same day
+                       (clubs sharing CauLacBo.masanvandong)
+- stadium_unavailable: matches at a stadium on one of its blocked dates
+- rest_violations:     a club playing again less than `min_rest_days` later
+
+Clashes, blocked dates and rest violations are weighted as (soft) hard
+constraints; breaks are what is minimized once those are satisfied.
+
+Pure in-memory code: no session, no models. crud.generate_round_robin_schedule
+builds the template and turns the result into LichThiDauCreate.
+"""
+import itertools
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+HARD_WEIGHT = 100
+REST_WEIGHT = 50
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A kickoff slot: `day_offset` days after the round date, at `hour:minute`"""
+    day_offset: int
+    hour: int
+    minute: int = 0
+
+
+@dataclass
+class Objective:
+    breaks: int = 0
+    stadium_clashes: int = 0
+    stadium_unavailable: int = 0
+    rest_violations: int = 0
+
+    @property
+    def score(self) -> int:
+        return (
+            self.breaks
+            + HARD_WEIGHT * (self.stadium_clashes + self.stadium_unavailable)
+            + REST_WEIGHT * self.rest_violations
+        )
+
+
+@dataclass
+class ScheduledMatch:
+    vong: int
+    home: int  # team index
+    away: int
+    kickoff: datetime
+
+
+@dataclass
+class Problem:
+    """
+    Args:
+        template: First-leg rounds, each a list of (home, away) team indices
+        stadiums: Home stadium per team index (None: no stadium)
+        leg_starts: Date of the first round of each leg
+        interval_days: Days between rounds
+        slots: Kickoff slots; each slot hosts at most one match per round
+        min_rest_days: Minimum days between two matches of a club
+        unavailable: Blocked dates per stadium
+        start_flips: Home/away flips to start the search from (e.g. a
+            low-break orientation of the template); default: none
+    """
+    template: list[list[tuple[int, int]]]
+    stadiums: list[Optional[str]]
+    leg_starts: tuple[datetime, datetime]
+    interval_days: int
+    slots: list[Slot]
+    min_rest_days: int = 0
+    unavailable: dict[str, set[date]] = field(default_factory=dict)
+    start_flips: Optional[list[list[bool]]] = None
+
+
+@dataclass
+class _State:
+    order: list[int]  # first-leg round positions -> template round
+    flips: list[list[bool]]  # per template round, per pairing
+    slots: list[list[int]]  # per vong - 1, per match of the round: slot index
+
+    def copy(self) -> "_State":
+        return _State(
+            order=list(self.order),
+            flips=[list(f) for f in self.flips],
+            slots=[list(s) for s in self.slots],
+        )
+
+
+@dataclass
+class OptimizationResult:
+    matches: list[ScheduledMatch]
+    baseline: Objective
+    best: Objective
+    iterations: int
+    elapsed_ms: float
+
+
+def default_slots(matches_per_round: int) -> list[Slot]:
+    """The classic layout: round date, 17:00 then every 2 hours"""
+    return [Slot(0, 17 + 2 * i) for i in range(matches_per_round)]
+
+
+def _initial_state(problem: Problem) -> _State:
+    rounds = len(problem.template)
+    return _State(
+        order=list(range(rounds)),
+        flips=[[False] * len(pairings) for pairings in problem.template],
+        slots=[
+            list(range(len(problem.template[r % rounds]))) for r in range(2 * rounds)
+        ],
+    )
+
+
+def _decode(problem: Problem, state: _State) -> list[ScheduledMatch]:
+    rounds = len(problem.template)
+    matches = []
+    for leg, leg_start in enumerate(problem.leg_starts):
+        for position, template_round in enumerate(state.order):
+            vong = leg * rounds + position + 1
+            round_date = leg_start.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
+                days=position * problem.interval_days
+            )
+            slots = state.slots[vong - 1]
+            for index, (home, away) in enumerate(problem.template[template_round]):
+                if state.flips[template_round][index] != (leg == 1):
+                    home, away = away, home
+                slot = problem.slots[slots[index]]
+                matches.append(ScheduledMatch(
+                    vong=vong,
+                    home=home,
+                    away=away,
+                    kickoff=round_date + timedelta(
+                        days=slot.day_offset, hours=slot.hour, minutes=slot.minute
+                    ),
+                ))
+    return matches
+
+
+def evaluate(problem: Problem, matches: list[ScheduledMatch]) -> Objective:
+    objective = Objective()
+    by_team: dict[int, list[ScheduledMatch]] = {}
+    stadium_days: dict[tuple[str, date], int] = {}
+    for match in matches:
+        by_team.setdefault(match.home, []).append(match)
+        by_team.setdefault(match.away, []).append(match)
+        stadium = problem.stadiums[match.home]
+        if stadium is None:
+            continue
+        day = match.kickoff.date()
+        key = (stadium, day)
+        if key in stadium_days:
+            objective.stadium_clashes += 1
+        stadium_days[key] = stadium_days.get(key, 0) + 1
+        if day in problem.unavailable.get(stadium, ()):
+            objective.stadium_unavailable += 1
+
+    for team, team_matches in by_team.items():
+        team_matches.sort(key=lambda m: m.vong)
+        for previous, current in itertools.pairwise(team_matches):
+            if (previous.home == team) == (current.home == team) and current.vong == previous.vong + 1:
+                objective.breaks += 1
+            gap = abs((current.kickoff.date() - previous.kickoff.date()).days)
+            if gap < problem.min_rest_days:
+                objective.rest_violations += 1
+    return objective
+
+
+def _neighbour(problem: Problem, state: _State, rng: random.Random) -> _State:
+    candidate = state.copy()
+    rounds = len(problem.template)
+    move = rng.random()
+    if move < 0.3 and rounds > 1:
+        a, b = rng.sample(range(rounds), 2)
+        candidate.order[a], candidate.order[b] = candidate.order[b], candidate.order[a]
+    elif move < 0.7 or len(problem.slots) < 2:
+        template_round = rng.randrange(rounds)
+        index = rng.randrange(len(candidate.flips[template_round]))
+        candidate.flips[template_round][index] = not candidate.flips[template_round][index]
+    else:
+        slots = candidate.slots[rng.randrange(2 * rounds)]
+        index = rng.randrange(len(slots))
+        free = sorted(set(range(len(problem.slots))) - set(slots))
+        if free and rng.random() < 0.5:
+            slots[index] = rng.choice(free)
+        elif len(slots) > 1:
+            other = rng.randrange(len(slots))
+            slots[index], slots[other] = slots[other], slots[index]
+    return candidate
+
+
+def optimize(
+    problem: Problem,
+    *,
+    time_budget_ms: float,
+    max_iterations: Optional[int] = None,
+    seed: Optional[int] = None,
+    start_temperature: float = 2.0,
+    end_temperature: float = 0.05,
+) -> OptimizationResult:
+    """
+    Simulated annealing over round order, home/away flips and slots.
+
+    `baseline` is the objective of the plain layout (no flips, template
+    round order, slots in order); the search starts from
+    `problem.start_flips` when given.
+
+    Stops at `time_budget_ms` or `max_iterations`, whichever comes first;
+    the temperature follows a geometric schedule over that budget. With a
+    `seed` and `max_iterations` well inside the time budget, runs are
+    reproducible.
+    """
+    if any(len(pairings) > len(problem.slots) for pairings in problem.template):
+        raise ValueError(
+            f"{len(problem.slots)} kickoff slots for "
+            f"{max(len(p) for p in problem.template)} matches per round"
+        )
+
+    rng = random.Random(seed)
+    state = _initial_state(problem)
+    baseline = evaluate(problem, _decode(problem, state))
+    if problem.start_flips is not None:
+        state.flips = [list(flips) for flips in problem.start_flips]
+    current = evaluate(problem, _decode(problem, state))
+    best_state, best = state, current
+    if baseline.score < best.score:
+        best_state, best = _initial_state(problem), baseline
+
+    started = time.perf_counter()
+    budget = time_budget_ms / 1000
+    iterations = 0
+    while best.score > 0:
+        elapsed = time.perf_counter() - started
+        if elapsed >= budget or (max_iterations is not None and iterations >= max_iterations):
+            break
+        progress = max(
+            elapsed / budget if budget else 1.0,
+            iterations / max_iterations if max_iterations else 0.0,
+        )
+        temperature = start_temperature * (end_temperature / start_temperature) ** progress
+        iterations += 1
+
+        candidate = _neighbour(problem, state, rng)
+        objective = evaluate(problem, _decode(problem, candidate))
+        delta = objective.score - current.score
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            state, current = candidate, objective
+            if current.score < best.score:
+                best_state, best = state, current
+
+    return OptimizationResult(
+        matches=_decode(problem, best_state),
+        baseline=baseline,
+        best=best,
+        iterations=iterations,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
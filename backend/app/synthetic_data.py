@@ -0,0 +1,573 @@
+"""
+Deterministic synthetic league data for benchmarks and scale tests.
+
+generate_league() yields one SeasonData per season: plain row dicts per
+table, in foreign key order, that follow the season regulations the CRUD
+layer enforces:
+
+- clubs with a home stadium (some clubs share one, like Hàng Đẫy)
+- rosters of `players_per_club` players (3 GK, the rest DF/MF/FW) with
+  unique shirt numbers, ages within the season limits and at most the
+  foreign player quota; about 20% of each squad turns over between seasons
+- a full double round-robin (crud.generate_round_pairings), one round a
+  week (midweek rounds too for leagues over 22 clubs), kickoffs spread
+  over the weekend slots
+- for played matches: a score (home advantage), 11 starters + 7
+  substitutes per team with one captain, and events at V-League-like
+  densities: goals (matching the score, ~70% assisted), ~2 yellow cards
+  per team, occasional second yellows and reds, 3-5 substitutions, one MVP
+
+The same seed always produces the same rows.
+
+    for season in generate_league(seed=1, seasons=2, clubs=14):
+        load_season(session=session, season=season)
+
+or from the command line (one season at a time, so memory stays flat):
+
+    python -m app.synthetic_data --seed 1 --seasons 10 --clubs 40
+
+PERF: on PostgreSQL each table is loaded with COPY ... FROM STDIN, about
+twice as fast as multi-row INSERTs. A 40-club season is ~85k rows (~25k
+events) and generates + loads in a few seconds, so a million events is
+a matter of minutes.
+"""
+import argparse
+import logging
+import math
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app import crud
+from app.core.db import engine
+from app.models import (
+    CauLacBo,
+    CauThu,
+    ChiTietDoiBong,
+    DoiHinhXuatPhat,
+    LichThiDau,
+    LoaiCauThu,
+    MuaGiai,
+    SanVanDong,
+    SuKienTranDau,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Season regulations of generated seasons (MuaGiai columns)
+MIN_PLAYERS = 16
+MIN_GOALKEEPERS = 2
+MIN_AGE = 16
+MAX_AGE = 40
+FOREIGN_QUOTA = 4
+MATCHDAY_SQUAD = 18  # 11 starters + 7 substitutes
+MIN_CAPACITY = 5000
+
+# Roster shape: positions of the first slots, the rest cycle DF/MF/FW
+GOALKEEPERS = 3
+OUTFIELD_CYCLE = ("DF", "MF", "DF", "FW", "MF")
+# Starting XI (4-4-2)
+FORMATION = {"GK": 1, "DF": 4, "MF": 4, "FW": 2}
+# Goal scorer weights by position
+SCORER_WEIGHTS = {"GK": 0, "DF": 1, "MF": 3, "FW": 6}
+
+HOME_GOALS = 1.5
+AWAY_GOALS = 1.1
+ASSIST_RATE = 0.7
+YELLOWS_PER_TEAM = 2.0
+SECOND_YELLOW_RATE = 0.05
+REDS_PER_TEAM = 0.05
+SQUAD_TURNOVER = 0.2
+# (day offset from the round's Friday, hour, minute)
+KICKOFF_SLOTS = ((0, 19, 15), (1, 17, 0), (1, 19, 15), (2, 17, 0), (2, 19, 15), (3, 18, 0))
+
+FIRST_NAMES = (
+    "Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Võ", "Đặng",
+    "Bùi", "Đỗ", "Hồ", "Ngô", "Dương", "Lý",
+)
+MIDDLE_NAMES = ("Văn", "Hữu", "Đức", "Quang", "Minh", "Thành", "Công", "Xuân", "Tiến", "Hoàng")
+GIVEN_NAMES = (
+    "Anh", "Bình", "Cường", "Dũng", "Đạt", "Hải", "Hậu", "Hùng", "Khánh", "Lâm",
+    "Long", "Mạnh", "Nam", "Phong", "Phúc", "Quyết", "Sơn", "Tài", "Thắng", "Toàn",
+    "Trọng", "Tuấn", "Việt", "Vinh",
+)
+FOREIGN_PLAYERS = (
+    ("Brazil", ("Rafaelson", "Geovane", "Wellington", "Lucão", "Pedro Henrique", "Rimario")),
+    ("Nigeria", ("Oseni", "Olaha", "Emeka", "Chukwu")),
+    ("Serbia", ("Jovanović", "Marković", "Petrović")),
+    ("Japan", ("Tanaka", "Suzuki", "Sato")),
+    ("Argentina", ("Gómez", "Fernández", "Álvarez")),
+)
+CITIES = (
+    "Hà Nội", "TP. Hồ Chí Minh", "Hải Phòng", "Nam Định", "Thanh Hóa", "Nghệ An",
+    "Bình Định", "Đà Nẵng", "Quảng Ninh", "Bình Dương", "Hà Tĩnh", "Gia Lai",
+    "Khánh Hòa", "Long An", "Cần Thơ", "Huế",
+)
+
+# Tables in foreign key order, as keyed in SeasonData.rows
+TABLES = (MuaGiai, LoaiCauThu, SanVanDong, CauLacBo, CauThu, ChiTietDoiBong,
+          LichThiDau, DoiHinhXuatPhat, SuKienTranDau)
+
+
+@dataclass
+class SeasonData:
+    muagiai: str
+    rows: dict[type, list[dict[str, Any]]] = field(default_factory=dict)
+
+    def count(self, model: type) -> int:
+        return len(self.rows.get(model, ()))
+
+
+@dataclass
+class _Player:
+    macauthu: str
+    position: str
+    born: datetime
+    foreign: bool
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    limit, k, p = math.exp(-mean), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def _age(born: datetime, at: datetime) -> int:
+    return at.year - born.year - ((at.month, at.day) < (born.month, born.day))
+
+
+class _League:
+    """Player pool carried across seasons (squads turn over, players age)"""
+
+    def __init__(self, *, seed: int, prefix: str, clubs: int, players_per_club: int) -> None:
+        self.rng = random.Random(seed)
+        self.prefix = prefix
+        self.players_per_club = players_per_club
+        self.serial = 0
+        self.squads: list[list[_Player]] = [[] for _ in range(clubs)]
+
+    def _new_player(
+        self, position: str, foreign: bool, season_start: datetime
+    ) -> tuple[_Player, dict]:
+        rng = self.rng
+        self.serial += 1
+        age = min(MAX_AGE - 4, max(MIN_AGE + 1, round(rng.gauss(25, 4))))
+        born = season_start - timedelta(days=365 * age + rng.randrange(365))
+        player = _Player(f"{self.prefix}P{self.serial:07d}", position, born, foreign)
+        if foreign:
+            nationality, names = rng.choice(FOREIGN_PLAYERS)
+            name = rng.choice(names)
+        else:
+            nationality = "Vietnam"
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(MIDDLE_NAMES)} {rng.choice(GIVEN_NAMES)}"
+        row = {
+            "macauthu": player.macauthu,
+            "tencauthu": name,
+            "ngaysinh": born,
+            "noisinh": None if foreign else rng.choice(CITIES),
+            "quoctich": nationality,
+            "quoctichkhac": None,
+            "vitrithidau": position,
+            "chieucao": round(rng.gauss(186 if position == "GK" else 175, 5), 1),
+            "cannang": round(rng.gauss(70, 6), 1),
+        }
+        return player, row
+
+    def squad(self, club: int, season_start: datetime) -> tuple[list[_Player], list[dict]]:
+        """The club's squad for a season and the CauThu rows of its new players"""
+        rng = self.rng
+        squad = self.squads[club]
+        # Turnover: some players leave, anyone past the age limit retires
+        squad[:] = [
+            player for player in squad
+            if rng.random() >= SQUAD_TURNOVER and _age(player.born, season_start) < MAX_AGE - 1
+        ]
+        new_rows = []
+        positions = ["GK"] * GOALKEEPERS + [
+            OUTFIELD_CYCLE[i % len(OUTFIELD_CYCLE)]
+            for i in range(self.players_per_club - GOALKEEPERS)
+        ]
+        for player in squad:
+            if player.position in positions:
+                positions.remove(player.position)
+        foreign_slots = rng.randint(1, FOREIGN_QUOTA) - sum(p.foreign for p in squad)
+        while len(squad) < self.players_per_club:
+            # Missing positions first, goalkeepers before outfield players
+            position = positions.pop(0) if positions else "MF"
+            foreign = foreign_slots > 0 and position != "GK"
+            foreign_slots -= foreign
+            player, row = self._new_player(position, foreign, season_start)
+            squad.append(player)
+            new_rows.append(row)
+        return squad, new_rows
+
+
+def _season_rows(
+    league: _League, *, muagiai: str, year: int, clubs: int, played_ratio: float
+) -> SeasonData:
+    rng = league.rng
+    prefix = league.prefix
+    start = datetime(year, 8, 1)
+    end = datetime(year + 1, 6, 30)
+    data = SeasonData(muagiai=muagiai)
+    rows = data.rows = {model: [] for model in TABLES}
+
+    rows[MuaGiai].append({
+        "muagiai": muagiai,
+        "ngaybatdau": start,
+        "ngayketthuc": end,
+        "soclbthamdutoida": clubs,
+        "lephithamgia": 1_000_000_000.0,
+        "socauthutoithieu": MIN_PLAYERS,
+        "socauthutoida": league.players_per_club,
+        "sothumontoithieu": MIN_GOALKEEPERS,
+        "tuoicauthutoithieu": MIN_AGE,
+        "tuoicauthutoida": MAX_AGE,
+        "succhuatoithieu": MIN_CAPACITY,
+        "yeucausvd": "2 sao",
+        "chungchihlv": "AFC Pro",
+        "socauthudangkythidautoida": MATCHDAY_SQUAD,
+        "thoidiemghibantoida": 90,
+        "trangthai": "DaKetThuc" if played_ratio >= 1 else "DangDienRa",
+        "phienbandulieu": 0,
+        "capnhatdulieu": None,
+    })
+    rows[LoaiCauThu] += [
+        {"maloaicauthu": f"{muagiai}-NOI", "tenloaicauthu": "Cầu thủ nội",
+         "socauthutoida": league.players_per_club, "muagiai": muagiai},
+        {"maloaicauthu": f"{muagiai}-NGOAI", "tenloaicauthu": "Cầu thủ nước ngoài",
+         "socauthutoida": FOREIGN_QUOTA, "muagiai": muagiai},
+    ]
+
+    club_ids = [f"{prefix}{c + 1:02d}" for c in range(clubs)]
+    stadium_of: dict[str, str] = {}
+    squads: dict[str, list[_Player]] = {}
+    for c, maclb in enumerate(club_ids):
+        # Every fifth club shares the previous club's ground
+        shared = c % 5 == 4
+        masanvandong = stadium_of[club_ids[c - 1]] if shared else f"{prefix}S{c + 1:02d}"
+        stadium_of[maclb] = masanvandong
+        city = CITIES[c % len(CITIES)]
+        if not shared:
+            rows[SanVanDong].append({
+                "masanvandong": masanvandong,
+                "muagiai": muagiai,
+                "tensanvandong": f"Sân {city} {c + 1}",
+                "diachisvd": city,
+                "succhua": rng.randrange(MIN_CAPACITY, 40_000, 500),
+                "danhgiafifa": rng.choice(("2 sao", "3 sao", "4 sao")),
+            })
+        rows[CauLacBo].append({
+            "maclb": maclb,
+            "muagiai": muagiai,
+            "tenclb": f"CLB {city} {c + 1:02d}",
+            "diachitruso": city,
+            "donvichuquan": f"Công ty CP Thể thao {city}",
+            "trangphucchunha": "Đỏ",
+            "trangphuckhach": "Trắng",
+            "trangphucduphong": "Xanh",
+            "masanvandong": masanvandong,
+        })
+        squad, new_players = league.squad(c, start)
+        squads[maclb] = squad
+        rows[CauThu] += new_players
+        goalkeeper_numbers = iter((1, 25, 30, 35, 99))
+        outfield_numbers = iter(n for n in range(2, 99) if n not in (25, 30, 35))
+        for player in squad:
+            numbers = goalkeeper_numbers if player.position == "GK" else outfield_numbers
+            rows[ChiTietDoiBong].append({
+                "macauthu": player.macauthu,
+                "maclb": maclb,
+                "muagiai": muagiai,
+                "soaothidau": next(numbers),
+            })
+
+    # Double round-robin: weekly rounds while they fit in the season
+    # (up to 22 clubs), bigger leagues play midweek rounds too
+    teams: list[Any] = list(club_ids) + ([None] if clubs % 2 else [])
+    rounds_per_leg = len(teams) - 1
+    total_rounds = 2 * rounds_per_leg
+    interval = min(7, 300 // total_rounds)
+    first_friday = start + timedelta(days=(4 - start.weekday()) % 7 + 7)
+    played_rounds = round(total_rounds * played_ratio)
+    for leg in (0, 1):
+        for round_num in range(1, rounds_per_leg + 1):
+            vong = leg * rounds_per_leg + round_num
+            round_date = first_friday + timedelta(days=(vong - 1) * interval)
+            pairings = [
+                (home, away)
+                for home, away in crud.generate_round_pairings(teams, round_num, bool(leg))
+                if home is not None and away is not None
+            ]
+            for k, (home, away) in enumerate(pairings):
+                day, hour, minute = KICKOFF_SLOTS[k % len(KICKOFF_SLOTS)]
+                matran = f"{muagiai}-{vong:02d}-{k + 1:02d}"
+                match = {
+                    "matran": matran,
+                    "muagiai": muagiai,
+                    "vong": vong,
+                    "thoigianthidau": (round_date + timedelta(days=day % interval)).replace(
+                        hour=hour, minute=minute
+                    ),
+                    "maclbnha": home,
+                    "maclbkhach": away,
+                    "masanvandong": stadium_of[home],
+                    "sokhangia": None,
+                    "nhietdo": None,
+                    "bugiohiep1": None,
+                    "bugiohiep2": None,
+                    "tiso": None,
+                    "banthangnha": None,
+                    "banthangkhach": None,
+                }
+                rows[LichThiDau].append(match)
+                if vong <= played_rounds:
+                    _play(rng, rows, match, squads[home], squads[away])
+    return data
+
+
+def _lineup(rng: random.Random, squad: list[_Player]) -> tuple[list[_Player], list[_Player]]:
+    """(starting XI in formation order, substitutes)"""
+    by_position: dict[str, list[_Player]] = {}
+    for player in squad:
+        by_position.setdefault(player.position, []).append(player)
+    starters = []
+    for position, count in FORMATION.items():
+        candidates = by_position.get(position, [])
+        starters += rng.sample(candidates, min(count, len(candidates)))
+    rest = [player for player in squad if player not in starters]
+    rng.shuffle(rest)
+    # Short of a position: fill the XI from the rest of the squad
+    missing = 11 - len(starters)
+    return starters + rest[:missing], rest[missing:missing + MATCHDAY_SQUAD - 11]
+
+
+def _play(
+    rng: random.Random,
+    rows: dict[type, list[dict[str, Any]]],
+    match: dict[str, Any],
+    home_squad: list[_Player],
+    away_squad: list[_Player],
+) -> None:
+    matran = match["matran"]
+    home_goals, away_goals = _poisson(rng, HOME_GOALS), _poisson(rng, AWAY_GOALS)
+    match.update(
+        tiso=f"{home_goals}-{away_goals}",
+        banthangnha=home_goals,
+        banthangkhach=away_goals,
+        sokhangia=rng.randrange(3_000, 25_000, 100),
+        nhietdo=round(rng.uniform(18, 34), 1),
+        bugiohiep1=rng.randint(1, 4),
+        bugiohiep2=rng.randint(2, 8),
+    )
+    events: list[dict[str, Any]] = []
+    on_pitch: list[_Player] = []
+
+    def event(loaisukien: str, player: _Player, maclb: str, minute: int, related: str | None = None) -> None:
+        bugio = None
+        if minute in (45, 90) and rng.random() < 0.3:
+            bugio = rng.randint(1, 5)
+        events.append({
+            "masukien": f"{matran}-{len(events) + 1:03d}",
+            "loaisukien": loaisukien,
+            "phutthidau": minute,
+            "bugio": bugio,
+            "motasukien": None,
+            "cauthulienquan": related,
+            "matran": matran,
+            "maclb": maclb,
+            "macauthu": player.macauthu,
+        })
+
+    for maclb, squad, goals in (
+        (match["maclbnha"], home_squad, home_goals),
+        (match["maclbkhach"], away_squad, away_goals),
+    ):
+        starters, substitutes = _lineup(rng, squad)
+        captain = rng.choice([p for p in starters if p.position != "GK"] or starters)
+        for player in starters + substitutes:
+            rows[DoiHinhXuatPhat].append({
+                "matran": matran,
+                "macauthu": player.macauthu,
+                "vitri": player.position,
+                "duocxuatphat": player in starters,
+                "ladoitruong": player is captain,
+            })
+        on_pitch += starters
+
+        weights = [SCORER_WEIGHTS[p.position] for p in starters]
+        for _ in range(goals):
+            scorer = rng.choices(starters, weights=weights)[0]
+            assist = None
+            if rng.random() < ASSIST_RATE:
+                assist = rng.choice([p for p in starters if p is not scorer]).macauthu
+            event("BanThang", scorer, maclb, rng.randint(1, 90), assist)
+        for player in rng.sample(starters, min(len(starters), _poisson(rng, YELLOWS_PER_TEAM))):
+            minute = rng.randint(10, 85)
+            event("TheVang", player, maclb, minute)
+            if rng.random() < SECOND_YELLOW_RATE:
+                minute = rng.randint(minute + 1, 90)
+                event("TheVang", player, maclb, minute)
+                event("TheDo", player, maclb, minute)
+        if rng.random() < REDS_PER_TEAM:
+            event("TheDo", rng.choice(starters), maclb, rng.randint(20, 90))
+        for player_on, player_off in zip(
+            substitutes[: rng.randint(3, 5)], rng.sample(starters[1:], 5), strict=False
+        ):
+            event("ThayNguoi", player_on, maclb, rng.randint(46, 88), player_off.macauthu)
+
+    mvp = rng.choice(on_pitch)
+    mvp_club = match["maclbnha"] if mvp in home_squad else match["maclbkhach"]
+    event("MVP", mvp, mvp_club, 0)
+    # Match order (the post-match MVP last), then renumber
+    events.sort(key=lambda row: (
+        row["loaisukien"] == "MVP", row["phutthidau"], row["bugio"] or 0
+    ))
+    for n, row in enumerate(events, start=1):
+        row["masukien"] = f"{matran}-{n:03d}"
+    rows[SuKienTranDau] += events
+
+
+def generate_league(
+    *,
+    seed: int = 0,
+    seasons: int = 1,
+    clubs: int = 14,
+    players_per_club: int = 30,
+    prefix: str = "SYN",
+    first_year: int = 2001,
+    played_ratio: float = 1.0,
+) -> Iterator[SeasonData]:
+    """
+    Seasons "{prefix}-{year}-{year + 1}" from `first_year` on, `clubs` clubs
+    each. Every season but the last is fully played; the last one has
+    `played_ratio` of its rounds played (the rest scheduled, no result).
+    """
+    if not 2 <= clubs <= 99:
+        raise ValueError(f"clubs must be between 2 and 99, got {clubs}")
+    if not FORMATION["GK"] + 17 <= players_per_club <= 60:
+        raise ValueError(f"players_per_club must be between 18 and 60, got {players_per_club}")
+    league = _League(seed=seed, prefix=prefix, clubs=clubs, players_per_club=players_per_club)
+    for index in range(seasons):
+        year = first_year + index
+        yield _season_rows(
+            league,
+            muagiai=f"{prefix}-{year}-{year + 1}",
+            year=year,
+            clubs=clubs,
+            played_ratio=played_ratio if index == seasons - 1 else 1.0,
+        )
+
+
+def _copy_rows(session: Session, model: type, rows: list[dict[str, Any]]) -> None:
+    """COPY rows into the model's table on the session's connection (and transaction)"""
+    columns = list(rows[0])
+    connection = session.connection().connection.driver_connection
+    with connection.cursor() as cursor:
+        with cursor.copy(
+            f"COPY {model.__table__.name} ({', '.join(columns)}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in columns])
+
+
+def load_season(*, session: Session, season: SeasonData, chunk_size: int = 5000) -> None:
+    """
+    Insert a generated season (one transaction) and build its derived
+    tables (standings, player stats).
+
+    PERF: COPY on PostgreSQL, multi-row INSERTs of `chunk_size` rows
+    elsewhere.
+    """
+    use_copy = session.get_bind().dialect.name == "postgresql"
+    for model in TABLES:
+        rows = season.rows.get(model, [])
+        if rows and use_copy:
+            _copy_rows(session, model, rows)
+            continue
+        for start in range(0, len(rows), chunk_size):
+            session.execute(insert(model.__table__), rows[start:start + chunk_size])
+    session.commit()
+    crud.rebuild_standings(session=session, muagiai=season.muagiai)
+    crud.rebuild_player_stats(session=session, muagiai=season.muagiai)
+
+
+def generate(**league: Any) -> None:
+    """
+    Load the seasons of generate_league(**league) that are not in the
+    database yet, logging rows and throughput (CLI and benchmark harness).
+    """
+    started = time.perf_counter()
+    total = 0
+    with Session(engine) as session:
+        for season in generate_league(**league):
+            if session.exec(
+                select(MuaGiai.muagiai).where(MuaGiai.muagiai == season.muagiai)
+            ).first():
+                logger.info(f"{season.muagiai} already exists, skipped")
+                continue
+            season_started = time.perf_counter()
+            load_season(session=session, season=season)
+            rows = sum(season.count(model) for model in TABLES)
+            total += rows
+            logger.info(
+                f"Loaded {season.muagiai}: {season.count(LichThiDau)} matches, "
+                f"{season.count(SuKienTranDau)} events, {rows} rows "
+                f"in {time.perf_counter() - season_started:.1f}s"
+            )
+    elapsed = time.perf_counter() - started
+    logger.info(f"{total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Load deterministic synthetic seasons (clubs, stadiums, players, "
+            "rosters, schedule, lineups, events) for scale testing"
+        )
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--seasons", type=int, default=1, help="Number of seasons (default: 1)")
+    parser.add_argument("--clubs", type=int, default=14, help="Clubs per season (default: 14)")
+    parser.add_argument(
+        "--players-per-club", type=int, default=30, help="Roster size (default: 30)"
+    )
+    parser.add_argument(
+        "--prefix", default="SYN", help="ID prefix of the generated rows (default: SYN)"
+    )
+    parser.add_argument(
+        "--first-year", type=int, default=2001, help="Start year of the first season (default: 2001)"
+    )
+    parser.add_argument(
+        "--played-ratio",
+        type=float,
+        default=1.0,
+        help="Share of the last season's rounds already played (default: 1.0)",
+    )
+    args = parser.parse_args()
+
+    try:
+        generate(
+            seed=args.seed,
+            seasons=args.seasons,
+            clubs=args.clubs,
+            players_per_club=args.players_per_club,
+            prefix=args.prefix,
+            first_year=args.first_year,
+            played_ratio=args.played_ratio,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
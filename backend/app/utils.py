@@ -155,6 +155,36 @@ def is_foreign(nationality: str | None) -> bool:
     return normalized is not None and normalized != "Vietnam"
 
 
+# =============================================
+# SEARCH TEXT FOLDING
+# =============================================
+
+def unaccent(text: str | None) -> str | None:
+    """
+    Strip diacritics the way PostgreSQL's unaccent does for Vietnamese:
+    "Nguyễn Văn Quyết" -> "Nguyen Van Quyet", "Đỗ" -> "Do".
+
+    Used for search keywords, and registered as f_unaccent() on SQLite
+    (crud.get_players / crud.search_players).
+    """
+    if text is None:
+        return None
+    import unicodedata
+
+    decomposed = unicodedata.normalize("NFD", text.replace("đ", "d").replace("Đ", "D"))
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def generate_player_id() -> str:
+    """
+    Server-generated player ID: "CT" + timestamp + 8 hex chars of a UUID.
+    """
+    import uuid
+
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    return f"CT{timestamp}{str(uuid.uuid4())[:8].upper()}"
+
+
 def generate_password_reset_token(email: str) -> str:
     from datetime import datetime, timedelta, timezone
     import jwt
@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core import security
+from app.core.config import settings
+from app.core.principal import principal_cache
+from app.models import NhomNguoiDung, TaiKhoan
+from tests.utils.queries import count_queries
+from tests.utils.utils import random_lower_string
+
+
+def _group(db: Session, tennhom: str) -> NhomNguoiDung:
+    group = db.exec(select(NhomNguoiDung).where(NhomNguoiDung.tennhom == tennhom)).first()
+    if group is None:
+        group = NhomNguoiDung(tennhom=tennhom)
+        db.add(group)
+        db.commit()
+        db.refresh(group)
+    return group
+
+
+def _user(db: Session, group: NhomNguoiDung) -> TaiKhoan:
+    user = TaiKhoan(
+        tendangnhap=f"user-{random_lower_string()[:12]}",
+        matkhau="not-a-real-hash",
+        manhom=group.manhom,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def _headers(user: TaiKhoan, **claims: object) -> dict[str, str]:
+    token = security.create_access_token(
+        user.mataikhoan, expires_delta=timedelta(minutes=5), claims=claims or None
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_principal_cached_and_invalidated(client: TestClient, db: Session) -> None:
+    btc = _group(db, "BTC")
+    viewer = _group(db, "Viewer")
+    user = _user(db, btc)
+    headers = _headers(user)
+    url = f"{settings.API_V1_STR}/monitoring/cache"
+    principal_cache.clear()
+
+    # Miss: account row + group name
+    with count_queries(db.get_bind()) as statements:
+        assert client.get(url, headers=headers).status_code == 200
+    assert len(statements) == 2
+
+    # Hit: authentication and role check cost no query
+    with count_queries(db.get_bind()) as statements:
+        assert client.get(url, headers=headers).status_code == 200
+        r = client.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+    assert statements == []
+    assert r.json()["tendangnhap"] == user.tendangnhap
+
+    # Changing the account's group drops the cached principal
+    user.manhom = viewer.manhom
+    db.add(user)
+    db.commit()
+    assert client.get(url, headers=headers).status_code == 403
+
+    user.isactive = False
+    db.add(user)
+    db.commit()
+    assert client.get(url, headers=headers).status_code == 400
+
+
+def test_principal_invalidated_on_commit_not_flush(client: TestClient, db: Session) -> None:
+    btc = _group(db, "BTC")
+    viewer = _group(db, "Viewer")
+    user = _user(db, btc)
+    headers = _headers(user)
+    url = f"{settings.API_V1_STR}/monitoring/cache"
+    principal_cache.clear()
+    assert client.get(url, headers=headers).status_code == 200
+    subject = str(user.mataikhoan)
+
+    # Flushed but not committed: another request must not drop (and then
+    # re-cache the still committed) old row; a rollback drops nothing
+    user.manhom = viewer.manhom
+    db.add(user)
+    db.flush()
+    assert principal_cache.get(subject) is not None
+    db.rollback()
+    assert principal_cache.get(subject) is not None
+
+    user.manhom = viewer.manhom
+    db.add(user)
+    db.commit()
+    assert principal_cache.get(subject) is None
+    assert client.get(url, headers=headers).status_code == 403
+
+    # Group changes clear every principal, also at commit
+    assert client.get(url, headers=headers).status_code == 403
+    viewer.mota = f"read-only {random_lower_string()[:8]}"
+    db.add(viewer)
+    db.flush()
+    assert principal_cache.get(subject) is not None
+    db.commit()
+    assert len(principal_cache) == 0
+
+
+def test_role_claim_skips_group_lookup(client: TestClient, db: Session) -> None:
+    btc = _group(db, "BTC")
+    viewer = _group(db, "Viewer")
+    user = _user(db, btc)
+    url = f"{settings.API_V1_STR}/monitoring/cache"
+    principal_cache.clear()
+
+    headers = _headers(user, role="BTC", manhom=btc.manhom)
+    with count_queries(db.get_bind()) as statements:
+        assert client.get(url, headers=headers).status_code == 200
+    assert len(statements) == 1
+
+    # A claim issued for another group is not trusted
+    principal_cache.clear()
+    user.manhom = viewer.manhom
+    db.add(user)
+    db.commit()
+    with count_queries(db.get_bind()) as statements:
+        assert client.get(url, headers=headers).status_code == 403
+    assert len(statements) == 2
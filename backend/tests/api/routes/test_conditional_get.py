@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.models import LichThiDauUpdate
+from tests.utils.league import create_match, create_random_season
+
+
+def test_standings_etag_not_modified(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    match = create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    url = f"{settings.API_V1_STR}/standings?muagiai={season.muagiai}"
+
+    r = client.get(url)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "last-modified" in r.headers
+    assert r.headers["cache-control"].startswith("public")
+
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers["etag"] == etag
+    assert not r.content
+
+    # Any write to the season changes the ETag
+    db.refresh(match)
+    crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso="1-0"))
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+    assert r.json()["standings"][0]["points"] == 3
+
+
+def test_match_detail_etag_scoped_to_match(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    m1 = create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    m2 = create_match(db, muagiai=season.muagiai, maclbnha="CLB02", maclbkhach="CLB01")
+
+    r1 = client.get(f"{settings.API_V1_STR}/matches/{m1.matran}")
+    r2 = client.get(f"{settings.API_V1_STR}/matches/{m2.matran}")
+    assert r1.status_code == r2.status_code == 200
+    assert r1.headers["etag"] != r2.headers["etag"]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/matches/{m2.matran}",
+        headers={"If-None-Match": r1.headers["etag"]},
+    )
+    assert r.status_code == 200
+
+    r = client.get(f"{settings.API_V1_STR}/matches/NO-SUCH-MATCH")
+    assert r.status_code == 404
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core import live
+from app.core.config import settings
+from app.core.live import RESYNC, LiveHub
+from app.models import LichThiDauUpdate
+from tests.utils.league import (
+    add_to_lineup,
+    create_event,
+    create_match,
+    create_random_player,
+    create_random_season,
+)
+
+
+def test_match_websocket_receives_deltas(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    player = create_random_player(db, muagiai=season.muagiai, maclb="CLB01", soaothidau=9)
+    match = create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    matran = match.matran
+
+    with client.websocket_connect(f"{settings.API_V1_STR}/live/matches/{matran}/ws") as ws, \
+            client.websocket_connect(f"{settings.API_V1_STR}/live/seasons/{season.muagiai}/ws") as season_ws:
+        add_to_lineup(db, match=match, player=player)
+        event = create_event(db, match=match, player=player, maclb="CLB01", loaisukien="BanThang")
+        db.refresh(match)
+        crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso="1-0"))
+
+        messages = [ws.receive_json() for _ in range(3)]
+        assert [m["type"] for m in messages] == ["lineup_added", "event_created", "match_updated"]
+        assert all(m["matran"] == matran for m in messages)
+        assert messages[1]["data"]["masukien"] == event.masukien
+        assert messages[2]["data"] == {"tiso": "1-0", "banthangnha": 1, "banthangkhach": 0}
+
+        # Season channel gets the same deltas
+        assert [season_ws.receive_json()["type"] for _ in range(3)] == [
+            "lineup_added", "event_created", "match_updated"
+        ]
+
+
+def test_live_unknown_match(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/live/matches/NO-SUCH-MATCH/sse")
+    assert r.status_code == 404
+
+
+def test_lagging_subscriber_gets_resync() -> None:
+    async def run() -> list[str]:
+        hub = LiveHub(queue_size=2)
+        subscription = hub.subscribe("match:M1")
+        for i in range(4):
+            hub.publish(["match:M1", "season:S1"], {"type": "event_created", "n": i})
+        await asyncio.sleep(0)  # let call_soon_threadsafe callbacks run
+        assert hub.published == 4  # serialized once per publish, not per channel
+        messages = []
+        while (payload := await subscription.get(timeout=0.01)) is not None:
+            messages.append(payload)
+        hub.unsubscribe(subscription)
+        assert hub.subscriber_count() == 0
+        return messages
+
+    # Queue of 2 overflowed by message 2: backlog replaced by one resync
+    messages = asyncio.run(run())
+    assert messages[0] == RESYNC
+    assert [json.loads(m)["n"] for m in messages[1:]] == [3]
+
+
+def test_publish_without_subscribers_is_free() -> None:
+    hub = LiveHub()
+    hub.publish(["match:M1"], {"type": "event_created"})
+    assert hub.published == 0
+
+
+def test_broker_listener_reconnects_with_backoff() -> None:
+    hub = LiveHub()
+    attempts: list[float] = []
+
+    async def relay() -> None:
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) in (2, 3):
+            raise ConnectionError("Redis restarted")
+        hub._connected()
+        if len(attempts) == 1:
+            raise ConnectionError("network blip")
+        await asyncio.Event().wait()  # connected until stopped
+
+    async def run() -> list[str]:
+        subscription = hub.subscribe("match:M1")
+        with patch.object(hub, "_relay", relay), \
+                patch.object(live, "BROKER_RETRY_MIN_SECONDS", 0.01):
+            hub._listener = asyncio.create_task(hub._listen())
+            while len(attempts) < 4:
+                await asyncio.sleep(0.01)
+            await hub.stop()
+        messages = []
+        while (payload := await subscription.get(timeout=0.01)) is not None:
+            messages.append(payload)
+        return messages
+
+    # Listener survives errors; subscribers resync after the reconnect
+    assert asyncio.run(run()) == [RESYNC]
+    assert hub.broker_connections == 2
+    gaps = [b - a for a, b in zip(attempts, attempts[1:], strict=False)]
+    # 0.01s after a live connection drops, then doubling while Redis stays down
+    assert gaps[2] >= 0.04 * 0.9
+
+
+def test_redis_publish_never_blocks_the_writer() -> None:
+    hub = LiveHub(broker="redis")
+    sent: list[tuple[str, int]] = []
+    redis_up = asyncio.Event()
+
+    class StalledRedis:
+        async def publish(self, channel: str, payload: str) -> None:
+            await redis_up.wait()
+            sent.append((channel, json.loads(payload)["n"]))
+
+        async def aclose(self) -> None:
+            pass
+
+    async def run() -> None:
+        hub._loop = asyncio.get_running_loop()
+        hub._redis = StalledRedis()
+        # A full outbox drops the message instead of waiting
+        hub._outbox = asyncio.Queue(maxsize=1)
+        hub._enqueue(["match:M1"], "{}")
+        hub._enqueue(["match:M1"], "{}")
+        assert hub.broker_dropped == 1
+
+        hub._outbox = asyncio.Queue(maxsize=10)
+        hub._sender = asyncio.create_task(hub._send())
+
+        def write() -> None:
+            # CRUD writes publish from the threadpool, Redis is stalled
+            for n in range(3):
+                hub.publish(["match:M1", "season:S1"], {"type": "event_created", "n": n})
+
+        await asyncio.wait_for(asyncio.to_thread(write), timeout=1)
+        assert sent == []
+        redis_up.set()
+        while len(sent) < 6:
+            await asyncio.sleep(0.01)
+        await hub.stop()
+
+    asyncio.run(run())
+    # Published later, on the event loop, in order
+    assert sent == [
+        ("vleague:live:match:M1", 0), ("vleague:live:season:S1", 0),
+        ("vleague:live:match:M1", 1), ("vleague:live:season:S1", 1),
+        ("vleague:live:match:M1", 2), ("vleague:live:season:S1", 2),
+    ]
+    assert hub.published == 3
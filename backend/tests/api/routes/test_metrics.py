@@ -0,0 +1,101 @@
+import asyncio
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.metrics import Histogram, operation_duration, request_duration, timed
+from tests.utils.league import create_random_season
+
+API = settings.API_V1_STR
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    """Value of the sample `name{labels...}` (labels in any order, extra labels allowed)"""
+    for line in text.splitlines():
+        if line.startswith(name + "{") or line.startswith(name + " "):
+            found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', line.split(" ")[0]))
+            if all(found.get(key) == value for key, value in labels.items()):
+                return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {name}{labels}")
+
+
+def test_histogram_exposition() -> None:
+    histogram = Histogram("h_seconds", "test", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, '/a/"b"')
+    histogram.observe(0.5, '/a/"b"')
+    histogram.observe(3.0, '/a/"b"')
+    assert histogram.render() == [
+        "# HELP h_seconds test",
+        "# TYPE h_seconds histogram",
+        'h_seconds_bucket{route="/a/\\"b\\"",le="0.1"} 1',
+        'h_seconds_bucket{route="/a/\\"b\\"",le="1.0"} 2',
+        'h_seconds_bucket{route="/a/\\"b\\"",le="+Inf"} 3',
+        'h_seconds_sum{route="/a/\\"b\\""} 3.55',
+        'h_seconds_count{route="/a/\\"b\\""} 3',
+    ]
+
+
+def test_timed_sync_and_async() -> None:
+    @timed("test_sync_operation")
+    def work() -> int:
+        return 1
+
+    @timed("test_async_operation")
+    async def work_async() -> int:
+        return 2
+
+    assert work() == 1 and work.__name__ == "work"
+    assert asyncio.run(work_async()) == 2
+    text = "\n".join(operation_duration.render())
+    assert _sample(text, "vleague_operation_duration_seconds_count", operation="test_sync_operation") >= 1
+    assert _sample(text, "vleague_operation_duration_seconds_count", operation="test_async_operation") >= 1
+
+
+def test_metrics_endpoint(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    crud.compute_standings(session=db, muagiai=season.muagiai)
+
+    before = "\n".join(request_duration.render())
+    route = f"{API}/clubs/{{club_id}}"
+    try:
+        count_before = _sample(
+            before, "vleague_http_request_duration_seconds_count", route=route, status="200"
+        )
+    except AssertionError:
+        count_before = 0
+
+    params = {"muagiai": season.muagiai}
+    assert client.get(f"{API}/clubs/CLB01", params=params).status_code == 200
+    assert client.get(f"{API}/clubs/CLB02", params=params).status_code == 200
+    client.get("/no-such-path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    # Labelled by route template, not the raw path
+    assert _sample(
+        text, "vleague_http_request_duration_seconds_count", method="GET", route=route, status="200"
+    ) == count_before + 2
+    assert "CLB01" not in text
+    assert _sample(text, "vleague_http_request_duration_seconds_count", route="unmatched", status="404") >= 1
+    # The /metrics request itself is in flight while rendering
+    assert _sample(text, "vleague_http_requests_in_flight", method="GET") >= 1
+
+    assert _sample(
+        text, "vleague_operation_duration_seconds_count", operation="compute_standings"
+    ) >= 1
+    assert _sample(text, "vleague_db_pool_checkouts_total", engine="sync") >= 0
+    assert _sample(text, "vleague_cache_hit_ratio", cache="principal") >= 0
+    assert _sample(text, "vleague_password_hash_pending") >= 0
+
+
+def test_metrics_disabled(client: TestClient) -> None:
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "METRICS_ENABLED", False)
+        assert client.get("/metrics").status_code == 404
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.models import CauThu, ScheduleGenerateRequest
+from tests.utils.league import create_match, create_random_season
+from tests.utils.utils import random_lower_string
+
+
+def _walk(client: TestClient, url: str, params: dict) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        r = client.get(url, params={**params, "cursor": cursor} if cursor else params)
+        assert r.status_code == 200
+        pages.append(r.json())
+        cursor = r.headers.get("x-next-cursor")
+        if cursor is None:
+            return pages
+
+
+def test_match_cursor_pagination(client: TestClient, db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("the match listing reads through the psycopg async driver (PostgreSQL)")
+
+    season, _ = create_random_season(db, num_clubs=6)
+    crud.generate_round_robin_schedule(
+        session=db,
+        request_in=ScheduleGenerateRequest(
+            muagiai=season.muagiai,
+            ngaybatdau_lutdi=datetime(2024, 8, 10),
+            ngaybatdau_lutve=datetime(2025, 1, 11),
+        ),
+    )
+    url = f"{settings.API_V1_STR}/matches/"
+    params = {"muagiai": season.muagiai, "limit": 7}
+
+    pages = _walk(client, url, params)
+    rows = [m for page in pages for m in page]
+    assert [len(page) for page in pages] == [7, 7, 7, 7, 2]
+    assert len({m["matran"] for m in rows}) == 30
+    assert rows == sorted(rows, key=lambda m: (m["thoigianthidau"], m["matran"]))
+
+    # Offset mode still works and hands out the same cursor
+    first = client.get(url, params=params)
+    assert first.json() == pages[0]
+    assert client.get(url, params={**params, "skip": 7}).json() == pages[1]
+    next_page = {**params, "cursor": first.headers["x-next-cursor"]}
+
+    # A row inserted before the cursor does not shift the next page
+    second = client.get(url, params=next_page)
+    create_match(
+        db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02",
+        thoigianthidau=datetime(2024, 8, 10, 9),
+    )
+    again = client.get(url, params=next_page)
+    assert again.json() == second.json()
+
+    assert client.get(url, params={**params, "cursor": "not-a-cursor"}).status_code == 400
+    assert client.get(url, params={**next_page, "skip": 7}).status_code == 400
+
+
+def test_club_and_player_keyset(client: TestClient, db: Session) -> None:
+    season, clubs = create_random_season(db, num_clubs=5)
+    pages = _walk(
+        client, f"{settings.API_V1_STR}/clubs/", {"muagiai": season.muagiai, "limit": 2}
+    )
+    assert [[c["maclb"] for c in page] for page in pages] == [
+        ["CLB01", "CLB02"], ["CLB03", "CLB04"], ["CLB05"]
+    ]
+
+    prefix = f"KS-{random_lower_string()[:8]}"
+    db.add_all(CauThu(macauthu=f"{prefix}-{i}", tencauthu=f"{prefix} {i}") for i in range(5))
+    db.commit()
+    seen: list[str] = []
+    after = None
+    while True:
+        page = crud.get_players(session=db, keyword=prefix, limit=2, after=after)
+        seen.extend(p.macauthu for p in page)
+        if len(page) < 2:
+            break
+        after = (page[-1].macauthu,)
+    assert seen == [f"{prefix}-{i}" for i in range(5)]
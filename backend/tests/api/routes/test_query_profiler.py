@@ -0,0 +1,104 @@
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core import profiler
+from app.core.config import settings
+from app.core.profiler import QueryBudgetExceeded, profiling, statement_shape
+from tests.utils.league import create_random_player, create_random_season
+
+API = settings.API_V1_STR
+
+# Statement budgets of hot public routes, enforced in strict mode below
+ROUTE_QUERY_BUDGETS = {
+    f"GET {API}/clubs/": 1,
+    f"GET {API}/clubs/{{club_id}}": 1,
+    f"GET {API}/season-management/seasons": 1,
+    f"GET {API}/season-management/seasons/{{season_id}}": 1,
+    f"GET {API}/stadiums/": 1,
+}
+
+
+def test_statement_shape() -> None:
+    assert statement_shape(
+        "SELECT a FROM t\n  WHERE b = %(b_1)s AND c IN (%(c_1_1)s, %(c_1_2)s, %(c_1_3)s)"
+    ) == "SELECT a FROM t WHERE b = ? AND c IN (?...)"
+    assert statement_shape("SELECT a FROM t WHERE b = ? AND c IN (?, ?)") == (
+        "SELECT a FROM t WHERE b = ? AND c IN (?...)"
+    )
+
+
+def test_profiling_reports_repeated_lookups(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=1)
+    muagiai = season.muagiai
+    player_ids = [
+        create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=n).macauthu
+        for n in range(1, 7)
+    ]
+
+    with profiling() as profile:
+        for macauthu in player_ids:  # N+1: one roster lookup per player
+            crud.get_roster_player(session=db, macauthu=macauthu, maclb="CLB01", muagiai=muagiai)
+        crud.get_roster(session=db, maclb="CLB01", muagiai=muagiai)
+
+    assert profile.queries == 7
+    assert profile.db_seconds > 0
+    [(shape, count)] = profile.repeated(threshold=5)
+    assert count == 6
+    assert shape.startswith("SELECT chitietdoibong.") and "macauthu = ?" in shape
+
+
+def test_middleware_timing_log_and_budget(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    profiler.logger.addHandler(handler)
+    url = f"{API}/clubs/"
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(settings, "QUERY_PROFILER_ENABLED", True)
+            mp.setattr(settings, "QUERY_PROFILER_STRICT", True)
+            mp.setattr(settings, "QUERY_BUDGETS", ROUTE_QUERY_BUDGETS)
+
+            r = client.get(url, params={"muagiai": season.muagiai})
+            assert r.status_code == 200
+            assert r.headers["server-timing"].startswith("db;dur=")
+            assert 'desc="1 queries"' in r.headers["server-timing"]
+            line = json.loads(records[-1].getMessage())
+            assert line["route"] == url and line["queries"] == 1 and line["budget"] == 1
+
+            mp.setattr(settings, "QUERY_BUDGETS", {f"GET {url}": 0})
+            with pytest.raises(QueryBudgetExceeded):
+                client.get(url, params={"muagiai": season.muagiai})
+    finally:
+        profiler.logger.removeHandler(handler)
+
+    # Disabled: no header
+    assert "server-timing" not in client.get(url).headers
+
+
+def test_hot_routes_within_query_budget(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=3)
+    checked: list[str] = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(profiler, "_log", lambda profile, status: checked.append(profile.key))
+        mp.setattr(settings, "QUERY_PROFILER_ENABLED", True)
+        mp.setattr(settings, "QUERY_PROFILER_STRICT", True)
+        mp.setattr(settings, "QUERY_BUDGETS", ROUTE_QUERY_BUDGETS)
+        for path, params in [
+            ("/clubs/", {"muagiai": season.muagiai}),
+            ("/clubs/CLB01", {"muagiai": season.muagiai}),
+            ("/season-management/seasons", {}),
+            (f"/season-management/seasons/{season.muagiai}", {}),
+            ("/stadiums/", {"muagiai": season.muagiai}),
+        ]:
+            r = client.get(f"{API}{path}", params=params)
+            assert r.status_code == 200, (path, r.text)
+            assert "server-timing" in r.headers
+    # Every budget key names a real route template
+    assert sorted(checked) == sorted(ROUTE_QUERY_BUDGETS)
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app import crud
+from app.core import security
+from app.core.config import settings
+from app.models import NhomNguoiDung, TaiKhoan
+from tests.utils.league import create_random_season
+from tests.utils.utils import random_lower_string
+
+
+def _btc_headers(db: Session) -> dict[str, str]:
+    group = db.exec(select(NhomNguoiDung).where(NhomNguoiDung.tennhom == "BTC")).first()
+    if group is None:
+        group = NhomNguoiDung(tennhom="BTC")
+        db.add(group)
+        db.commit()
+        db.refresh(group)
+    user = TaiKhoan(
+        tendangnhap=f"btc-{random_lower_string()[:12]}",
+        matkhau="not-a-real-hash",
+        manhom=group.manhom,
+    )
+    db.add(user)
+    db.commit()
+    token = security.create_access_token(user.mataikhoan, expires_delta=timedelta(minutes=5))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_import_squad_csv(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=1)
+    headers = _btc_headers(db)
+    url = f"{settings.API_V1_STR}/rosters/import/csv"
+    form = {"maclb": "CLB01", "muagiai": season.muagiai, "atomic": "false"}
+
+    squad = (
+        "tencauthu,ngaysinh,quoctich,vitrithidau,soaothidau\n"
+        "Nguyen Van A,1999-03-04,Việt Nam,GK,1\n"
+        "Tran Van B,,,DF,1\n"
+    )
+    r = client.post(url, headers=headers, data=form, files={"file": ("squad.csv", squad)})
+    assert r.status_code == 200
+    body = r.json()
+    assert [item["status"] for item in body["results"]] == ["created", "invalid"]
+    roster = crud.get_roster_detailed(session=db, maclb="CLB01", muagiai=season.muagiai)
+    assert [(p.tencauthu, p.quoctich, p.soaothidau) for p in roster] == [
+        ("Nguyen Van A", "Vietnam", 1)
+    ]
+
+    r = client.post(
+        url, headers=headers, data=form,
+        files={"file": ("squad.csv", "tencauthu,soaothidau\nC,ten\n")},
+    )
+    assert r.status_code == 400
+    assert r.json()["detail"].startswith("Line 2:")
+
+    r = client.post(
+        url, headers=headers, data={**form, "maclb": "NO-SUCH-CLUB"},
+        files={"file": ("squad.csv", squad)},
+    )
+    assert r.status_code == 404
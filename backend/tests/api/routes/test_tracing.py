@@ -0,0 +1,100 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core import tracing
+from app.core.cache import response_cache
+from app.core.config import settings
+from app.models import StandingsResponse
+from tests.utils.league import create_random_season
+
+API = settings.API_V1_STR
+
+
+@contextmanager
+def _traced() -> Iterator[Any]:
+    """Tracing on, spans exported synchronously to memory"""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracing.configure(SimpleSpanProcessor(exporter))
+    try:
+        yield exporter
+    finally:
+        tracing.shutdown()
+
+
+def _children(spans: list[Any], parent: Any) -> list[Any]:
+    return [s for s in spans if s.parent is not None and s.parent.span_id == parent.context.span_id]
+
+
+def test_disabled_tracing_is_a_no_op(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=1)
+    assert not tracing.enabled()
+    with tracing.span("unused") as span:
+        assert span is None
+    response = client.get(f"{API}/clubs/CLB01", params={"muagiai": season.muagiai})
+    assert response.status_code == 200
+    assert crud.get_club_by_id.__name__ == "get_club_by_id"
+
+
+def test_request_crud_and_sql_spans(client: TestClient, db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=1)
+    original = crud.get_club_by_id
+    with _traced() as exporter:
+        assert crud.get_club_by_id is not original
+        response = client.get(
+            f"{API}/clubs/CLB01",
+            params={"muagiai": season.muagiai},
+            headers={"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"},
+        )
+        assert response.status_code == 200
+        spans = exporter.get_finished_spans()
+    assert crud.get_club_by_id is original
+
+    [request_span] = [s for s in spans if s.name == f"GET {API}/clubs/{{club_id}}"]
+    assert request_span.attributes["http.route"] == f"{API}/clubs/{{club_id}}"
+    assert request_span.attributes["http.response.status_code"] == 200
+    # Continues the caller's trace
+    assert format(request_span.context.trace_id, "032x") == "0af7651916cd43dd8448eb211c80319c"
+
+    [crud_span] = [s for s in _children(spans, request_span) if s.name == "crud.get_club_by_id"]
+    [sql_span] = _children(spans, crud_span)
+    assert sql_span.name == "SELECT caulacbo"
+    assert "FROM caulacbo" in sql_span.attributes["db.statement"]
+
+
+def test_standings_serialization_span(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=4)
+    muagiai = season.muagiai  # loaded outside the trace
+    with _traced() as exporter:
+        with tracing.span("standings") as root:
+            response_cache.get_or_compute(
+                "standings",
+                muagiai=muagiai,
+                version=None,
+                model=StandingsResponse,
+                compute=lambda: crud.compute_standings(session=db, muagiai=muagiai),
+            )
+        spans = exporter.get_finished_spans()
+
+    children = _children(spans, root)
+    assert [s.name for s in children] == ["crud.compute_standings", "serialize"]
+    assert children[1].attributes["model"] == "StandingsResponse"
+    assert any(s.name.startswith("SELECT") for s in _children(spans, children[0]))
+
+
+def test_statement_name() -> None:
+    assert tracing._statement_name("SELECT a, b\nFROM lichthidau WHERE x = 1") == "SELECT lichthidau"
+    assert tracing._statement_name('INSERT INTO "cauthu" (a) VALUES (1)') == "INSERT cauthu"
+    assert tracing._statement_name("UPDATE muagiai SET x = 1") == "UPDATE muagiai"
+    assert tracing._statement_name("SELECT 1") == "SELECT"
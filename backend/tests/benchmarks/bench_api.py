@@ -0,0 +1,363 @@
+"""
+Load benchmark of the hot API endpoints, with saved baselines.
+
+Drives standings, player stats, awards, discipline, match detail, roster
+listing and (dry-run) schedule generation through the real routes:
+
+- in-process (default): the FastAPI app over httpx's ASGI transport, so
+  routing, dependencies, caching and serialization are all measured
+- `--base-url http://host:8000`: a running server (start it with
+  QUERY_PROFILER_ENABLED=true to get queries per request; tokens are
+  minted with the local SECRET_KEY, so point both at the same settings)
+
+Two phases: `serial` (one request at a time, `--requests` per endpoint)
+and `load` (`--load-requests` of the weighted mix with `--concurrency` in
+flight). Reported per endpoint: p50/p95/p99 latency, queries per request
+(from the profiler's Server-Timing header) and throughput.
+
+`--generate` first loads synthetic seasons (app.synthetic_data: N seasons
+of 14-40 clubs, 30 players per roster, full double round-robin, realistic
+event densities); seasons already loaded are skipped.
+
+Baselines: `--save-baseline FILE` writes the results as JSON; `--baseline
+FILE` compares against one and exits 1 on a regression (p95 more than
+`--tolerance` above the baseline, or more queries per request).
+
+Usage (from backend/, against the configured database):
+    python -m tests.benchmarks.bench_api --generate --seasons 2 --clubs 20 \
+        --save-baseline /tmp/bench-baseline.json
+    python -m tests.benchmarks.bench_api --baseline /tmp/bench-baseline.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+from sqlmodel import Session, select
+
+from app.core import security
+from app.core.cache import NullCacheBackend, response_cache
+from app.core.config import settings
+from app.core.db import engine
+from app.models import CauLacBo, LichThiDau, MuaGiai, NhomNguoiDung, TaiKhoan
+from app.synthetic_data import generate
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+API = settings.API_V1_STR
+BENCH_USER = "bench-btc"
+_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+# endpoint -> weight in the load mix
+ENDPOINTS = {
+    "standings": 20,
+    "match_detail": 25,
+    "roster": 15,
+    "player_stats": 10,
+    "awards": 10,
+    "discipline": 10,
+    "schedule_generate": 2,
+}
+
+
+@dataclass
+class Target:
+    muagiai: str
+    matches: list[str]
+    clubs: list[str]
+    season_start: datetime
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    seconds: float
+    status: int
+    queries: int | None
+
+
+@dataclass
+class PhaseResult:
+    elapsed: float = 0.0
+    samples: list[Sample] = field(default_factory=list)
+
+
+def _target(session: Session, muagiai: str | None, prefix: str) -> Target:
+    if not muagiai:
+        muagiai = session.exec(
+            select(MuaGiai.muagiai)
+            .where(MuaGiai.muagiai.startswith(f"{prefix}-"))
+            .order_by(MuaGiai.ngaybatdau.desc())
+        ).first()
+        if not muagiai:
+            raise SystemExit(f"No {prefix}-* season found - run with --generate")
+    season = session.get(MuaGiai, muagiai)
+    if season is None:
+        raise SystemExit(f"Season {muagiai} not found")
+    matches = list(session.exec(
+        select(LichThiDau.matran).where(
+            LichThiDau.muagiai == muagiai, LichThiDau.banthangnha.is_not(None)
+        )
+    ).all())
+    clubs = list(session.exec(select(CauLacBo.maclb).where(CauLacBo.muagiai == muagiai)).all())
+    if not matches or not clubs:
+        raise SystemExit(f"Season {muagiai} has no played matches/clubs")
+    return Target(muagiai, matches, clubs, season.ngaybatdau or datetime(2000, 8, 1))
+
+
+def _bench_token(session: Session) -> str:
+    """Token of a BTC account for the authenticated endpoints (created if missing)"""
+    group = session.exec(select(NhomNguoiDung).where(NhomNguoiDung.tennhom == "BTC")).first()
+    if group is None:
+        group = NhomNguoiDung(tennhom="BTC")
+        session.add(group)
+        session.commit()
+        session.refresh(group)
+    user = session.exec(select(TaiKhoan).where(TaiKhoan.tendangnhap == BENCH_USER)).first()
+    if user is None:
+        user = TaiKhoan(tendangnhap=BENCH_USER, matkhau="!", manhom=group.manhom)
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+    return security.create_access_token(user.mataikhoan, expires_delta=timedelta(hours=2))
+
+
+def _request(endpoint: str, target: Target, rng: random.Random) -> tuple[str, str, dict[str, Any]]:
+    """(method, url, httpx keyword arguments) of one request to `endpoint`"""
+    season = {"muagiai": target.muagiai}
+    if endpoint == "standings":
+        return "GET", f"{API}/standings", {"params": season}
+    if endpoint == "player_stats":
+        return "GET", f"{API}/stats/players", {"params": season}
+    if endpoint == "awards":
+        return "GET", f"{API}/stats/awards", {"params": season}
+    if endpoint == "discipline":
+        return "GET", f"{API}/stats/discipline", {"params": season}
+    if endpoint == "match_detail":
+        return "GET", f"{API}/matches/{rng.choice(target.matches)}", {}
+    if endpoint == "roster":
+        return "GET", f"{API}/rosters/", {"params": {**season, "maclb": rng.choice(target.clubs)}}
+    if endpoint == "schedule_generate":
+        start = target.season_start + timedelta(days=14)
+        body = {
+            "muagiai": target.muagiai,
+            "ngaybatdau_lutdi": start.isoformat(),
+            "ngaybatdau_lutve": (start + timedelta(days=140)).isoformat(),
+            "interval_days": 3,
+            "dry_run": True,
+        }
+        return "POST", f"{API}/schedule/generate", {"json": body}
+    raise ValueError(f"Unknown endpoint {endpoint}")
+
+
+async def _run(
+    client: httpx.AsyncClient, workload: list[tuple[str, str, str, dict]], concurrency: int
+) -> PhaseResult:
+    semaphore = asyncio.Semaphore(concurrency)
+    result = PhaseResult()
+
+    async def one(endpoint: str, method: str, url: str, kwargs: dict) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            seconds = time.perf_counter() - started
+        match = _QUERIES.search(response.headers.get("server-timing", ""))
+        result.samples.append(
+            Sample(endpoint, seconds, response.status_code, int(match.group(1)) if match else None)
+        )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(*item) for item in workload))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted `values`"""
+    index = max(0, min(len(values) - 1, round(percent / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+
+def _summarize(result: PhaseResult) -> dict[str, dict[str, Any]]:
+    by_endpoint: dict[str, list[Sample]] = {}
+    for sample in result.samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+    summary = {}
+    for endpoint, samples in sorted(by_endpoint.items()):
+        latencies = sorted(sample.seconds for sample in samples)
+        queries = [sample.queries for sample in samples if sample.queries is not None]
+        summary[endpoint] = {
+            "requests": len(samples),
+            "errors": sum(sample.status >= 400 for sample in samples),
+            "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+            "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+            "throughput_rps": round(len(samples) / result.elapsed, 1),
+        }
+    return summary
+
+
+def _log_phase(phase: str, summary: dict[str, dict[str, Any]], elapsed: float) -> None:
+    total = sum(row["requests"] for row in summary.values())
+    logger.info(f"\n{phase}: {total} requests in {elapsed:.1f}s = {total / elapsed:.1f} req/s")
+    logger.info(
+        f"  {'endpoint':<18} {'req':>6} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'queries':>8} {'req/s':>8}"
+    )
+    for endpoint, row in summary.items():
+        queries = "-" if row["queries_per_request"] is None else row["queries_per_request"]
+        logger.info(
+            f"  {endpoint:<18} {row['requests']:>6} {row['errors']:>4} {row['p50_ms']:>9} "
+            f"{row['p95_ms']:>9} {row['p99_ms']:>9} {queries:>8} {row['throughput_rps']:>8}"
+        )
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], *, tolerance: float, slack_ms: float = 1.0
+) -> list[str]:
+    """Regressions of `results` against `baseline` (same JSON layout)"""
+    regressions = []
+    for phase, endpoints in results["phases"].items():
+        for endpoint, row in endpoints.items():
+            base = baseline.get("phases", {}).get(phase, {}).get(endpoint)
+            if base is None:
+                continue
+            limit = base["p95_ms"] * (1 + tolerance) + slack_ms
+            if row["p95_ms"] > limit:
+                regressions.append(
+                    f"{phase}/{endpoint}: p95 {row['p95_ms']} ms > {limit:.2f} ms "
+                    f"(baseline {base['p95_ms']} ms)"
+                )
+            if (
+                row["queries_per_request"] is not None
+                and base.get("queries_per_request") is not None
+                and row["queries_per_request"] > base["queries_per_request"]
+            ):
+                regressions.append(
+                    f"{phase}/{endpoint}: {row['queries_per_request']} queries per request "
+                    f"(baseline {base['queries_per_request']})"
+                )
+            if row["errors"] > base.get("errors", 0):
+                regressions.append(f"{phase}/{endpoint}: {row['errors']} errors")
+    return regressions
+
+
+async def bench(args: argparse.Namespace, target: Target, token: str) -> dict[str, Any]:
+    if args.base_url:
+        transport = None
+        base_url = args.base_url
+    else:
+        from app.main import app
+
+        # Queries per request come from the profiler's Server-Timing header
+        settings.QUERY_PROFILER_ENABLED = True
+        if args.no_cache:
+            response_cache.backend = NullCacheBackend()
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://bench"
+
+    rng = random.Random(args.seed)
+    endpoints = [name for name in ENDPOINTS if name in args.endpoints]
+    serial = [
+        (endpoint, *_request(endpoint, target, rng))
+        for endpoint in endpoints
+        for _ in range(args.requests)
+    ]
+    mix = rng.choices(endpoints, weights=[ENDPOINTS[name] for name in endpoints], k=args.load_requests)
+    load = [(endpoint, *_request(endpoint, target, rng)) for endpoint in mix]
+
+    phases = {}
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=120,
+    ) as client:
+        # Warm-up: lazy derived tables, caches, connection pools
+        await _run(client, [(e, *_request(e, target, rng)) for e in endpoints], 1)
+        for phase, workload, concurrency in (
+            ("serial", serial, 1),
+            ("load", load, args.concurrency),
+        ):
+            if not workload:
+                continue
+            result = await _run(client, workload, concurrency)
+            phases[phase] = _summarize(result)
+            _log_phase(f"{phase} (concurrency {concurrency})", phases[phase], result.elapsed)
+
+    return {
+        "muagiai": target.muagiai,
+        "matches": len(target.matches),
+        "clubs": len(target.clubs),
+        "mode": args.base_url or "in-process",
+        "cache": not args.no_cache,
+        "concurrency": args.concurrency,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "phases": phases,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hot endpoint load benchmark")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--muagiai", help="Season to read (default: latest --prefix season)")
+    parser.add_argument("--requests", type=int, default=50, help="Serial requests per endpoint")
+    parser.add_argument("--load-requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--no-cache", action="store_true", help="Disable the response cache (in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generate", action="store_true", help="Load synthetic seasons first")
+    parser.add_argument("--seasons", type=int, default=1)
+    parser.add_argument("--clubs", type=int, default=14, help="Clubs per season (14-40)")
+    parser.add_argument("--players", type=int, default=30, help="Players per roster")
+    parser.add_argument("--prefix", default="BENCH", help="ID prefix of generated data")
+    parser.add_argument("--baseline", help="Compare against this baseline JSON")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 increase")
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(
+            seed=args.seed, seasons=args.seasons, clubs=args.clubs,
+            players_per_club=args.players, prefix=args.prefix,
+        )
+    with Session(engine) as session:
+        target = _target(session, args.muagiai, args.prefix)
+        token = _bench_token(session)
+    logger.info(
+        f"season {target.muagiai}: {len(target.clubs)} clubs, {len(target.matches)} played matches, "
+        f"{'in-process' if not args.base_url else args.base_url}"
+        f"{', no cache' if args.no_cache else ''}"
+    )
+
+    results = asyncio.run(bench(args, target, token))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"\nBaseline saved to {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, tolerance=args.tolerance)
+        if regressions:
+            logger.info("\nRegressions against " + args.baseline + ":")
+            for line in regressions:
+                logger.info(f"  {line}")
+            sys.exit(1)
+        logger.info(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
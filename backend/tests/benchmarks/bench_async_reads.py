@@ -0,0 +1,195 @@
+"""
+Load benchmark: sync (threadpool) vs async (AsyncSession) read paths.
+
+Replays the hot read mix (match list, match detail, standings, roster) against
+an existing season, with `--concurrency` requests in flight:
+
+- sync:  crud.* on a blocking Session, dispatched to a thread pool of
+         `--threads` workers (FastAPI/anyio default: 40), like `def` routes
+- async: crud.*_async on an AsyncSession, awaited on one event loop,
+         like `async def` routes
+
+`--db-latency-ms` adds a `pg_sleep()` round trip to every request to emulate
+a remote database (the case where the threadpool cap, not the CPU, limits
+throughput).
+
+Usage (from backend/, season data already loaded):
+    python -m tests.benchmarks.bench_async_reads --muagiai 2024-2025 \
+        --concurrency 200 --requests 4000 --db-latency-ms 20
+"""
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import crud
+from app.core.config import settings
+from app.models import CauLacBo, LichThiDau, MuaGiai
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("matches", "match_detail", "standings", "roster")
+
+
+def _pick_season(session: Session, muagiai: str | None) -> tuple[str, list[str], list[str]]:
+    if not muagiai:
+        muagiai = session.exec(
+            select(MuaGiai.muagiai).order_by(MuaGiai.ngaybatdau.desc())
+        ).first()
+        if not muagiai:
+            raise SystemExit("No season found - load data first")
+    matches = list(session.exec(select(LichThiDau.matran).where(LichThiDau.muagiai == muagiai)).all())
+    clubs = list(session.exec(select(CauLacBo.maclb).where(CauLacBo.muagiai == muagiai)).all())
+    if not matches or not clubs:
+        raise SystemExit(f"Season {muagiai} has no matches/clubs")
+    return muagiai, matches, clubs
+
+
+def _workload(n: int, matches: list[str], clubs: list[str], seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    ops = []
+    for i in range(n):
+        op = OPERATIONS[i % len(OPERATIONS)]
+        arg = rng.choice(clubs) if op == "roster" else rng.choice(matches)
+        ops.append((op, arg))
+    return ops
+
+
+def _run_sync(session: Session, op: str, arg: str, muagiai: str, latency: float) -> None:
+    if latency:
+        session.exec(text("SELECT pg_sleep(:s)").bindparams(s=latency))
+    if op == "matches":
+        crud.get_matches(session=session, muagiai=muagiai, limit=100)
+    elif op == "match_detail":
+        crud.get_match_detail(session=session, matran=arg)
+    elif op == "standings":
+        crud.compute_standings(session=session, muagiai=muagiai)
+    else:
+        crud.get_roster_detailed(session=session, maclb=arg, muagiai=muagiai)
+
+
+async def _run_async(session: AsyncSession, op: str, arg: str, muagiai: str, latency: float) -> None:
+    if latency:
+        await session.exec(text("SELECT pg_sleep(:s)").bindparams(s=latency))
+    if op == "matches":
+        await crud.get_matches_async(session=session, muagiai=muagiai, limit=100)
+    elif op == "match_detail":
+        await crud.get_match_detail_async(session=session, matran=arg)
+    elif op == "standings":
+        await crud.compute_standings_async(session=session, muagiai=muagiai)
+    else:
+        await crud.get_roster_detailed_async(session=session, maclb=arg, muagiai=muagiai)
+
+
+def bench_sync(
+    url: str, workload: list[tuple[str, str]], *, muagiai: str, threads: int, latency: float
+) -> tuple[float, list[float]]:
+    engine = create_engine(url, pool_size=threads, max_overflow=0)
+
+    def one(op: str, arg: str) -> float:
+        start = time.perf_counter()
+        with Session(engine) as session:
+            _run_sync(session, op, arg, muagiai, latency)
+        return time.perf_counter() - start
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = list(pool.map(lambda item: one(*item), workload))
+        return time.perf_counter() - started, latencies
+    finally:
+        engine.dispose()
+
+
+async def bench_async(
+    url: str, workload: list[tuple[str, str]], *, muagiai: str, concurrency: int, latency: float
+) -> tuple[float, list[float]]:
+    engine = create_async_engine(url, pool_size=concurrency, max_overflow=0)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(op: str, arg: str) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await _run_async(session, op, arg, muagiai, latency)
+            return time.perf_counter() - start
+
+    try:
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one(op, arg) for op, arg in workload))
+        return time.perf_counter() - started, list(latencies)
+    finally:
+        await engine.dispose()
+
+
+def _report(mode: str, elapsed: float, latencies: list[float]) -> dict[str, Any]:
+    q = statistics.quantiles(latencies, n=100)
+    result = {
+        "mode": mode,
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(q[49] * 1000, 2),
+        "p95_ms": round(q[94] * 1000, 2),
+        "p99_ms": round(q[98] * 1000, 2),
+    }
+    logger.info(
+        f"{mode:>5}: {result['throughput_rps']:>8} req/s  "
+        f"p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  p99 {result['p99_ms']:>8} ms"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sync vs async read path load benchmark")
+    parser.add_argument("--url", default=str(settings.SQLALCHEMY_DATABASE_URI))
+    parser.add_argument("--muagiai", help="Season to read (default: latest season)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100, help="In-flight requests (async mode)")
+    parser.add_argument("--threads", type=int, default=40, help="Threadpool size (sync mode)")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=("both", "sync", "async"), default="both")
+    args = parser.parse_args()
+
+    setup_engine = create_engine(args.url)
+    with Session(setup_engine) as session:
+        muagiai, matches, clubs = _pick_season(session, args.muagiai)
+        # Warm the derived tables so neither mode pays the lazy first build
+        crud.compute_standings(session=session, muagiai=muagiai)
+    setup_engine.dispose()
+
+    workload = _workload(args.requests, matches, clubs, args.seed)
+    latency = args.db_latency_ms / 1000
+    logger.info(
+        f"season {muagiai}: {len(matches)} matches, {len(clubs)} clubs, "
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"threads {args.threads}, db latency {args.db_latency_ms} ms"
+    )
+
+    if args.mode in ("both", "sync"):
+        elapsed, latencies = bench_sync(
+            args.url, workload, muagiai=muagiai, threads=args.threads, latency=latency
+        )
+        _report("sync", elapsed, latencies)
+    if args.mode in ("both", "async"):
+        elapsed, latencies = asyncio.run(
+            bench_async(
+                args.url, workload, muagiai=muagiai,
+                concurrency=args.concurrency, latency=latency,
+            )
+        )
+        _report("async", elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark: bcrypt logins per second per core.
+
+Measures password verification (what a login costs) at `--rounds`:
+
+- inline: one process, serial verify_and_update() (the old in-route path)
+- pool:   `--workers` processes behind PasswordHasher, `--logins` verifies
+          submitted at once (a login burst), reported per worker/core
+
+Use it to pick BCRYPT_ROUNDS and PASSWORD_HASH_WORKERS: expected login
+capacity of one API host ~= logins/s per core x hashing workers.
+
+Usage (from backend/):
+    python -m tests.benchmarks.bench_password_hashing --rounds 12 --workers 4
+"""
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.core.hashing import PasswordHasher
+from app.core.security import make_crypt_context
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+PASSWORD = "correct horse battery staple"
+
+
+def bench_inline(rounds: int, logins: int) -> float:
+    context = make_crypt_context(rounds)
+    hashed = context.hash(PASSWORD)
+    started = time.perf_counter()
+    for _ in range(logins):
+        context.verify_and_update(PASSWORD, hashed)
+    return logins / (time.perf_counter() - started)
+
+
+def bench_pool(rounds: int, workers: int, logins: int) -> float:
+    hasher = PasswordHasher(workers=workers, max_pending=logins, rounds=rounds)
+    try:
+        hashed = hasher.hash(PASSWORD)
+        # Warm every worker process (spawn + imports) outside the timing
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda _: hasher.verify_and_update(PASSWORD, hashed), range(workers)))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=logins) as pool:
+            list(pool.map(lambda _: hasher.verify_and_update(PASSWORD, hashed), range(logins)))
+        return logins / (time.perf_counter() - started)
+    finally:
+        hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="bcrypt logins/s per core")
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--logins", type=int, default=100)
+    args = parser.parse_args()
+
+    logger.info(f"bcrypt cost {args.rounds}, {args.logins} logins, {os.cpu_count()} CPUs")
+    inline = bench_inline(args.rounds, args.logins)
+    logger.info(f"inline: {inline:8.1f} logins/s (1 core)")
+    pooled = bench_pool(args.rounds, args.workers, args.logins)
+    logger.info(
+        f"pool:   {pooled:8.1f} logins/s with {args.workers} workers "
+        f"= {pooled / args.workers:.1f} logins/s per core"
+    )
+
+
+if __name__ == "__main__":
+    main()
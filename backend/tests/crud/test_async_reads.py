@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import crud
+from tests.utils.league import (
+    add_to_lineup,
+    create_event,
+    create_match,
+    create_random_player,
+    create_random_season,
+)
+
+
+def test_async_reads_match_sync(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("async read paths use the psycopg async driver (PostgreSQL)")
+
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    scorer = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso="1-0")
+    create_event(db, match=match, player=scorer, maclb="CLB01", loaisukien="BanThang")
+    create_event(db, match=match, player=scorer, maclb="CLB01", loaisukien="TheVang")
+    add_to_lineup(db, match=match, player=scorer)
+
+    async def read_all() -> dict:
+        engine = create_async_engine(db.get_bind().url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return {
+                    "marker": await crud.get_season_data_marker_async(
+                        session=session, muagiai=muagiai
+                    ),
+                    "matches": await crud.get_matches_async(session=session, muagiai=muagiai),
+                    "detail": await crud.get_match_detail_async(
+                        session=session, matran=match.matran
+                    ),
+                    "events": await crud.get_match_events_async(
+                        session=session, matran=match.matran
+                    ),
+                    "roster": await crud.get_roster_detailed_async(
+                        session=session, maclb="CLB01", muagiai=muagiai
+                    ),
+                    "standings": await crud.compute_standings_async(
+                        session=session, muagiai=muagiai
+                    ),
+                    "player_stats": await crud.compute_player_stats_async(
+                        session=session, muagiai=muagiai
+                    ),
+                    "missing": await crud.get_match_detail_async(
+                        session=session, matran="NO-SUCH-MATCH"
+                    ),
+                }
+        finally:
+            await engine.dispose()
+
+    result = asyncio.run(read_all())
+
+    marker = crud.get_season_data_marker(session=db, muagiai=muagiai)
+    assert result["marker"].phienbandulieu == marker.phienbandulieu
+    assert result["matches"] == crud.get_matches(session=db, muagiai=muagiai)
+    assert result["detail"].model_dump() == crud.get_match_detail(
+        session=db, matran=match.matran
+    ).model_dump()
+    assert [e.masukien for e in result["events"]] == [
+        e.masukien for e in crud.get_match_events(session=db, matran=match.matran)
+    ]
+    assert result["roster"] == crud.get_roster_detailed(
+        session=db, maclb="CLB01", muagiai=muagiai
+    )
+    assert result["standings"].standings == crud.compute_standings(
+        session=db, muagiai=muagiai
+    ).standings
+    assert result["player_stats"].stats == crud.compute_player_stats(
+        session=db, muagiai=muagiai
+    ).stats
+    assert result["missing"] is None
@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from app.core import pool as db_pool
+from app.core.pool import PoolStats, engine_options, pool_stats, timed_pool_class
+
+
+def test_timed_pool_reports_in_use_and_timeouts() -> None:
+    stats = PoolStats()
+    engine = create_engine(
+        "sqlite://",
+        poolclass=timed_pool_class(QueuePool, stats),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        held = engine.connect()
+        snapshot = pool_stats(engine, stats)
+        assert snapshot["checkouts"] == 1
+        assert snapshot["in_use"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        snapshot = pool_stats(engine, stats)
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_seconds_max"] >= 0.05
+
+        held.close()
+        with engine.connect():
+            pass
+        snapshot = pool_stats(engine, stats)
+        assert snapshot["checkouts"] == 2
+        assert snapshot["in_use"] == 0
+        assert snapshot["idle"] == 1
+
+        # Stats survive the pool being recreated (e.g. after a failover)
+        engine.dispose()
+        with engine.connect():
+            pass
+        assert pool_stats(engine, stats)["checkouts"] == 3
+    finally:
+        engine.dispose()
+
+
+def test_pgbouncer_mode_disables_prepared_statements(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db_pool.settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+    monkeypatch.setattr(db_pool.settings, "DB_PGBOUNCER_MODE", False)
+    assert engine_options()["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    monkeypatch.setattr(db_pool.settings, "DB_PGBOUNCER_MODE", True)
+    connect_args = engine_options(is_async=True)["connect_args"]
+    assert connect_args == {"prepare_threshold": None}
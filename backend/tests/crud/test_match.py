@@ -0,0 +1,80 @@
+import pytest
+from sqlmodel import Session
+
+from app import crud
+from app.models import LichThiDauCreate, LichThiDauUpdate
+from tests.utils.league import create_match, create_random_season
+from tests.utils.utils import random_lower_string
+
+
+def test_create_match_derives_goals_from_tiso(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    match = create_match(
+        db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso=" 2 - 1 "
+    )
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == ("2-1", 2, 1)
+
+
+def test_create_match_derives_tiso_from_goals(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    match_in = LichThiDauCreate(
+        matran=f"M-{random_lower_string()[:16]}",
+        muagiai=season.muagiai,
+        vong=1,
+        thoigianthidau=season.ngaybatdau,
+        maclbnha="CLB01",
+        maclbkhach="CLB02",
+        banthangnha=0,
+        banthangkhach=3,
+    )
+    match = crud.create_match(session=db, match_in=match_in)
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == ("0-3", 0, 3)
+
+
+@pytest.mark.parametrize(
+    "score",
+    [
+        {"tiso": "abc"},
+        {"tiso": "1-2-3"},
+        {"tiso": "-1-2"},
+        {"tiso": "2-1", "banthangnha": 1, "banthangkhach": 2},
+        {"banthangnha": 1},
+        {"banthangnha": -1, "banthangkhach": 0},
+    ],
+)
+def test_create_match_rejects_invalid_score(db: Session, score: dict) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    match_in = LichThiDauCreate(
+        matran=f"M-{random_lower_string()[:16]}",
+        muagiai=season.muagiai,
+        vong=1,
+        thoigianthidau=season.ngaybatdau,
+        maclbnha="CLB01",
+        maclbkhach="CLB02",
+        **score,
+    )
+    with pytest.raises(ValueError):
+        crud.create_match(session=db, match_in=match_in)
+
+
+def test_update_match_keeps_score_consistent(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    match = create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == (None, None, None)
+
+    match = crud.update_match(
+        session=db, db_match=match, match_in=LichThiDauUpdate(banthangnha=4, banthangkhach=4)
+    )
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == ("4-4", 4, 4)
+
+    match = crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso="1-0"))
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == ("1-0", 1, 0)
+
+    with pytest.raises(ValueError):
+        crud.update_match(
+            session=db, db_match=match, match_in=LichThiDauUpdate(tiso="2-0", banthangnha=3, banthangkhach=0)
+        )
+    db.rollback()
+
+    match = crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso=None))
+    assert (match.tiso, match.banthangnha, match.banthangkhach) == (None, None, None)
@@ -0,0 +1,102 @@
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import SuKienTranDau, SuKienTranDauCreate, ThongKeCauThu
+from tests.utils.league import (
+    add_to_lineup,
+    create_match,
+    create_random_player,
+    create_random_season,
+)
+from tests.utils.queries import count_queries
+from tests.utils.utils import random_lower_string
+
+COUNTERS = ("banthang", "kientao", "thevang", "thevangthu2", "thedo")
+
+
+def _event(**fields: object) -> SuKienTranDauCreate:
+    fields.setdefault("masukien", f"E-{random_lower_string()[:16]}")
+    fields.setdefault("phutthidau", 10)
+    return SuKienTranDauCreate(**fields)
+
+
+def _stats(db: Session, muagiai: str) -> list[tuple]:
+    rows = db.exec(select(ThongKeCauThu).where(ThongKeCauThu.muagiai == muagiai)).all()
+    return sorted(
+        (row.macauthu, *(getattr(row, c) for c in COUNTERS))
+        for row in rows
+        if any(getattr(row, c) for c in COUNTERS)
+    )
+
+
+def test_bulk_ingestion_validates_per_item(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=3)
+    muagiai = season.muagiai
+    scorer = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    assister = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=10)
+    defender = create_random_player(db, muagiai=muagiai, maclb="CLB02", soaothidau=4)
+    outsider = create_random_player(db, muagiai=muagiai, maclb="CLB03", soaothidau=7)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    add_to_lineup(db, match=match, player=scorer)
+    crud.compute_player_stats(session=db, muagiai=muagiai)  # build the season table
+
+    goal = _event(
+        loaisukien="Ban Thang", maclb="CLB01", macauthu=scorer.macauthu,
+        cauthulienquan=assister.macauthu,
+    )
+    events = [
+        goal,
+        _event(loaisukien="TheVang", maclb="CLB02", macauthu=defender.macauthu, phutthidau=20),
+        _event(loaisukien="TheVang", maclb="CLB02", macauthu=defender.macauthu, phutthidau=70),
+        _event(loaisukien="TheVang", maclb="CLB01", macauthu="NO-SUCH-PLAYER"),
+        _event(loaisukien="TheVang", maclb="CLB03", macauthu=outsider.macauthu),
+        _event(loaisukien="TheVang", maclb="CLB02", macauthu=scorer.macauthu),
+        _event(loaisukien="TheVang", maclb="CLB01", macauthu=scorer.macauthu, phutthidau=131),
+        _event(masukien=goal.masukien, loaisukien="BanThang", maclb="CLB01", macauthu=scorer.macauthu),
+    ]
+
+    with count_queries(db.get_bind()) as statements:
+        result = crud.create_match_events_bulk(session=db, matran=match.matran, events_in=events)
+
+    assert [item.status for item in result.results] == [
+        "created", "created", "created", "invalid", "invalid", "invalid", "invalid", "duplicate",
+    ]
+    assert "not found" in result.results[3].detail
+    assert "not playing" in result.results[4].detail
+    assert "not in roster" in result.results[5].detail
+    assert (result.created, result.duplicates, result.invalid) == (3, 1, 4)
+    # Reads + one INSERT + stats upsert + version bump, whatever the batch size
+    assert sum(s.lstrip().upper().startswith("INSERT INTO SUKIENTRANDAU") for s in statements) == 1
+    assert len(statements) <= 10
+
+    stored = crud.get_match_events(session=db, matran=match.matran)
+    assert {e.loaisukien for e in stored} == {"BanThang", "TheVang"}
+    incremental = _stats(db, muagiai)
+    crud.rebuild_player_stats(session=db, muagiai=muagiai)
+    assert incremental == _stats(db, muagiai)
+    assert (defender.macauthu, 0, 0, 2, 1, 0) in incremental
+    assert (assister.macauthu, 0, 1, 0, 0, 0) in incremental
+
+    # Resending the backlog is a no-op
+    version = crud.get_season_data_version(session=db, muagiai=muagiai)
+    again = crud.create_match_events_bulk(session=db, matran=match.matran, events_in=events[:3])
+    assert [item.status for item in again.results] == ["duplicate"] * 3
+    assert crud.get_season_data_version(session=db, muagiai=muagiai) == version
+
+
+def test_bulk_ingestion_atomic(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    scorer = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+
+    events = [
+        _event(loaisukien="BanThang", maclb="CLB01", macauthu=scorer.macauthu),
+        _event(loaisukien="NotAnEvent", maclb="CLB01", macauthu=scorer.macauthu),
+    ]
+    result = crud.create_match_events_bulk(
+        session=db, matran=match.matran, events_in=events, atomic=True
+    )
+    assert [item.status for item in result.results] == ["skipped", "invalid"]
+    assert result.created == 0
+    assert db.exec(select(SuKienTranDau).where(SuKienTranDau.matran == match.matran)).all() == []
@@ -0,0 +1,56 @@
+import pytest
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.hashing import HashingOverloadedError, PasswordHasher
+from app.core.security import make_crypt_context
+from app.models import TaiKhoan
+from tests.utils.utils import random_lower_string
+
+
+def test_process_pool_hasher_verifies_and_rehashes() -> None:
+    hasher = PasswordHasher(workers=1, max_pending=4, rounds=5)
+    try:
+        hashed = hasher.hash("s3cret")
+        assert hashed.startswith("$2b$05$")
+        assert hasher.verify_and_update("s3cret", hashed) == (True, None)
+        assert hasher.verify_and_update("wrong", hashed) == (False, None)
+
+        # A hash made with another cost is replaced on successful verify
+        matches, new_hash = hasher.verify_and_update("s3cret", make_crypt_context(4).hash("s3cret"))
+        assert matches
+        assert new_hash is not None and new_hash.startswith("$2b$05$")
+
+        # Unrecognized (e.g. plaintext) stored values never match
+        assert hasher.verify_and_update("s3cret", "s3cret") == (False, None)
+
+        stats = hasher.stats()
+        assert stats["completed"] == 5
+        assert stats["rehashed"] == 1
+        assert stats["pending"] == 0
+    finally:
+        hasher.shutdown()
+
+
+def test_hasher_rejects_when_queue_full() -> None:
+    hasher = PasswordHasher(workers=0, max_pending=0, rounds=4)
+    with pytest.raises(HashingOverloadedError):
+        hasher.hash("s3cret")
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_authenticate_rehashes_outdated_cost(db: Session) -> None:
+    user = TaiKhoan(
+        tendangnhap=f"user-{random_lower_string()[:12]}",
+        matkhau=make_crypt_context(4).hash("s3cret"),
+    )
+    db.add(user)
+    db.commit()
+
+    assert crud.authenticate(session=db, username=user.tendangnhap, password="wrong") is None
+    authenticated = crud.authenticate(session=db, username=user.tendangnhap, password="s3cret")
+    assert authenticated is not None
+    db.refresh(user)
+    assert user.matkhau.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert crud.authenticate(session=db, username=user.tendangnhap, password="s3cret") is not None
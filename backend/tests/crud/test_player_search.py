@@ -0,0 +1,117 @@
+from collections.abc import Callable, Generator
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func
+from sqlmodel import Session, text
+
+from app import crud
+from app.models import CauThu
+from tests.utils.utils import random_lower_string
+
+NAMES = {
+    "a": "Nguyễn Văn Quyết",
+    "b": "Quyết Tâm Hải",
+    "c": "Đỗ Hùng Dũng",
+    "d": "Nguyễn Quang Hải",
+    "e": "Bùi Tiến Dũng",
+    "f": "Lee 100%_Park",
+}
+
+
+@pytest.fixture(scope="module")
+def folded_search(db: Session) -> Generator[None, None, None]:
+    """Install what migration f3a8c1d9b6e2 adds on PostgreSQL (the tests
+    create tables from the models, not through Alembic)."""
+    if db.get_bind().dialect.name == "postgresql":
+        try:
+            db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            db.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent"))
+            db.execute(text(
+                "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text"
+                " LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+                " AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$"
+            ))
+            db.commit()
+        except Exception:
+            db.rollback()
+            pytest.skip("pg_trgm/unaccent extensions not available")
+    yield
+
+
+def _add_players(db: Session) -> str:
+    tag = random_lower_string()[:8]
+    db.add_all(CauThu(macauthu=f"S-{tag}-{key}", tencauthu=name) for key, name in NAMES.items())
+    db.commit()
+    return tag
+
+
+def _searcher(db: Session, tag: str) -> Callable[[str], list[str]]:
+    def search(q: str) -> list[str]:
+        found = crud.search_players(session=db, q=q, limit=50)
+        return [p.macauthu.rsplit("-", 1)[1] for p in found if p.macauthu.startswith(f"S-{tag}-")]
+
+    return search
+
+
+def test_search_is_accent_insensitive_and_ranked(
+    db: Session, folded_search: None  # noqa: ARG001
+) -> None:
+    _, folded, _ = crud._player_name_key(session=db)
+    assert folded
+
+    tag = _add_players(db)
+    search = _searcher(db, tag)
+
+    # Name prefix, then word prefix; ties go to the shorter name
+    assert search("quyet") == ["b", "a"]
+    assert search("QUYẾT") == ["b", "a"]
+    assert search("hai") == ["b", "d"]
+    assert search("dung") == ["c", "e"]
+    assert search("  do   hung ") == ["c"]
+    assert search("guyen") == ["a", "d"]
+    # LIKE wildcards in the term are literal
+    assert search("%") == ["f"]
+    assert search("0%_p") == ["f"]
+    assert search("   ") == []
+
+    players = crud.get_players(session=db, keyword="nguyen", limit=1000)
+    assert [p.tencauthu for p in players if p.macauthu.startswith(f"S-{tag}-")] == [
+        NAMES["a"], NAMES["d"]
+    ]
+
+
+def test_search_without_unaccent_falls_back_to_lower(db: Session) -> None:
+    # PostgreSQL before the migration: case-insensitive, accent-sensitive
+    tag = _add_players(db)
+    search = _searcher(db, tag)
+
+    fallback = (func.lower(CauThu.tencauthu), False, False)
+    with patch.object(crud, "_player_name_key", return_value=fallback):
+        assert search("QUYẾT") == ["b", "a"]
+        assert search("quyet") == []
+        assert search("0%_p") == ["f"]
+        players = crud.get_players(session=db, keyword="nguyễn", limit=1000)
+    assert [p.tencauthu for p in players if p.macauthu.startswith(f"S-{tag}-")] == [
+        NAMES["a"], NAMES["d"]
+    ]
+
+
+def test_extension_probe_is_cached(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("PostgreSQL only")
+
+    url = str(db.get_bind().url)
+    crud._PLAYER_TRIGRAM_SEARCH.pop(url, None)
+    with patch.object(db, "execute", wraps=db.execute) as execute:
+        crud._player_name_key(session=db)
+        crud._player_name_key(session=db)
+    # Found or not, one probe for many searches
+    assert execute.call_count == 1
+
+    installed, _ = crud._PLAYER_TRIGRAM_SEARCH[url]
+    with patch.object(crud, "_PLAYER_TRIGRAM_RETRY_SECONDS", 0), \
+            patch.object(db, "execute", wraps=db.execute) as execute:
+        crud._player_name_key(session=db)
+    # A missing extension is probed again once the retry delay has passed
+    assert execute.call_count == (0 if installed else 1)
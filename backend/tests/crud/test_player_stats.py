@@ -0,0 +1,216 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlmodel import Session, delete, select, update
+
+from app import crud
+from app.models import MuaGiai, SuKienTranDauUpdate, ThongKeCauThu
+from tests.utils.league import (
+    add_to_lineup,
+    create_event,
+    create_match,
+    create_random_player,
+    create_random_season,
+)
+
+COUNTERS = ("sotrandachoi", "banthang", "kientao", "thevang", "thevangthu2", "thedo", "mvp")
+
+
+def _table(db: Session, muagiai: str) -> list[tuple]:
+    rows = db.exec(select(ThongKeCauThu).where(ThongKeCauThu.muagiai == muagiai)).all()
+    snapshot = [
+        (row.macauthu, *(getattr(row, c) for c in COUNTERS)) for row in rows
+    ]
+    return sorted(r for r in snapshot if any(r[1:]))
+
+
+def _assert_matches_rebuild(db: Session, muagiai: str) -> list[tuple]:
+    incremental = _table(db, muagiai)
+    crud.rebuild_player_stats(session=db, muagiai=muagiai)
+    assert incremental == _table(db, muagiai)
+    return incremental
+
+
+def test_player_stats_incremental_updates(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    p1 = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    p2 = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=10)
+    p3 = create_random_player(db, muagiai=muagiai, maclb="CLB02", soaothidau=4)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    add_to_lineup(db, match=match, player=p1)
+
+    # First read builds the season table
+    crud.compute_player_stats(session=db, muagiai=muagiai)
+
+    add_to_lineup(db, match=match, player=p3)
+    goal = create_event(
+        db, match=match, player=p1, maclb="CLB01", loaisukien="BanThang",
+        cauthulienquan=p2.macauthu,
+    )
+    create_event(db, match=match, player=p3, maclb="CLB02", loaisukien="TheVang", phutthidau=20)
+    create_event(db, match=match, player=p3, maclb="CLB02", loaisukien="TheVang", phutthidau=60)
+    _assert_matches_rebuild(db, muagiai)
+
+    row = db.get(ThongKeCauThu, (muagiai, p3.macauthu))
+    assert row
+    assert (row.sotrandachoi, row.thevang, row.thevangthu2) == (1, 2, 1)
+
+    # Goal turned into a yellow card: assist disappears
+    db.refresh(goal)
+    crud.update_match_event(
+        session=db, db_event=goal, event_in=SuKienTranDauUpdate(loaisukien="TheVang")
+    )
+    _assert_matches_rebuild(db, muagiai)
+
+    crud.delete_match_event(session=db, masukien=goal.masukien)
+    crud.remove_player_from_lineup(session=db, matran=match.matran, macauthu=p1.macauthu)
+    _assert_matches_rebuild(db, muagiai)
+
+    crud.delete_match(session=db, matran=match.matran)
+    assert _assert_matches_rebuild(db, muagiai) == []
+
+
+def test_player_stats_read_from_table(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    scorer = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    assister = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=10)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    add_to_lineup(db, match=match, player=scorer)
+    create_event(
+        db, match=match, player=scorer, maclb="CLB01", loaisukien="BanThang",
+        cauthulienquan=assister.macauthu,
+    )
+
+    stats = crud.compute_player_stats(session=db, muagiai=muagiai)
+    assert stats.total_players == 2
+    top = stats.stats[0]
+    assert (top.macauthu, top.goals, top.matches_played, top.maclb) == (
+        scorer.macauthu, 1, 1, "CLB01"
+    )
+    assert stats.stats[1].assists == 1
+
+
+def _built_at(db: Session, muagiai: str) -> object:
+    return db.exec(select(MuaGiai.thongkecauthuluc).where(MuaGiai.muagiai == muagiai)).one()
+
+
+def test_player_stats_built_once_without_activity(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    assert _built_at(db, season.muagiai) is None
+
+    assert crud.compute_player_stats(session=db, muagiai=season.muagiai).stats == []
+    built_at = _built_at(db, season.muagiai)
+    assert built_at is not None
+    # No rows, but the season is marked as built: later reads do not rebuild
+    crud.compute_player_stats(session=db, muagiai=season.muagiai)
+    assert _built_at(db, season.muagiai) == built_at
+
+
+def test_concurrent_first_reads_build_player_stats_once(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("concurrent builds need PostgreSQL")
+
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    scorer = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    create_event(db, match=match, player=scorer, maclb="CLB01", loaisukien="BanThang")
+    # As after a migration that empties the table
+    db.exec(delete(ThongKeCauThu).where(ThongKeCauThu.muagiai == muagiai))
+    db.exec(update(MuaGiai).where(MuaGiai.muagiai == muagiai).values(thongkecauthuluc=None))
+    db.commit()
+
+    readers = 8
+    barrier = threading.Barrier(readers)
+
+    def read(_: int) -> list[str]:
+        with Session(db.get_bind()) as session:
+            barrier.wait()
+            awards = crud.compute_awards(session=session, muagiai=muagiai)
+            return [row.macauthu for row in awards.top_scorers]
+
+    with ThreadPoolExecutor(readers) as pool:
+        results = list(pool.map(read, range(readers)))
+    assert results == [[scorer.macauthu]] * readers
+
+
+def test_awards_and_discipline_include_ties(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    players = [
+        create_random_player(
+            db, muagiai=muagiai, maclb="CLB01", soaothidau=i + 1, tencauthu=f"Player {i}"
+        )
+        for i in range(3)
+    ]
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    crud.compute_awards(session=db, muagiai=muagiai)
+
+    # Player 0: 2 goals, players 1 and 2: 1 goal each (tied 2nd)
+    for minute, player in ((5, players[0]), (15, players[0]), (25, players[1]), (35, players[2])):
+        create_event(db, match=match, player=player, maclb="CLB01", loaisukien="BanThang", phutthidau=minute)
+    create_event(db, match=match, player=players[1], maclb="CLB01", loaisukien="TheDo", phutthidau=80)
+
+    awards = crud.compute_awards(session=db, muagiai=muagiai, limit=2)
+    assert [(r.tencauthu, r.value, r.rank) for r in awards.top_scorers] == [
+        ("Player 0", 2, 1),
+        ("Player 1", 1, 2),
+        ("Player 2", 1, 2),
+    ]
+    assert awards.top_assists == []
+
+    discipline = crud.compute_discipline(session=db, muagiai=muagiai, limit=1)
+    assert [(r.tencauthu, r.red_cards, r.discipline_points, r.rank) for r in discipline.leaderboard] == [
+        ("Player 1", 1, 3, 1)
+    ]
+
+
+def test_season_aggregate_single_pass() -> None:
+    aggregate = crud.SeasonAggregate()
+    aggregate.add_events([
+        ("M1", "P1", "CLB01", "BanThang", "P2"),
+        ("M1", "P1", "CLB01", "Ban Thang", None),
+        ("M1", "P3", "CLB02", "TheVang", None),
+        ("M1", "P3", "CLB02", "The Vang", None),
+        ("M2", "P3", "CLB02", "TheVang", None),
+        ("M2", "P3", "CLB02", "TheDo", None),
+        ("M2", "P1", "CLB01", "MVP", None),
+        ("M2", "P2", "CLB01", "Unknown", None),
+    ])
+    aggregate.apply_second_yellows()
+    counters = aggregate.counters()
+
+    assert (counters["P1"]["banthang"], counters["P1"]["mvp"]) == (2, 1)
+    assert counters["P2"]["kientao"] == 1
+    assert (counters["P3"]["thevang"], counters["P3"]["thevangthu2"], counters["P3"]["thedo"]) == (3, 1, 1)
+    assert aggregate.club_map() == {"P1": "CLB01", "P2": "CLB01", "P3": "CLB02"}
+
+    # Removing rows yields negative deltas
+    aggregate.add_events([("M1", "P1", "CLB01", "BanThang", "P2")], sign=-1)
+    assert (aggregate.counters()["P1"]["banthang"], aggregate.counters()["P2"]["kientao"]) == (1, 0)
+
+
+def test_mvp_read_from_table(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    star = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=7)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    add_to_lineup(db, match=match, player=star)
+    create_event(db, match=match, player=star, maclb="CLB01", loaisukien="BanThang")
+    create_event(db, match=match, player=star, maclb="CLB01", loaisukien="MVP", phutthidau=0)
+
+    mvp = crud.compute_mvp(session=db, muagiai=muagiai)
+    assert len(mvp.mvp_candidates) == 1
+    candidate = mvp.mvp_candidates[0]
+    assert (candidate.macauthu, candidate.man_of_match, candidate.goals, candidate.matches_played) == (
+        star.macauthu, 1, 1, 1
+    )
+
+    crud.delete_match_event(
+        session=db,
+        masukien=crud.get_match_events(session=db, matran=match.matran, loaisukien="MVP")[0].masukien,
+    )
+    assert crud.compute_mvp(session=db, muagiai=muagiai).mvp_candidates == []
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import (
+    DoiHinhXuatPhatCreate,
+    ScheduleGenerateRequest,
+    ScheduleValidateRequest,
+    SuKienTranDauCreate,
+)
+from tests.utils.league import add_to_lineup, create_random_player, create_random_season
+from tests.utils.query_plans import capture_selects, full_scans
+from tests.utils.utils import random_lower_string
+
+# Small lookup tables: a full scan is the right plan
+LOOKUP_TABLES = {"muagiai", "loaicauthu", "nhomnguoidung"}
+
+
+def test_crud_reads_use_indexes(db: Session) -> None:
+    season, clubs = create_random_season(db, num_clubs=14)
+    muagiai = season.muagiai
+    squads = {
+        club.maclb: [
+            create_random_player(db, muagiai=muagiai, maclb=club.maclb, soaothidau=number)
+            for number in range(1, 12)
+        ]
+        for club in clubs
+    }
+    crud.generate_round_robin_schedule(
+        session=db,
+        request_in=ScheduleGenerateRequest(
+            muagiai=muagiai,
+            ngaybatdau_lutdi=datetime(2024, 8, 10),
+            ngaybatdau_lutve=datetime(2025, 1, 11),
+        ),
+    )
+    matches = [
+        crud.get_match_by_id(session=db, matran=row["matran"])
+        for row in crud.get_matches(session=db, muagiai=muagiai, limit=7)
+    ]
+    for match in matches:
+        home = squads[match.maclbnha]
+        for player in home:
+            add_to_lineup(db, match=match, player=player)
+        crud.create_match_events_bulk(
+            session=db,
+            matran=match.matran,
+            events_in=[
+                SuKienTranDauCreate(
+                    masukien=f"E-{random_lower_string()[:16]}", loaisukien=kind,
+                    phutthidau=minute, maclb=match.maclbnha, macauthu=home[minute % 11].macauthu,
+                )
+                for minute, kind in ((12, "BanThang"), (40, "TheVang"), (77, "BanThang"))
+            ],
+        )
+    match = matches[0]
+    player = squads[match.maclbnha][0]
+    engine = db.get_bind()
+
+    with capture_selects(engine) as captured:
+        crud.get_clubs(session=db, muagiai=muagiai)
+        crud.get_club_by_id(session=db, maclb="CLB01", muagiai=muagiai)
+        crud.get_roster(session=db, maclb="CLB01", muagiai=muagiai)
+        crud.get_roster(session=db, macauthu=player.macauthu, muagiai=muagiai)
+        crud.get_roster_player(session=db, macauthu=player.macauthu, maclb=match.maclbnha, muagiai=muagiai)
+        crud.get_roster_by_shirt(session=db, maclb="CLB01", muagiai=muagiai, soaothidau=7)
+        crud.get_roster_detailed(session=db, maclb="CLB01", muagiai=muagiai)
+        crud.validate_shirt_number_unique(session=db, maclb="CLB01", muagiai=muagiai, soaothidau=40)
+        crud.validate_foreign_player_quota(session=db, maclb="CLB01", muagiai=muagiai, new_player_nationality=None)
+        crud.validate_roster_size(session=db, maclb="CLB01", muagiai=muagiai, min_players=None, max_players=None)
+        crud.validate_goalkeeper_count(session=db, maclb="CLB01", muagiai=muagiai, min_goalkeepers=None)
+        crud.get_player_club(db, player.macauthu, muagiai)
+        crud.get_matches(session=db, muagiai=muagiai)
+        crud.get_matches(session=db, muagiai=muagiai, vong=3)
+        crud.get_matches(session=db, muagiai=muagiai, maclb="CLB02")
+        crud.get_matches(session=db, muagiai=muagiai, after=(match.thoigianthidau, match.matran), limit=20)
+        crud.get_match_detail(session=db, matran=match.matran)
+        crud.get_match_events(session=db, matran=match.matran)
+        crud.get_match_events(session=db, matran=match.matran, loaisukien="BanThang")
+        crud.get_match_lineup(session=db, matran=match.matran)
+        crud.get_match_lineup_detailed(session=db, matran=match.matran, maclb=match.maclbnha)
+        crud.get_match_referees(session=db, matran=match.matran)
+        crud.get_match_stats(session=db, matran=match.matran)
+        crud.validate_match_event(session=db, event_in=SuKienTranDauCreate(
+            masukien="E-plan", loaisukien="TheVang", phutthidau=50,
+            matran=match.matran, maclb=match.maclbnha, macauthu=player.macauthu,
+        ))
+        crud.validate_lineup_addition(session=db, lineup_in=DoiHinhXuatPhatCreate(
+            matran=match.matran, macauthu=squads[match.maclbkhach][0].macauthu,
+        ))
+        crud.validate_schedule(session=db, request_in=ScheduleValidateRequest(muagiai=muagiai))
+        crud.compute_standings(session=db, muagiai=muagiai)
+        crud.compute_player_stats(session=db, muagiai=muagiai)
+        crud.compute_awards(session=db, muagiai=muagiai)
+        crud.compute_discipline(session=db, muagiai=muagiai)
+        crud.compute_mvp(session=db, muagiai=muagiai)
+
+    assert len(captured) > 30
+    scans = full_scans(engine, captured, allow=LOOKUP_TABLES)
+    assert not scans, "\n".join(map(str, scans))
@@ -0,0 +1,137 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, delete, update
+
+from app import crud
+from app.core.cache import LRUCacheBackend, ResponseCache
+from app.models import (
+    AwardsResponse,
+    BXHDoiBong,
+    LichThiDauUpdate,
+    MuaGiai,
+    StandingsResponse,
+    ThongKeCauThu,
+)
+from tests.utils.league import (
+    add_to_lineup,
+    create_event,
+    create_match,
+    create_random_player,
+    create_random_season,
+)
+
+
+def _version(db: Session, muagiai: str) -> int:
+    version = crud.get_season_data_version(session=db, muagiai=muagiai)
+    assert version is not None
+    return version
+
+
+def test_season_data_version_bumped_by_mutators(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    player = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    versions = [_version(db, muagiai)]
+
+    def assert_bumped() -> None:
+        versions.append(_version(db, muagiai))
+        assert versions[-1] > versions[-2]
+
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    assert_bumped()
+    crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso="1-0"))
+    assert_bumped()
+    create_event(db, match=match, player=player, maclb="CLB01", loaisukien="BanThang")
+    assert_bumped()
+    add_to_lineup(db, match=match, player=player)
+    assert_bumped()
+    crud.remove_player_from_roster(
+        session=db, macauthu=player.macauthu, maclb="CLB01", muagiai=muagiai
+    )
+    assert_bumped()
+
+    # Reads never bump (not even the lazy first build of the derived tables)
+    db.exec(delete(BXHDoiBong).where(BXHDoiBong.muagiai == muagiai))
+    db.exec(delete(ThongKeCauThu).where(ThongKeCauThu.muagiai == muagiai))
+    db.exec(update(MuaGiai).where(MuaGiai.muagiai == muagiai).values(thongkecauthuluc=None))
+    db.commit()
+    crud.compute_standings(session=db, muagiai=muagiai)
+    crud.compute_player_stats(session=db, muagiai=muagiai)
+    assert _version(db, muagiai) == versions[-1]
+
+    assert crud.get_season_data_version(session=db, muagiai="NO-SUCH-SEASON") is None
+
+
+def test_response_cache_invalidated_by_version(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    cache = ResponseCache(LRUCacheBackend(max_entries=16))
+    calls = []
+
+    def get() -> dict:
+        def compute() -> StandingsResponse:
+            calls.append(1)
+            return crud.compute_standings(session=db, muagiai=muagiai)
+
+        body = cache.get_or_compute(
+            "standings",
+            muagiai=muagiai,
+            version=crud.get_season_data_version(session=db, muagiai=muagiai),
+            model=StandingsResponse,
+            compute=compute,
+        )
+        return json.loads(body)
+
+    first = get()
+    assert get() == first
+    assert len(calls) == 1
+
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    crud.update_match(session=db, db_match=match, match_in=LichThiDauUpdate(tiso="2-1"))
+    updated = get()
+    assert len(calls) == 2
+    assert updated["standings"][0]["points"] == 3
+
+    stats = cache.stats()
+    assert stats["namespaces"]["standings"] == {
+        "hits": 1, "misses": 2, "not_modified": 0, "hit_ratio": 1 / 3
+    }
+
+
+def test_lru_backend_evicts_least_recently_used() -> None:
+    backend = LRUCacheBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    assert backend.get("a") == b"1"
+    backend.set("c", b"3")
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert len(backend) == 2
+
+
+def test_failed_compute_is_not_cached(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    cache = ResponseCache(LRUCacheBackend(max_entries=16))
+
+    def get() -> bytes:
+        return cache.get_or_compute(
+            "awards",
+            muagiai=muagiai,
+            version=crud.get_season_data_version(session=db, muagiai=muagiai),
+            model=AwardsResponse,
+            compute=lambda: crud.compute_awards(session=db, muagiai=muagiai),
+        )
+
+    # Errors reach the caller instead of an empty leaderboard being cached
+    with patch.object(crud, "_top_players_by_stat", side_effect=RuntimeError("database gone")):
+        with pytest.raises(RuntimeError):
+            get()
+    assert len(cache.backend) == 0
+
+    player = create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=9)
+    match = create_match(db, muagiai=muagiai, maclbnha="CLB01", maclbkhach="CLB02")
+    create_event(db, match=match, player=player, maclb="CLB01", loaisukien="BanThang")
+    assert json.loads(get())["top_scorers"][0]["macauthu"] == player.macauthu
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import ChiTietDoiBong, LoaiCauThu, RosterImportRow
+from tests.utils.league import create_random_player, create_random_season
+from tests.utils.queries import count_queries
+
+
+def test_import_roster_validates_rows_against_snapshot(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    muagiai = season.muagiai
+    season.socauthutoida = 6
+    season.tuoicauthutoithieu = 16
+    db.add(season)
+    db.add(LoaiCauThu(
+        maloaicauthu=f"NGOAI-{muagiai}", tenloaicauthu="Cầu thủ ngoại", socauthutoida=1,
+        muagiai=muagiai,
+    ))
+    db.commit()
+    create_random_player(db, muagiai=muagiai, maclb="CLB01", soaothidau=1)
+    elsewhere = create_random_player(db, muagiai=muagiai, maclb="CLB02", soaothidau=7)
+    free_agent = create_random_player(db, muagiai=muagiai, maclb="CLB02", soaothidau=8)
+    db.delete(db.get(ChiTietDoiBong, (free_agent.macauthu, "CLB02", muagiai)))
+    db.commit()
+
+    rows = [
+        RosterImportRow(macauthu=free_agent.macauthu, soaothidau=2),
+        RosterImportRow(tencauthu="Nguyen Van A", ngaysinh=datetime(2000, 1, 1), soaothidau=3),
+        RosterImportRow(tencauthu="Too Young", ngaysinh=datetime(2015, 1, 1), soaothidau=4),
+        RosterImportRow(tencauthu="Same Shirt", soaothidau=1),
+        RosterImportRow(tencauthu="Same Shirt In File", soaothidau=3),
+        RosterImportRow(macauthu=elsewhere.macauthu, soaothidau=5),
+        RosterImportRow(macauthu="NO-SUCH-PLAYER", soaothidau=5),
+        RosterImportRow(tencauthu="Foreign One", quoctich="brazil", soaothidau=9),
+        RosterImportRow(tencauthu="Foreign Two", quoctich="Japan", soaothidau=10),
+        RosterImportRow(tencauthu="No Shirt"),
+        RosterImportRow(tencauthu="Fifth", soaothidau=11),
+        RosterImportRow(tencauthu="Last", soaothidau=12),
+    ]
+
+    with count_queries(db.get_bind()) as statements:
+        result = crud.import_roster(
+            session=db, maclb="CLB01", muagiai=muagiai, rows=rows, atomic=False
+        )
+
+    assert [item.status for item in result.results] == [
+        "created", "created", "invalid", "invalid", "invalid", "invalid",
+        "invalid", "created", "invalid", "invalid", "created", "created",
+    ]
+    details = [item.detail or "" for item in result.results]
+    assert "below minimum" in details[2]
+    assert "Shirt number 1 already used" in details[3]
+    assert "Shirt number 3 already used" in details[4]
+    assert "already registered for CLB02" in details[5]
+    assert "not found" in details[6]
+    assert "Foreign player quota (1) exceeded" in details[8]
+    assert "required" in details[9]
+    assert (result.created, result.new_players, result.invalid) == (5, 4, 7)
+    # 5 snapshot reads + 2 INSERTs + version bump, whatever the squad size
+    assert len(statements) <= 8
+
+    roster = crud.get_roster_detailed(session=db, maclb="CLB01", muagiai=muagiai)
+    assert len(roster) == 6
+    assert {p.tencauthu for p in roster} >= {"Nguyen Van A", "Foreign One", "Fifth", "Last"}
+    assert {p.quoctich for p in roster if p.tencauthu == "Foreign One"} == {"Brazil"}
+
+    # Roster is full now (6/6)
+    again = crud.import_roster(
+        session=db, maclb="CLB01", muagiai=muagiai,
+        rows=[RosterImportRow(tencauthu="One Too Many", soaothidau=20)], atomic=False,
+    )
+    assert again.created == 0
+    assert "Roster size limit exceeded" in (again.results[0].detail or "")
+
+
+def test_import_roster_atomic_writes_nothing_on_error(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=1)
+    muagiai = season.muagiai
+    version = crud.get_season_data_version(session=db, muagiai=muagiai)
+
+    rows = [
+        RosterImportRow(tencauthu="Valid", soaothidau=1),
+        RosterImportRow(tencauthu="Bad Position", vitrithidau="XX", soaothidau=2),
+    ]
+    result = crud.import_roster(session=db, maclb="CLB01", muagiai=muagiai, rows=rows)
+    assert [item.status for item in result.results] == ["skipped", "invalid"]
+    assert result.created == 0
+    assert db.exec(select(ChiTietDoiBong).where(ChiTietDoiBong.muagiai == muagiai)).all() == []
+    assert crud.get_season_data_version(session=db, muagiai=muagiai) == version
+
+    result = crud.import_roster(session=db, maclb="CLB01", muagiai=muagiai, rows=rows[:1])
+    assert result.created == 1
+    assert crud.get_season_data_version(session=db, muagiai=muagiai) != version
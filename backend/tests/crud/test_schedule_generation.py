@@ -0,0 +1,161 @@
+from datetime import date, datetime, time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import (
+    LichThiDau,
+    SanVanDong,
+    ScheduleGenerateRequest,
+    ScheduleOptimizeOptions,
+    ScheduleSlot,
+    ScheduleValidateRequest,
+)
+from tests.utils.league import create_random_season
+from tests.utils.queries import count_queries
+
+
+def _request(muagiai: str, **fields: object) -> ScheduleGenerateRequest:
+    return ScheduleGenerateRequest(
+        muagiai=muagiai,
+        ngaybatdau_lutdi=datetime(2024, 8, 10),
+        ngaybatdau_lutve=datetime(2025, 1, 11),
+        **fields,
+    )
+
+
+def _matches(db: Session, muagiai: str) -> list[LichThiDau]:
+    return list(db.exec(select(LichThiDau).where(LichThiDau.muagiai == muagiai)).all())
+
+
+def test_generate_schedule_bulk_insert(db: Session) -> None:
+    season, clubs = create_random_season(db, num_clubs=14)
+    muagiai = season.muagiai
+    for club in clubs:
+        db.add(SanVanDong(masanvandong=f"SVD-{club.maclb}", muagiai=muagiai, tensanvandong="Stadium"))
+        club.masanvandong = f"SVD-{club.maclb}"
+        db.add(club)
+    db.commit()
+    version = crud.get_season_data_version(session=db, muagiai=muagiai)
+
+    preview = crud.generate_round_robin_schedule(session=db, request_in=_request(muagiai, dry_run=True))
+    assert preview.success
+    assert (preview.matches_created, len(preview.fixtures), preview.rounds_generated) == (0, 182, 26)
+    assert _matches(db, muagiai) == []
+    assert crud.get_season_data_version(session=db, muagiai=muagiai) == version
+
+    with count_queries(db.get_bind()) as statements:
+        result = crud.generate_round_robin_schedule(session=db, request_in=_request(muagiai))
+
+    assert result.success and result.matches_created == 182
+    # 4 reads + one INSERT + version bump (was ~1,000 queries)
+    assert sum(s.lstrip().upper().startswith("INSERT INTO LICHTHIDAU") for s in statements) == 1
+    assert len(statements) <= 6
+
+    stored = _matches(db, muagiai)
+    assert sorted((m.matran, m.thoigianthidau, m.masanvandong) for m in stored) == sorted(
+        (f.matran, f.thoigianthidau, f.masanvandong) for f in preview.fixtures
+    )
+    assert all(m.masanvandong == f"SVD-{m.maclbnha}" for m in stored)
+    validation = crud.validate_schedule(
+        session=db, request_in=ScheduleValidateRequest(muagiai=muagiai)
+    )
+    assert validation.is_valid, validation.errors
+    assert crud.get_season_data_version(session=db, muagiai=muagiai) != version
+
+    # Generating again reports every fixture and writes nothing
+    again = crud.generate_round_robin_schedule(session=db, request_in=_request(muagiai))
+    assert not again.success and again.matches_created == 0
+    assert len(again.errors) == 182
+    assert "already exists" in again.errors[0]
+
+
+def test_generate_schedule_reports_invalid_fixtures(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=3)
+    muagiai = season.muagiai
+
+    # Return leg starts after the season ends: only the first leg is created
+    result = crud.generate_round_robin_schedule(
+        session=db,
+        request_in=ScheduleGenerateRequest(
+            muagiai=muagiai,
+            ngaybatdau_lutdi=datetime(2024, 8, 10),
+            ngaybatdau_lutve=datetime(2025, 7, 1),
+        ),
+    )
+    assert result.warnings and "Odd number" in result.warnings[0]
+    assert result.matches_created == 3
+    assert len(result.errors) == 3
+    assert all("after season end date" in error for error in result.errors)
+    assert {m.vong for m in _matches(db, muagiai)} == {1, 2, 3}
+
+
+def test_optimized_schedule_honours_stadiums_and_rest(db: Session) -> None:
+    season, clubs = create_random_season(db, num_clubs=6)
+    muagiai = season.muagiai
+    # CLB01/CLB02 and CLB03/CLB04 share a ground
+    for stadium in ("SVD-A", "SVD-B", "SVD-C", "SVD-D"):
+        db.add(SanVanDong(masanvandong=stadium, muagiai=muagiai, tensanvandong=stadium))
+    for club, stadium in zip(clubs, ("SVD-A", "SVD-A", "SVD-B", "SVD-B", "SVD-C", "SVD-D"), strict=True):
+        club.masanvandong = stadium
+        db.add(club)
+    db.commit()
+
+    options = ScheduleOptimizeOptions(
+        # Saturday 18:00 / 20:00, Sunday 19:00
+        slots=[
+            ScheduleSlot(day_offset=0, kickoff=time(18)),
+            ScheduleSlot(day_offset=0, kickoff=time(20)),
+            ScheduleSlot(day_offset=1, kickoff=time(19)),
+        ],
+        min_rest_days=5,
+        stadium_unavailable={"SVD-C": [date(2024, 8, 17), date(2024, 8, 18)]},
+        time_budget_ms=30000,
+        max_iterations=3000,
+        seed=7,
+    )
+    optimize = crud._optimized_fixtures
+
+    def optimize_outside_transaction(**kwargs: Any) -> Any:
+        # The read transaction (and its pooled connection) is released first
+        assert not db.in_transaction()
+        return optimize(**kwargs)
+
+    with patch.object(crud, "_optimized_fixtures", side_effect=optimize_outside_transaction):
+        result = crud.generate_round_robin_schedule(
+            session=db, request_in=_request(muagiai, optimize=options)
+        )
+    assert result.success and result.matches_created == 30
+    report = result.optimization
+    assert report is not None and report.iterations <= 3000
+    assert report.baseline.stadium_clashes > 0
+    assert report.best.score < report.baseline.score
+    assert (report.best.stadium_clashes, report.best.stadium_unavailable, report.best.rest_violations) == (0, 0, 0)
+
+    stored = _matches(db, muagiai)
+    grounds = [(m.masanvandong, m.thoigianthidau.date()) for m in stored]
+    assert len(grounds) == len(set(grounds))
+    assert not any(g == ("SVD-C", date(2024, 8, 17)) for g in grounds)
+    assert {(m.thoigianthidau.weekday(), m.thoigianthidau.hour) for m in stored} <= {(5, 18), (5, 20), (6, 19)}
+    validation = crud.validate_schedule(
+        session=db, request_in=ScheduleValidateRequest(muagiai=muagiai)
+    )
+    assert validation.is_valid, validation.errors
+
+    # Same seed and iteration budget: same schedule
+    again = crud.generate_round_robin_schedule(
+        session=db, request_in=_request(muagiai, optimize=options, dry_run=True)
+    )
+    assert again.optimization is not None and again.optimization.best == report.best
+
+    # Fewer slots than matches per round
+    with pytest.raises(ValueError, match="kickoff slots"):
+        crud.generate_round_robin_schedule(
+            session=db,
+            request_in=_request(
+                muagiai, dry_run=True, optimize=ScheduleOptimizeOptions(slots=options.slots[:2])
+            ),
+        )
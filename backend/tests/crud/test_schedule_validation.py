@@ -0,0 +1,87 @@
+from datetime import datetime
+
+from sqlmodel import Session, select
+
+from app import crud
+from app.models import LichThiDau, ScheduleGenerateRequest, ScheduleValidateRequest
+from tests.utils.league import create_random_season
+from tests.utils.queries import count_queries
+
+
+def _validate(db: Session, muagiai: str):  # type: ignore[no-untyped-def]
+    return crud.validate_schedule(session=db, request_in=ScheduleValidateRequest(muagiai=muagiai))
+
+
+def test_validate_large_season_in_sql(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=40)
+    muagiai = season.muagiai
+    result = crud.generate_round_robin_schedule(
+        session=db,
+        request_in=ScheduleGenerateRequest(
+            muagiai=muagiai,
+            ngaybatdau_lutdi=datetime(2024, 8, 10),
+            ngaybatdau_lutve=datetime(2025, 1, 11),
+            interval_days=3,
+        ),
+    )
+    assert result.matches_created == 1560
+
+    with count_queries(db.get_bind()) as statements:
+        validation = _validate(db, muagiai)
+
+    # More than the old 1,000-row cap, checked completely
+    assert validation.is_valid, validation.errors[:5]
+    assert validation.stats == {
+        "total_matches": 1560,
+        "total_clubs": 40,
+        "expected_total_matches": 1560,
+        "rounds_detected": 78,
+    }
+    assert len(statements) <= 6
+
+
+def test_validate_reports_each_violation(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=4)
+    muagiai = season.muagiai
+    crud.generate_round_robin_schedule(
+        session=db,
+        request_in=ScheduleGenerateRequest(
+            muagiai=muagiai,
+            ngaybatdau_lutdi=datetime(2024, 8, 10),
+            ngaybatdau_lutve=datetime(2025, 1, 11),
+        ),
+    )
+    matches = {
+        (m.maclbnha, m.maclbkhach): m
+        for m in db.exec(select(LichThiDau).where(LichThiDau.muagiai == muagiai)).all()
+    }
+    # CLB01-CLB02: both matches at CLB01
+    flipped = matches[("CLB02", "CLB01")]
+    flipped.maclbnha, flipped.maclbkhach = "CLB01", "CLB02"
+    # CLB03-CLB04: one match missing
+    db.delete(matches[("CLB03", "CLB04")])
+    # Outside the season
+    late = matches[("CLB04", "CLB03")]
+    late.thoigianthidau = datetime(2025, 7, 1, 17)
+    # CLB01 plays twice in a round
+    doubled = matches[("CLB01", "CLB03")]
+    other = matches[("CLB04", "CLB01")]
+    doubled.vong = other.vong
+    db.commit()
+
+    validation = _validate(db, muagiai)
+    assert not validation.is_valid
+    assert validation.errors[:2] == [
+        "Club CLB03 has 5 matches, expected 6",
+        "Club CLB04 has 5 matches, expected 6",
+    ]
+    assert "Clubs CLB01 vs CLB02 don't have balanced home/away" in validation.errors
+    assert "Clubs CLB03 vs CLB04 have 1 matches, expected 2" in validation.errors
+    assert f"Club CLB01 plays 2 matches in round {other.vong}" in validation.errors
+    assert f"Match {late.matran} after season end" in validation.errors
+    assert validation.stats["total_matches"] == 11
+
+    empty, _ = create_random_season(db, num_clubs=2)
+    validation = _validate(db, empty.muagiai)
+    assert validation.errors == [f"No matches found for season {empty.muagiai}"]
+    assert validation.stats["expected_total_matches"] == 2
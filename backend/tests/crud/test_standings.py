@@ -0,0 +1,151 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session, delete, select
+
+from app import crud
+from app.models import BXHDoiBong, LichThiDauUpdate
+from tests.utils.league import create_match, create_random_season
+
+
+def _table(db: Session, muagiai: str) -> list[tuple]:
+    standings = crud.compute_standings(session=db, muagiai=muagiai)
+    return [
+        (r.position, r.maclb, r.matches_played, r.won, r.drawn, r.lost,
+         r.goals_for, r.goals_against, r.points, r.form)
+        for r in standings.standings
+    ]
+
+
+def _recomputed(db: Session, muagiai: str) -> list[tuple]:
+    standings = crud.compute_standings_from_matches(session=db, muagiai=muagiai)
+    return [
+        (r.position, r.maclb, r.matches_played, r.won, r.drawn, r.lost,
+         r.goals_for, r.goals_against, r.points, r.form)
+        for r in standings.standings
+    ]
+
+
+def test_standings_built_on_first_read(db: Session) -> None:
+    season, clubs = create_random_season(db)
+    create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso="2-1")
+    create_match(db, muagiai=season.muagiai, maclbnha="CLB03", maclbkhach="CLB04", tiso="0-0")
+
+    rows = _table(db, season.muagiai)
+    assert rows == _recomputed(db, season.muagiai)
+    assert rows[0][1] == "CLB01"
+    assert rows[0][8] == 3
+
+    stored = db.exec(select(BXHDoiBong).where(BXHDoiBong.muagiai == season.muagiai)).all()
+    assert len(stored) == len(clubs)
+
+
+def test_standings_incremental_updates(db: Session) -> None:
+    season, _ = create_random_season(db)
+    # Build the table while the season has no results
+    assert all(r[2] == 0 for r in _table(db, season.muagiai))
+
+    m1 = create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso="1-0", vong=1)
+    m2 = create_match(db, muagiai=season.muagiai, maclbnha="CLB02", maclbkhach="CLB03", vong=2)
+    assert _table(db, season.muagiai) == _recomputed(db, season.muagiai)
+
+    # Result entered later
+    crud.update_match(session=db, db_match=m2, match_in=LichThiDauUpdate(tiso="3-3"))
+    assert _table(db, season.muagiai) == _recomputed(db, season.muagiai)
+
+    # Result corrected
+    crud.update_match(session=db, db_match=m1, match_in=LichThiDauUpdate(tiso="0-2"))
+    rows = _table(db, season.muagiai)
+    assert rows == _recomputed(db, season.muagiai)
+    assert rows[0][1] == "CLB02"
+    assert rows[0][9] == "WD"
+
+    # Match deleted
+    crud.delete_match(session=db, matran=m1.matran)
+    assert _table(db, season.muagiai) == _recomputed(db, season.muagiai)
+
+
+def test_match_write_builds_standings_in_its_transaction(db: Session) -> None:
+    season, _ = create_random_season(db, num_clubs=2)
+    version = crud.get_season_data_version(session=db, muagiai=season.muagiai)
+    assert version is not None
+
+    # Table never built: the write builds it without a commit/bump of its own
+    create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso="2-0")
+    assert crud.get_season_data_version(session=db, muagiai=season.muagiai) == version + 1
+    row = db.get(BXHDoiBong, (season.muagiai, "CLB01"))
+    assert row
+    assert row.diem == 3
+
+
+def test_concurrent_first_reads_build_standings_once(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("concurrent builds need PostgreSQL")
+
+    season, clubs = create_random_season(db, num_clubs=6)
+    create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB02", tiso="1-0")
+    db.exec(delete(BXHDoiBong).where(BXHDoiBong.muagiai == season.muagiai))
+    db.commit()
+
+    readers = 8
+    barrier = threading.Barrier(readers)
+
+    def read(_: int) -> list[str]:
+        with Session(db.get_bind()) as session:
+            barrier.wait()
+            standings = crud.compute_standings(session=session, muagiai=season.muagiai)
+            return [row.maclb for row in standings.standings]
+
+    with ThreadPoolExecutor(readers) as pool:
+        results = list(pool.map(read, range(readers)))
+    assert all(len(result) == len(clubs) and result[0] == "CLB01" for result in results)
+
+
+def test_rebuild_standings(db: Session) -> None:
+    season, clubs = create_random_season(db, num_clubs=3)
+    create_match(db, muagiai=season.muagiai, maclbnha="CLB01", maclbkhach="CLB03", tiso="0-4")
+    _table(db, season.muagiai)
+
+    # Simulate drift (e.g. manual SQL edit)
+    row = db.get(BXHDoiBong, (season.muagiai, "CLB03"))
+    assert row
+    row.diem = 0
+    db.add(row)
+    db.commit()
+
+    standings = crud.rebuild_standings(session=db, muagiai=season.muagiai)
+    assert len(standings.standings) == len(clubs)
+    assert _table(db, season.muagiai) == _recomputed(db, season.muagiai)
+    assert _table(db, season.muagiai)[0][1] == "CLB03"
+
+
+def test_standings_sql_matches_python(db: Session) -> None:
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("compute_standings_sql requires PostgreSQL")
+
+    rng = random.Random(2024)
+    season, clubs = create_random_season(db, num_clubs=8)
+    kickoff = datetime(2024, 9, 1, 17)
+    scores: list[str | None] = [f"{rng.randint(0, 4)}-{rng.randint(0, 4)}" for _ in range(50)]
+    # Unplayed matches are skipped by both implementations
+    scores += [None, None, " 3 - 1 "]
+    for idx, tiso in enumerate(scores):
+        home, away = rng.sample(clubs, 2)
+        create_match(
+            db,
+            muagiai=season.muagiai,
+            maclbnha=home.maclb,
+            maclbkhach=away.maclb,
+            tiso=tiso,
+            thoigianthidau=kickoff + timedelta(hours=idx),
+        )
+
+    in_sql = crud.compute_standings_sql(session=db, muagiai=season.muagiai)
+    in_python = crud.compute_standings_from_matches(session=db, muagiai=season.muagiai)
+    assert [r.model_dump() for r in in_sql.standings] == [
+        r.model_dump() for r in in_python.standings
+    ]
+    assert len(in_sql.standings) == len(clubs)
@@ -0,0 +1,148 @@
+from collections import Counter
+
+import pytest
+from sqlmodel import Session, func, select
+
+from app import crud
+from app.models import (
+    CauThu,
+    ChiTietDoiBong,
+    DoiHinhXuatPhat,
+    LichThiDau,
+    MuaGiai,
+    ScheduleValidateRequest,
+    SuKienTranDau,
+    SuKienTranDauCreate,
+)
+from app.synthetic_data import generate_league, load_season
+from app.utils import is_foreign
+from tests.utils.utils import random_lower_string
+
+
+def test_generate_league_is_deterministic() -> None:
+    first = list(generate_league(seed=7, seasons=2, clubs=6))
+    second = list(generate_league(seed=7, seasons=2, clubs=6))
+    other = list(generate_league(seed=8, seasons=2, clubs=6))
+    assert [s.rows for s in first] == [s.rows for s in second]
+    assert [s.rows for s in first] != [s.rows for s in other]
+    # Squads carry over: the second season only adds the newcomers
+    assert 0 < first[1].count(CauThu) < first[0].count(CauThu)
+    assert first[1].count(ChiTietDoiBong) == first[0].count(ChiTietDoiBong) == 6 * 30
+
+
+def test_generated_season_shape() -> None:
+    [season] = generate_league(seed=1, clubs=7, played_ratio=0.5)
+    matches = season.rows[LichThiDau]
+    # Double round-robin (bye added for an odd club count): 7 * 6 matches over 14 rounds
+    assert len(matches) == 42
+    assert max(match["vong"] for match in matches) == 14
+    pairs = Counter((match["maclbnha"], match["maclbkhach"]) for match in matches)
+    assert set(pairs.values()) == {1} and len(pairs) == 42
+
+    played = [match for match in matches if match["tiso"] is not None]
+    assert len(played) == 21
+    goals = Counter(
+        (event["matran"], event["maclb"])
+        for event in season.rows[SuKienTranDau]
+        if event["loaisukien"] == "BanThang"
+    )
+    for match in played:
+        assert goals[(match["matran"], match["maclbnha"])] == match["banthangnha"]
+        assert goals[(match["matran"], match["maclbkhach"])] == match["banthangkhach"]
+
+    club_of = {row["macauthu"]: row["maclb"] for row in season.rows[ChiTietDoiBong]}
+    starters: Counter = Counter()
+    captains: Counter = Counter()
+    for row in season.rows[DoiHinhXuatPhat]:
+        team = (row["matran"], club_of[row["macauthu"]])
+        starters[team] += row["duocxuatphat"]
+        captains[team] += row["ladoitruong"]
+    assert set(starters.values()) == {11}
+    assert set(captains.values()) == {1}
+    assert len(starters) == 2 * len(played)
+
+
+def test_load_season(db: Session) -> None:
+    prefix = f"S{random_lower_string()[:6]}"
+    [season] = generate_league(seed=3, clubs=4, players_per_club=20, prefix=prefix)
+    load_season(session=db, season=season)
+
+    muagiai = season.muagiai
+    matches = db.exec(
+        select(func.count()).select_from(LichThiDau).where(LichThiDau.muagiai == muagiai)
+    ).one()
+    events = db.exec(
+        select(func.count())
+        .select_from(SuKienTranDau)
+        .join(LichThiDau, LichThiDau.matran == SuKienTranDau.matran)
+        .where(LichThiDau.muagiai == muagiai)
+    ).one()
+    assert matches == season.count(LichThiDau) == 12
+    assert events == season.count(SuKienTranDau)
+
+    standings = crud.compute_standings(session=db, muagiai=muagiai)
+    assert len(standings.standings) == 4
+    assert sum(row.matches_played for row in standings.standings) == 2 * matches
+    stats = crud.compute_player_stats(session=db, muagiai=muagiai)
+    total_goals = sum(
+        match["banthangnha"] + match["banthangkhach"] for match in season.rows[LichThiDau]
+    )
+    assert sum(row.goals for row in stats.stats) == total_goals
+
+
+def test_loaded_season_passes_validators(db: Session) -> None:
+    prefix = f"V{random_lower_string()[:6]}"
+    # Second season: carried-over players are a year older, newcomers mixed in
+    for season in generate_league(seed=5, seasons=2, clubs=4, players_per_club=22, prefix=prefix):
+        load_season(session=db, season=season)
+    muagiai = season.muagiai
+    regulations = db.get(MuaGiai, muagiai)
+    assert regulations is not None
+    players = {
+        player.macauthu: player
+        for player in db.exec(
+            select(CauThu)
+            .join(ChiTietDoiBong, ChiTietDoiBong.macauthu == CauThu.macauthu)
+            .where(ChiTietDoiBong.muagiai == muagiai)
+        ).all()
+    }
+    roster = season.rows[ChiTietDoiBong]
+    for maclb in {row["maclb"] for row in roster}:
+        assert crud.validate_roster_size(
+            session=db,
+            maclb=maclb,
+            muagiai=muagiai,
+            min_players=regulations.socauthutoithieu,
+            max_players=regulations.socauthutoida,
+        )["valid"]
+        assert crud.validate_goalkeeper_count(
+            session=db,
+            maclb=maclb,
+            muagiai=muagiai,
+            min_goalkeepers=regulations.sothumontoithieu,
+        )["valid"]
+        club_roster = [row for row in roster if row["maclb"] == maclb]
+        numbers = [row["soaothidau"] for row in club_roster]
+        assert len(set(numbers)) == len(numbers)
+        assert all(1 <= number <= 99 for number in numbers)
+        foreign = sum(is_foreign(players[row["macauthu"]].quoctich) for row in club_roster)
+        assert 1 <= foreign <= 4
+        if foreign == 4:
+            with pytest.raises(ValueError, match="quota"):
+                crud.validate_foreign_player_quota(
+                    session=db, maclb=maclb, muagiai=muagiai, new_player_nationality="Brazil"
+                )
+    for player in players.values():
+        crud.validate_player_age(
+            ngaysinh=player.ngaysinh,
+            season_start=regulations.ngaybatdau,
+            min_age=regulations.tuoicauthutoithieu,
+            max_age=regulations.tuoicauthutoida,
+        )
+
+    result = crud.validate_schedule(
+        session=db, request_in=ScheduleValidateRequest(muagiai=muagiai)
+    )
+    assert result.is_valid, result.errors
+    for event in season.rows[SuKienTranDau][:300]:
+        crud.validate_match_event(session=db, event_in=SuKienTranDauCreate(**event))
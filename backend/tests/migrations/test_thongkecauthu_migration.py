@@ -0,0 +1,93 @@
+import importlib.util
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, inspect
+from sqlmodel import Session, text
+
+BACKEND = Path(__file__).resolve().parents[2]
+INIT_DB_SQL = BACKEND.parent / "database" / "init_db.sql"
+MIGRATION = BACKEND / "app" / "alembic" / "versions" / "7c41d0e8b2f3_thongkecauthu_season_player_stats.py"
+
+
+def _migration() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("migration_7c41d0e8b2f3", MIGRATION)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _init_db_sql() -> str:
+    """The tables and the player stats triggers of database/init_db.sql"""
+    sql = INIT_DB_SQL.read_text(encoding="utf-8").lstrip("\ufeff")
+    schema = sql[: sql.index("-- >>> END schema.sql <<<")]
+    triggers = sql[
+        sql.index("CREATE OR REPLACE FUNCTION recompute_thongkecauthu"):
+        sql.index("select recompute_all_players();")
+    ]
+    return schema + triggers
+
+
+@pytest.fixture
+def init_db_schema(db: Session) -> Iterator[Connection]:
+    """A connection on a scratch schema built by init_db.sql, rolled back after the test"""
+    if db.get_bind().dialect.name != "postgresql":
+        pytest.skip("PostgreSQL only")
+    with db.get_bind().connect() as conn:
+        conn.execute(text("CREATE SCHEMA migration_test"))
+        conn.execute(text("SET LOCAL search_path TO migration_test"))
+        conn.connection.driver_connection.execute(_init_db_sql())
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+def _thkc_objects(conn: Connection) -> list[str]:
+    return list(conn.execute(text(
+        "SELECT tgname FROM pg_trigger WHERE tgname LIKE 'thkc_t_%'"
+        " UNION ALL SELECT proname FROM pg_proc"
+        " WHERE proname IN ('trg_su_kien_recompute', 'trg_doi_hinh_recompute',"
+        " 'recompute_thongkecauthu', 'recompute_all_players')"
+        " AND pronamespace = 'migration_test'::regnamespace"
+    )).scalars())
+
+
+def test_upgrade_from_init_db_drops_the_stats_triggers(init_db_schema: Connection) -> None:
+    conn = init_db_schema
+    assert len(_thkc_objects(conn)) == 10
+    migration = _migration()
+
+    with Operations.context(MigrationContext.configure(conn)):
+        migration.upgrade()
+
+    assert _thkc_objects(conn) == []
+    assert inspect(conn).get_pk_constraint("thongkecauthu")["constrained_columns"] == [
+        "muagiai", "macauthu"
+    ]
+    # Event and lineup writes no longer go through recompute_thongkecauthu()
+    conn.execute(text("INSERT INTO cauthu (macauthu) VALUES ('P1')"))
+    conn.execute(text("INSERT INTO lichthidau (matran) VALUES ('M1')"))
+    conn.execute(text(
+        "INSERT INTO sukientrandau (masukien, loaisukien, matran, macauthu)"
+        " VALUES ('E1', 'BanThang', 'M1', 'P1')"
+    ))
+    conn.execute(text("UPDATE sukientrandau SET phutthidau = 10"))
+    conn.execute(text("DELETE FROM sukientrandau"))
+    conn.execute(text(
+        "INSERT INTO doihinhxuatphat (matran, macauthu, duocxuatphat) VALUES ('M1', 'P1', TRUE)"
+    ))
+
+    with Operations.context(MigrationContext.configure(conn)):
+        migration.downgrade()
+
+    inspector = inspect(conn)
+    assert inspector.has_table("thongkecauthu")
+    assert inspector.get_pk_constraint("thongkecauthu")["constrained_columns"] == ["macauthu"]
+    columns = {c["name"] for c in inspector.get_columns("thongkecauthu")}
+    assert not columns & {"muagiai", "maclb", "capnhatluc"}
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import (
+    CauLacBo,
+    CauThu,
+    ChiTietDoiBong,
+    DoiHinhXuatPhat,
+    DoiHinhXuatPhatCreate,
+    LichThiDau,
+    LichThiDauCreate,
+    MuaGiai,
+    SuKienTranDau,
+    SuKienTranDauCreate,
+)
+from tests.utils.utils import random_lower_string
+
+
+def create_random_season(db: Session, *, num_clubs: int = 4) -> tuple[MuaGiai, list[CauLacBo]]:
+    """Create a season with `num_clubs` clubs (no matches)."""
+    muagiai = f"test-{random_lower_string()[:12]}"
+    season = MuaGiai(
+        muagiai=muagiai,
+        ngaybatdau=datetime(2024, 8, 1),
+        ngayketthuc=datetime(2025, 6, 30),
+    )
+    db.add(season)
+    db.flush()
+    clubs = [
+        CauLacBo(maclb=f"CLB{i:02d}", muagiai=muagiai, tenclb=f"Club {i:02d}")
+        for i in range(1, num_clubs + 1)
+    ]
+    db.add_all(clubs)
+    db.commit()
+    return season, clubs
+
+
+def create_match(
+    db: Session,
+    *,
+    muagiai: str,
+    maclbnha: str,
+    maclbkhach: str,
+    tiso: str | None = None,
+    vong: int = 1,
+    thoigianthidau: datetime | None = None,
+) -> LichThiDau:
+    match_in = LichThiDauCreate(
+        matran=f"M-{random_lower_string()[:16]}",
+        muagiai=muagiai,
+        vong=vong,
+        thoigianthidau=thoigianthidau or datetime(2024, 9, 1, 17) + timedelta(days=7 * vong),
+        maclbnha=maclbnha,
+        maclbkhach=maclbkhach,
+        tiso=tiso,
+    )
+    return crud.create_match(session=db, match_in=match_in)
+
+
+def create_random_player(
+    db: Session, *, muagiai: str, maclb: str, soaothidau: int, tencauthu: str | None = None
+) -> CauThu:
+    """Create a player registered in the club's roster for the season."""
+    player = CauThu(
+        macauthu=f"P-{random_lower_string()[:16]}",
+        tencauthu=tencauthu or f"Player {random_lower_string()[:8]}",
+    )
+    db.add(player)
+    db.flush()
+    db.add(
+        ChiTietDoiBong(
+            macauthu=player.macauthu, maclb=maclb, muagiai=muagiai, soaothidau=soaothidau
+        )
+    )
+    db.commit()
+    db.refresh(player)
+    return player
+
+
+def create_event(
+    db: Session,
+    *,
+    match: LichThiDau,
+    player: CauThu,
+    maclb: str,
+    loaisukien: str,
+    phutthidau: int = 10,
+    cauthulienquan: str | None = None,
+) -> SuKienTranDau:
+    event_in = SuKienTranDauCreate(
+        masukien=f"E-{random_lower_string()[:16]}",
+        loaisukien=loaisukien,
+        phutthidau=phutthidau,
+        cauthulienquan=cauthulienquan,
+        matran=match.matran,
+        maclb=maclb,
+        macauthu=player.macauthu,
+    )
+    return crud.create_match_event(session=db, event_in=event_in)
+
+
+def add_to_lineup(db: Session, *, match: LichThiDau, player: CauThu) -> DoiHinhXuatPhat:
+    lineup_in = DoiHinhXuatPhatCreate(matran=match.matran, macauthu=player.macauthu)
+    return crud.add_player_to_lineup(session=db, lineup_in=lineup_in)
@@ -0,0 +1,28 @@
+"""
+Statement counting for query-count regression tests.
+
+    with count_queries(db.get_bind()) as statements:
+        crud.import_roster(session=db, ...)
+    assert len(statements) <= 8
+"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    """Record the SQL of every statement run on `engine`"""
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
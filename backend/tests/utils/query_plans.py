@@ -0,0 +1,134 @@
+"""
+Query plan audit: EXPLAIN every SELECT a block of CRUD calls issued and
+report full table scans.
+
+    with capture_selects(engine) as captured:
+        crud.get_matches(session=db, muagiai=muagiai)
+        ...
+    assert full_scans(engine, captured, allow={"muagiai"}) == []
+
+- PostgreSQL: `EXPLAIN (FORMAT JSON)` with `enable_seqscan = off`, so the
+  plan does not depend on table size or statistics. Flagged: a "Seq Scan"
+  left in the plan, and index scans whose Index Cond does not constrain the
+  index's leading column (a full index walk, e.g. filtering the primary
+  key (macauthu, maclb, muagiai) on maclb)
+- SQLite: `EXPLAIN QUERY PLAN`; a "SCAN <table>" step (also a full index
+  scan, "SCAN t USING INDEX ...") reads the whole table. Scans of
+  subqueries and CTEs are not table scans and are ignored.
+"""
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+_ALIAS = re.compile(r"\b(\w+) AS (\w+)\b")
+_INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+
+@dataclass(frozen=True)
+class FullScan:
+    table: str
+    statement: str
+
+    def __str__(self) -> str:
+        return f"full scan of {self.table}: {' '.join(self.statement.split())[:300]}"
+
+
+@contextmanager
+def capture_selects(engine: Engine) -> Iterator[list[tuple[str, Any]]]:
+    """Record (statement, parameters) of every SELECT run on `engine`"""
+    captured: list[tuple[str, Any]] = []
+
+    def record(_conn, _cursor, statement, parameters, _context, executemany) -> None:  # type: ignore[no-untyped-def]
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")) and not executemany:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _pg_leading_column(connection: Any, index: str, cache: dict[str, tuple[str, str]]) -> tuple[str, str]:
+    if index not in cache:
+        cache[index] = tuple(connection.exec_driver_sql(
+            "SELECT t.relname, a.attname FROM pg_index i"
+            " JOIN pg_class c ON c.oid = i.indexrelid"
+            " JOIN pg_class t ON t.oid = i.indrelid"
+            " JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]"
+            " WHERE c.relname = %(index)s",
+            {"index": index},
+        ).one())
+    return cache[index]
+
+
+def _pg_full_scans(
+    connection: Any, plan: dict[str, Any], cache: dict[str, tuple[str, str]]
+) -> Iterator[str]:
+    node = plan.get("Node Type")
+    if node == "Seq Scan":
+        yield plan["Relation Name"]
+    elif node in _INDEX_SCANS:
+        table, leading = _pg_leading_column(connection, plan["Index Name"], cache)
+        if not re.search(rf"\b{leading}\b", plan.get("Index Cond", "")):
+            yield table
+    for child in plan.get("Plans", ()):
+        yield from _pg_full_scans(connection, child, cache)
+
+
+def _scanned_tables(
+    connection: Any, statement: str, parameters: Any, cache: dict[str, Any]
+) -> set[str]:
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        rows = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).all()
+        return set(_pg_full_scans(connection, rows[0][0][0]["Plan"], cache))
+
+    if "tables" not in cache:
+        cache["tables"] = set(inspect(connection).get_table_names())
+    aliases = {alias.lower(): table.lower() for table, alias in _ALIAS.findall(statement)}
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    scanned = set()
+    for *_, detail in rows:
+        if match := _SQLITE_SCAN.match(detail):
+            name = match.group(1).lower()
+            name = aliases.get(name, name)
+            if name in cache["tables"]:
+                scanned.add(name)
+    return scanned
+
+
+def full_scans(
+    engine: Engine,
+    captured: Iterable[tuple[str, Any]],
+    *,
+    allow: Iterable[str] = (),
+) -> list[FullScan]:
+    """
+    Full table scans in the plans of `captured` statements (deduplicated by
+    statement text), ignoring tables in `allow` (small lookup tables).
+    """
+    allowed = {table.lower() for table in allow}
+    seen: set[str] = set()
+    cache: dict[str, Any] = {}
+    found: list[FullScan] = []
+    with engine.connect() as connection:
+        for statement, parameters in captured:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            transaction = connection.begin()
+            try:
+                tables = _scanned_tables(connection, statement, parameters, cache)
+            finally:
+                transaction.rollback()
+            found += [
+                FullScan(table, statement) for table in sorted(tables - allowed)
+            ]
+    return found